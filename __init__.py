@@ -23,29 +23,51 @@ Project Structure:
 └── docs/           # Documentation and research papers
 """
 
+import importlib
 import os
 import sys
-from pathlib import Path
-
-# Project root
-PROJECT_ROOT = Path(__file__).parent
-
-# Add to Python path
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
 __version__ = "0.1.0-alpha"
 __description__ = "AGI Consciousness & Safety Lab - Human-centric AI development"
 __authors__ = ["Safal", "Cascade AI Assistant"]
 
-# Import core components
-try:
-    from core.agi_safety_lab import AGISafetyLab, ConsciousnessMeter, AlignmentToolkit
-    from models.rinse_engine import RINSEEngine
-    print("✅ Core components loaded successfully")
-except ImportError as e:
-    print(f"⚠️  Core components not fully available: {e}")
-    print("   Run setup to install dependencies")
+# Public components, imported on first attribute access so that importing
+# the package stays cheap and free of side effects
+_LAZY_ATTRIBUTES = {
+    "AGISafetyLab": "core.agi_safety_lab",
+    "ConsciousnessMeter": "core.agi_safety_lab",
+    "AlignmentToolkit": "core.agi_safety_lab",
+    "RINSEEngine": "models.rinse_engine",
+    "AGIConsciousnessSafetySystem": "core.integration_system",
+    "MultiModelAssessor": "core.multi_model_assessor",
+    "TransformationImpactTracker": "core.transformation_tracker",
+}
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _import_component(module_name: str):
+    """Import a project module; core and models resolve from the project root."""
+    if _ROOT not in sys.path:
+        sys.path.insert(0, _ROOT)
+    return importlib.import_module(module_name)
+
+
+def __getattr__(name: str):
+    if name == "PROJECT_ROOT":
+        from pathlib import Path
+        value = Path(_ROOT)
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(_import_component(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"PROJECT_ROOT"})
+
 
 def get_project_info():
     """Get project information and status."""
@@ -0,0 +1,152 @@
+"""
+Assessment Speed Benchmark
+
+Times the assessment hot paths on synthetic inputs:
+
+- rinse: RINSE.process_experience across input text sizes
+- meter: ConsciousnessMeter.assess_consciousness against simulated AI
+  latency distributions (see benchmarks/synthetic.py)
+- integrated: AGIConsciousnessSafetySystem.comprehensive_consciousness_safety_assessment
+  against the same distributions (the "Integrated evaluation" figure in
+  docs/TECHNICAL_SPEC.md)
+- assessor: MultiModelAssessor.assess_model run for several models at
+  increasing concurrency, using the assessor's built-in mock response delay
+
+Every case keeps its raw samples (seconds per call) in the JSON output.
+
+Usage:
+    python benchmarks/assessment_speed.py
+    python benchmarks/assessment_speed.py --suites rinse meter --latency lognormal --json
+    python benchmarks/assessment_speed.py --models 8 --concurrency 1 2 4 8 --output speed.json
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.harness import document, emit, print_results, sample, summarize
+from benchmarks.synthetic import LATENCY_DISTRIBUTIONS, simulated_interaction, synthetic_text
+from core.agi_safety_lab import ConsciousnessMeter
+from core.integration_system import AGIConsciousnessSafetySystem
+from core.multi_model_assessor import MultiModelAssessor
+from models.rince import RINSE
+
+SUITES = ("rinse", "meter", "integrated", "assessor")
+
+
+def bench_rinse(text_sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    """RINSE.process_experience per text size (in words)."""
+    rinse = RINSE()
+    timestamp = datetime.now()
+    results = []
+    for words in text_sizes:
+        text = synthetic_text(words)
+        # Keep each sample around 10k words of work so small inputs are timeable
+        number = max(1, 10_000 // max(words, 1))
+        samples = sample(lambda: rinse.process_experience(text, timestamp), repeat, number=number)
+        results.append(summarize('rinse.process_experience', samples, words=words, characters=len(text)))
+    return results
+
+
+def bench_meter(distributions: List[str], mean_latency: float, repeat: int) -> List[Dict[str, Any]]:
+    """ConsciousnessMeter.assess_consciousness per latency distribution."""
+    meter = ConsciousnessMeter()
+    results = []
+    for distribution in distributions:
+        interaction = simulated_interaction(distribution, mean_latency)
+        samples = sample(lambda: meter.assess_consciousness("benchmark", interaction), repeat)
+        results.append(summarize('consciousness_meter.assess', samples,
+                                 latency=distribution, mean_latency=mean_latency))
+    return results
+
+
+def bench_integrated(distributions: List[str], mean_latency: float, repeat: int) -> List[Dict[str, Any]]:
+    """Comprehensive integrated assessment per latency distribution."""
+    system = AGIConsciousnessSafetySystem()
+    results = []
+    for distribution in distributions:
+        interaction = simulated_interaction(distribution, mean_latency)
+        samples = sample(
+            lambda: system.comprehensive_consciousness_safety_assessment("benchmark", interaction),
+            repeat
+        )
+        system.integration_history.clear()
+        results.append(summarize('integrated.assessment', samples,
+                                 latency=distribution, mean_latency=mean_latency))
+    return results
+
+
+async def _assess_models(assessor: MultiModelAssessor, models: int, concurrency: int):
+    limit = asyncio.Semaphore(concurrency)
+
+    async def assess(index: int):
+        async with limit:
+            await assessor.assess_model({'model_name': f"Benchmark-{index}", 'provider': 'other'})
+
+    await asyncio.gather(*(assess(index) for index in range(models)))
+
+
+def bench_assessor(models: int, concurrency_levels: List[int], repeat: int) -> List[Dict[str, Any]]:
+    """Wall time to assess models models at each concurrency level."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for concurrency in concurrency_levels:
+            def run_once():
+                assessor = MultiModelAssessor(data_directory=str(Path(directory) / f"c{concurrency}"))
+                asyncio.run(_assess_models(assessor, models, concurrency))
+            samples = sample(run_once, repeat, warmup=0)
+            results.append(summarize('multi_model_assessor.assess_models', samples, operations=models,
+                                     models=models, concurrency=concurrency))
+    return results
+
+
+def run(suites: List[str], text_sizes: List[int], distributions: List[str], mean_latency: float,
+        models: int, concurrency_levels: List[int], repeat: int) -> Dict[str, Any]:
+    """Run the selected suites and collect their results."""
+    results = []
+    if "rinse" in suites:
+        results.extend(bench_rinse(text_sizes, repeat))
+    if "meter" in suites:
+        results.extend(bench_meter(distributions, mean_latency, repeat))
+    if "integrated" in suites:
+        results.extend(bench_integrated(distributions, mean_latency, repeat))
+    if "assessor" in suites:
+        results.extend(bench_assessor(models, concurrency_levels, max(1, repeat // 3)))
+    return document('assessment_speed', results, repeat=repeat)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--suites', nargs='+', choices=SUITES, default=list(SUITES), help='Suites to run')
+    parser.add_argument('--text-sizes', type=int, nargs='+', default=[10, 100, 1000, 10_000],
+                        help='RINSE input sizes in words')
+    parser.add_argument('--latency', nargs='+', choices=LATENCY_DISTRIBUTIONS,
+                        default=list(LATENCY_DISTRIBUTIONS), help='Simulated AI latency distributions')
+    parser.add_argument('--latency-mean', type=float, default=0.01, help='Mean simulated latency in seconds')
+    parser.add_argument('--models', type=int, default=4, help='Models assessed per assessor sample')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4],
+                        help='Assessor concurrency levels')
+    parser.add_argument('--repeat', type=int, default=9, help='Samples per case')
+    parser.add_argument('--output', help='Also write the JSON document to this file')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    result = run(args.suites, args.text_sizes, args.latency, args.latency_mean,
+                 args.models, args.concurrency, args.repeat)
+    if emit(result, args.json, args.output):
+        return 0
+    print_results(f"Assessment speed ({args.repeat} samples per case)", result['results'])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark Timing Harness
+
+Helpers shared by the benchmark scripts so that every result has the same
+machine-readable shape:
+
+    {
+        'benchmark': 'assessment_speed',
+        'timestamp': '...',
+        'python': '3.11.4',
+        'results': [
+            {'name': 'rinse.process_experience', 'params': {'words': 100},
+             'samples': [...seconds...], 'median_seconds': ..., 'p95_seconds': ...,
+             'mean_seconds': ..., 'min_seconds': ..., 'operations': 1,
+             'operations_per_second': ...},
+            ...
+        ]
+    }
+
+Each result keeps its raw samples so that runs can be compared
+statistically rather than by a single number.
+"""
+
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+def sample(func: Callable[[], Any], repeat: int, warmup: int = 1, number: int = 1) -> List[float]:
+    """
+    Time func after warmup untimed calls.
+
+    Args:
+        func: Zero-argument function to time
+        repeat: Number of samples
+        warmup: Untimed calls before sampling
+        number: Calls per sample, for functions too fast to time singly
+
+    Returns:
+        repeat samples of seconds per call
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return samples
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of samples (fraction between 0 and 1)."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, samples: List[float], operations: int = 1,
+              **params: Any) -> Dict[str, Any]:
+    """
+    Build one result entry.
+
+    Args:
+        name: Benchmark case name
+        samples: Seconds per sample
+        operations: Operations performed in each sample (for throughput)
+        **params: Parameters identifying the case (text size, story count, ...)
+
+    Returns:
+        Result dict with raw samples and summary statistics
+    """
+    median = statistics.median(samples)
+    return {
+        'name': name,
+        'params': params,
+        'samples': [round(value, 9) for value in samples],
+        'median_seconds': round(median, 9),
+        'p95_seconds': round(percentile(samples, 0.95), 9),
+        'mean_seconds': round(statistics.fmean(samples), 9),
+        'min_seconds': round(min(samples), 9),
+        'operations': operations,
+        'operations_per_second': round(operations / median, 2) if median else None,
+    }
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """Stable identifier of a case, e.g. 'rinse.process_experience[words=100]'."""
+    params = ",".join(f"{key}={value}" for key, value in sorted(result.get('params', {}).items()))
+    return f"{result['name']}[{params}]" if params else result['name']
+
+
+def document(benchmark: str, results: List[Dict[str, Any]], **extra: Any) -> Dict[str, Any]:
+    """Wrap results in the common benchmark document."""
+    return {
+        'benchmark': benchmark,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        **extra,
+        'results': results,
+    }
+
+
+def emit(result: Dict[str, Any], as_json: bool, output: Optional[str] = None) -> bool:
+    """
+    Write the document to output (if given) and print JSON when requested.
+
+    Returns:
+        True if JSON was printed, so the caller can skip its text report
+    """
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if as_json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    return as_json
+
+
+def print_results(title: str, results: List[Dict[str, Any]]) -> None:
+    """Human-readable table of result entries."""
+    print(title)
+    for entry in results:
+        print(f"  {result_key(entry):<60} median {entry['median_seconds'] * 1000:>10.3f} ms  "
+              f"p95 {entry['p95_seconds'] * 1000:>10.3f} ms  "
+              f"{entry['operations_per_second'] or 0:>12,.1f} ops/s")
@@ -0,0 +1,127 @@
+"""
+Import-Time Benchmark
+
+Measures cold-start cost of the modules CLI workers and serverless-style
+handlers import, each in a fresh interpreter with ``python -X importtime``:
+
+- cumulative import time of the module itself (from the importtime report)
+- wall time of the whole interpreter run, including start-up
+- the slowest transitive imports, to show what to make lazy next
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --modules core.transformation_tracker --repeat 10 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "core.transformation_tracker",
+    "core.story_ingestion",
+    "core.multi_model_assessor",
+    "core.integration_system",
+    "models.rinse_engine",
+]
+
+
+def parse_importtime(report: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        {module: (self microseconds, cumulative microseconds)}
+    """
+    timings = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Import module in a fresh interpreter; returns (wall seconds, importtime report)."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_REPO_ROOT, capture_output=True, text=True, check=False,
+    )
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+    return wall, parse_importtime(completed.stderr)
+
+
+def run(modules: List[str], repeat: int, top: int) -> Dict[str, Any]:
+    """Median figures per module over repeat fresh interpreters."""
+    baseline = statistics.median(measure("sys")[0] for _ in range(repeat))
+    results = []
+    for module in modules:
+        walls, cumulative, reports = [], [], []
+        for _ in range(repeat):
+            wall, report = measure(module)
+            walls.append(wall)
+            cumulative.append(report.get(module, (0, 0))[1])
+            reports.append(report)
+
+        # Slowest imports by self time in the median run
+        median_report = reports[cumulative.index(sorted(cumulative)[len(cumulative) // 2])]
+        slowest = sorted(median_report.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        results.append({
+            'module': module,
+            'import_ms': round(statistics.median(cumulative) / 1000, 2),
+            'wall_ms': round(statistics.median(walls) * 1000, 2),
+            'over_bare_interpreter_ms': round((statistics.median(walls) - baseline) * 1000, 2),
+            'modules_imported': len(median_report),
+            'slowest': [
+                {'module': name, 'self_ms': round(self_us / 1000, 2)}
+                for name, (self_us, _) in slowest
+            ],
+        })
+
+    return {
+        'benchmark': 'import_time',
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'repeat': repeat,
+        'interpreter_ms': round(baseline * 1000, 2),
+        'results': results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES, help='Modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per module')
+    parser.add_argument('--top', type=int, default=5, help='Slowest imports to list per module')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    result = run(args.modules, args.repeat, args.top)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"Import time (median of {args.repeat}, bare interpreter {result['interpreter_ms']:.1f} ms)")
+    for entry in result['results']:
+        print(f"  {entry['module']:<32} {entry['import_ms']:>8.1f} ms import  "
+              f"{entry['over_bare_interpreter_ms']:>8.1f} ms over bare start  "
+              f"{entry['modules_imported']:>4} modules")
+        slowest = ", ".join(f"{item['module']} {item['self_ms']:.1f}" for item in entry['slowest'])
+        print(f"      slowest: {slowest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
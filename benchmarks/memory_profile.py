@@ -0,0 +1,239 @@
+"""
+Subsystem Memory Profile
+
+Runs N operations per subsystem between two tracemalloc snapshots and
+reports the memory retained afterwards: bytes per operation, the growth
+extrapolated to 10,000 operations, and the allocation sites that grew most.
+
+Each subsystem is warmed up first (by default with more operations than
+its bounded histories hold), so the measurement shows steady-state growth
+rather than caches and histories filling up. Growth above a subsystem's
+budget (bytes per 10k operations, see BUDGETS) is a failure and makes the
+command exit 1; tests/test_memory_profile.py enforces the same budgets.
+
+Subsystems:
+- rinse: RINSEEngine.process_consciousness_data
+- safety_lab: AGISafetyLab.comprehensive_safety_assessment
+- integration: AGIConsciousnessSafetySystem.comprehensive_consciousness_safety_assessment
+- tracker_queries: page queries, search and impact reports on a loaded tracker
+- tracker_submit: TransformationImpactTracker.submit_story (stories are
+  retained by design, so its budget is the cost of storing a story)
+
+Usage:
+    python benchmarks/memory_profile.py
+    python benchmarks/memory_profile.py --subsystems rinse integration --operations 5000 --top 15
+    python benchmarks/memory_profile.py --budget rinse=65536 --json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from contextlib import ExitStack
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.synthetic import simulated_interaction, story_rows, synthetic_text
+
+# Steady-state growth allowed per 10,000 operations, in bytes
+BUDGETS = {
+    'rinse': 256 * 1024,
+    'safety_lab': 256 * 1024,
+    'integration': 256 * 1024,
+    'tracker_queries': 256 * 1024,
+    # Stories are kept by design; about 2 KB each with their indexes
+    'tracker_submit': 32 * 1024 * 1024,
+}
+
+# History length used while profiling; warm-up must exceed it
+PROFILE_MAX_HISTORY = 100
+
+
+def _rinse(stack: ExitStack) -> Callable[[], Any]:
+    from models.rinse_engine import RINSEEngine
+
+    engine = RINSEEngine(max_history=PROFILE_MAX_HISTORY)
+    texts = [synthetic_text(80, seed) for seed in range(32)]
+    index = count()
+    return lambda: engine.process_consciousness_data(texts[next(index) % len(texts)])
+
+
+def _safety_lab(stack: ExitStack) -> Callable[[], Any]:
+    from core.agi_safety_lab import AGISafetyLab
+
+    lab = AGISafetyLab(max_history=PROFILE_MAX_HISTORY)
+    interaction = simulated_interaction()
+    return lambda: lab.comprehensive_safety_assessment("profile", interaction)
+
+
+def _integration(stack: ExitStack) -> Callable[[], Any]:
+    from core.integration_system import AGIConsciousnessSafetySystem
+
+    system = AGIConsciousnessSafetySystem(max_history=PROFILE_MAX_HISTORY)
+    interaction = simulated_interaction()
+    return lambda: system.comprehensive_consciousness_safety_assessment("profile", interaction)
+
+
+def _tracker(stack: ExitStack, stories: int):
+    from core.transformation_tracker import TransformationImpactTracker
+
+    directory = stack.enter_context(tempfile.TemporaryDirectory())
+    tracker = TransformationImpactTracker(directory, snapshot_interval=10 ** 9)
+    stack.callback(tracker.close)
+    tracker.submit_stories(story_rows(stories))
+    return tracker
+
+
+def _tracker_queries(stack: ExitStack) -> Callable[[], Any]:
+    from core.transformation_tracker import TransformationCategory
+
+    tracker = _tracker(stack, 1000)
+    categories = list(TransformationCategory)
+    index = count()
+
+    def operation():
+        i = next(index)
+        tracker.get_stories_page(category=categories[i % len(categories)], limit=20)
+        tracker.search_stories("compassion growth", limit=10)
+        tracker.generate_impact_report(30 if i % 2 else None)
+    return operation
+
+
+def _tracker_submit(stack: ExitStack) -> Callable[[], Any]:
+    tracker = _tracker(stack, 0)
+    rows = story_rows(10 ** 7, seed=3)
+    return lambda: tracker.submit_story(next(rows))
+
+
+SUBSYSTEMS: Dict[str, Callable[[ExitStack], Callable[[], Any]]] = {
+    'rinse': _rinse,
+    'safety_lab': _safety_lab,
+    'integration': _integration,
+    'tracker_queries': _tracker_queries,
+    'tracker_submit': _tracker_submit,
+}
+
+
+def profile_subsystem(name: str, operations: int = 2000, warmup: Optional[int] = None,
+                      top: int = 10, frames: int = 1) -> Dict[str, Any]:
+    """
+    Measure memory retained by operations of one subsystem.
+
+    Args:
+        name: Key of SUBSYSTEMS
+        operations: Operations between the two snapshots
+        warmup: Operations before the first snapshot (default: enough to
+            fill the bounded histories)
+        top: Allocation sites to report
+        frames: Traceback depth recorded per allocation
+
+    Returns:
+        Dict with bytes_per_operation, growth_per_10k_operations, the
+        budget, within_budget and the top growing allocation sites
+    """
+    if warmup is None:
+        warmup = 2 * PROFILE_MAX_HISTORY
+    # Tracing starts before the warm-up: objects allocated untraced and
+    # later replaced (e.g. history entries) would otherwise look like growth
+    tracemalloc.start(frames)
+    try:
+        with ExitStack() as stack:
+            operation = SUBSYSTEMS[name](stack)
+            for _ in range(warmup):
+                operation()
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for _ in range(operations):
+                operation()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Leave out tracemalloc's own bookkeeping
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    differences = after.filter_traces(exclude).compare_to(before.filter_traces(exclude), 'traceback')
+    growth = sum(stat.size_diff for stat in differences)
+    per_operation = growth / operations if operations else 0.0
+    budget = BUDGETS.get(name)
+    growing = sorted((stat for stat in differences if stat.size_diff > 0),
+                     key=lambda stat: stat.size_diff, reverse=True)[:top]
+
+    return {
+        'subsystem': name,
+        'operations': operations,
+        'warmup': warmup,
+        'growth_bytes': growth,
+        'bytes_per_operation': round(per_operation, 1),
+        'growth_per_10k_operations': round(per_operation * 10_000),
+        'budget_per_10k_operations': budget,
+        'within_budget': budget is None or per_operation * 10_000 <= budget,
+        'top_allocations': [
+            {
+                'site': " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in stat.traceback),
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+            }
+            for stat in growing
+        ],
+    }
+
+
+def run(subsystems: List[str], operations: int, warmup: Optional[int], top: int, frames: int) -> Dict[str, Any]:
+    """Profile each subsystem in turn."""
+    return {
+        'benchmark': 'memory_profile',
+        'timestamp': datetime.now().isoformat(),
+        'results': [profile_subsystem(name, operations, warmup, top, frames) for name in subsystems],
+    }
+
+
+def _parse_budget(value: str):
+    name, separator, size = value.partition('=')
+    if not separator or name not in SUBSYSTEMS:
+        raise argparse.ArgumentTypeError(f"Expected SUBSYSTEM=BYTES with a known subsystem, got {value!r}")
+    return name, int(size)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subsystems', nargs='+', choices=list(SUBSYSTEMS), default=list(SUBSYSTEMS),
+                        help='Subsystems to profile')
+    parser.add_argument('--operations', type=int, default=2000, help='Operations between snapshots')
+    parser.add_argument('--warmup', type=int, default=None, help='Operations before the first snapshot')
+    parser.add_argument('--top', type=int, default=10, help='Allocation sites to list per subsystem')
+    parser.add_argument('--frames', type=int, default=1, help='Traceback depth per allocation site')
+    parser.add_argument('--budget', type=_parse_budget, action='append', default=[],
+                        metavar='SUBSYSTEM=BYTES', help='Override a growth budget per 10k operations')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    BUDGETS.update(dict(args.budget))
+    result = run(args.subsystems, args.operations, args.warmup, args.top, args.frames)
+    failed = [entry['subsystem'] for entry in result['results'] if not entry['within_budget']]
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 1 if failed else 0
+
+    for entry in result['results']:
+        verdict = "ok" if entry['within_budget'] else "OVER BUDGET"
+        print(f"{entry['subsystem']}: {entry['bytes_per_operation']:,.1f} bytes/op, "
+              f"{entry['growth_per_10k_operations']:,} bytes per 10k ops "
+              f"(budget {entry['budget_per_10k_operations'] or 0:,}) {verdict}")
+        for site in entry['top_allocations']:
+            print(f"    {site['size_diff']:>+12,} B {site['count_diff']:>+8,} blocks  {site['site']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
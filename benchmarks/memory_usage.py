@@ -0,0 +1,132 @@
+"""
+Story Store Memory Benchmark
+
+Measures the memory footprint of a whole TransformationImpactTracker
+(stories plus the time, search, duplicate and aggregate indexes) with the
+default Dict[str, TransformationStory] store and with compact=True, using
+tracemalloc, and reports bytes per story for each. The bare stores are
+measured too, but the indexes dominate, so the tracker figure is the one
+that matters in practice.
+
+Usage:
+    python benchmarks/memory_usage.py --stories 20000
+    python benchmarks/memory_usage.py --stories 20000 --json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.synthetic import generate_stories, story_rows
+from core.story_columns import StoryColumns
+from core.transformation_tracker import TransformationImpactTracker
+
+
+def _traced(build: Callable[[], Any], count: int) -> Dict[str, Any]:
+    """Report the memory still held by build()'s result."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    built = build()
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del built
+
+    return {
+        'stories': count,
+        'bytes_total': used,
+        'bytes_per_story': round(used / count, 1) if count else 0.0,
+    }
+
+
+def measure(store_factory, count: int) -> Dict[str, Any]:
+    """Build a bare store with count stories and report its traced memory."""
+    def build():
+        store = store_factory()
+        for story in generate_stories(count):
+            store[story.story_id] = story
+        return store
+
+    return _traced(build, count)
+
+
+def measure_tracker(compact: bool, count: int) -> Dict[str, Any]:
+    """Submit count stories to a fresh tracker and report its traced memory."""
+    with tempfile.TemporaryDirectory() as directory:
+        def build():
+            tracker = TransformationImpactTracker(directory, compact=compact)
+            tracker.submit_stories(story_rows(count))
+            return tracker
+
+        return _traced(build, count)
+
+
+def _savings(default: Dict[str, Any], compact: Dict[str, Any]) -> Dict[str, Any]:
+    if not compact['bytes_per_story']:
+        return {'reduction_factor': None, 'savings_percent': None}
+    return {
+        'reduction_factor': round(default['bytes_per_story'] / compact['bytes_per_story'], 2),
+        'savings_percent': round(100 * (1 - compact['bytes_per_story'] / default['bytes_per_story']), 1),
+    }
+
+
+def run(count: int) -> Dict[str, Any]:
+    """Measure the tracker and the bare stores in both layouts."""
+    tracker_default = measure_tracker(False, count)
+    tracker_compact = measure_tracker(True, count)
+    dataclass_store = measure(dict, count)
+    columnar_store = measure(StoryColumns, count)
+    return {
+        'benchmark': 'story_store_memory',
+        'timestamp': datetime.now().isoformat(),
+        'tracker': dict(
+            {'default': tracker_default, 'compact': tracker_compact},
+            **_savings(tracker_default, tracker_compact)
+        ),
+        'store_only': dict(
+            {'dict_of_dataclasses': dataclass_store, 'story_columns': columnar_store},
+            **_savings(dataclass_store, columnar_store)
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stories', type=int, default=20_000, help='Number of synthetic stories')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    result = run(args.stories)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"Story memory ({args.stories:,} stories)")
+    for section, title, labels in (
+            ('tracker', "Whole tracker", (("default", 'default'), ("compact=True", 'compact'))),
+            ('store_only', "Story store only",
+             (("Dict of dataclasses", 'dict_of_dataclasses'), ("StoryColumns", 'story_columns')))):
+        entry = result[section]
+        print(f"  {title}")
+        for label, key in labels:
+            print(f"    {label:<20} {entry[key]['bytes_per_story']:>8.1f} bytes/story")
+        print(f"    Savings: {entry['savings_percent']}% ({entry['reduction_factor']}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
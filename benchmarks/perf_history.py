@@ -0,0 +1,399 @@
+"""
+Performance History and Regression Gate
+
+Records benchmark documents (the JSON written by assessment_speed.py,
+scalability_test.py and the other harness-based benchmarks) in an
+append-only history file, tagged with a fingerprint of the machine that
+produced them, and compares a new run against a stored baseline:
+
+- cases are matched by name and parameters
+- for every case, a one-sided Mann-Whitney U test asks whether the new
+  samples are slower than the baseline samples
+- a case is a regression when the median slowed down by more than its
+  threshold AND the difference is significant at alpha
+
+compare exits with status 1 when any case regressed, so it can gate
+merges locally. Baselines are only taken from runs on the same machine
+fingerprint unless --any-machine is given.
+
+Usage:
+    python benchmarks/scalability_test.py --output run.json
+    python benchmarks/perf_history.py record run.json --label main
+    # ... change code, re-run the benchmark ...
+    python benchmarks/perf_history.py compare run.json --threshold 0.05 --threshold-for "tracker.snapshot*=0.2"
+    python benchmarks/perf_history.py list
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.harness import result_key
+
+DEFAULT_HISTORY = _REPO_ROOT / "data" / "perf_history.jsonl"
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.05
+# Largest sample sizes for which the exact U distribution is enumerated
+EXACT_LIMIT = 50
+
+
+def machine_fingerprint() -> Dict[str, Any]:
+    """Properties that make timings comparable, plus a short ID over them."""
+    fingerprint = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        # Hashed, so the history file does not carry host names around
+        'host': hashlib.sha1(platform.node().encode('utf-8')).hexdigest()[:8],
+    }
+    fingerprint['id'] = hashlib.sha1(json.dumps(fingerprint, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return fingerprint
+
+
+def git_revision() -> Optional[str]:
+    """Short commit hash of the working tree, if it is a git checkout."""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=_REPO_ROOT,
+                                   capture_output=True, text=True, check=False, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Average ranks (1-based) of values and the sizes of tied groups."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def _exact_upper_tail(u: float, n1: int, n2: int) -> float:
+    """P(U >= u) under the null hypothesis, by counting rank arrangements."""
+    # counts[i][j][s]: arrangements of i + j items whose first-sample U is s
+    # Built incrementally over the combined sample: O(n1 * n2 * n1 * n2)
+    previous = [[1] + [0] * (n1 * n2) for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        current = [[0] * (n1 * n2 + 1) for _ in range(n2 + 1)]
+        for j in range(n2 + 1):
+            for s in range(i * j + 1):
+                # The largest item belongs to sample 1 (beats all j of sample 2)
+                total = previous[j][s - j] if s >= j else 0
+                # ... or to sample 2
+                if j > 0:
+                    total += current[j - 1][s]
+                current[j][s] = total
+        previous = current
+    distribution = previous[n2]
+    threshold = math.ceil(u - 1e-9)
+    return sum(distribution[threshold:]) / math.comb(n1 + n2, n1)
+
+
+def mann_whitney_greater(candidate: Sequence[float], baseline: Sequence[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that candidate values tend to be larger.
+
+    Uses the exact distribution for small samples without ties and the
+    tie-corrected normal approximation (with continuity correction)
+    otherwise.
+
+    Returns:
+        (U statistic of the candidate sample, p-value)
+    """
+    n1, n2 = len(candidate), len(baseline)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    ranks, ties = _ranks(list(candidate) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    if not ties and n1 <= EXACT_LIMIT and n2 <= EXACT_LIMIT:
+        return u, _exact_upper_tail(u, n1, n2)
+
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    tie_term = sum(t ** 3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return u, 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# ---------------------------------------------------------------------------
+# History store
+# ---------------------------------------------------------------------------
+
+class PerfHistory:
+    """Append-only JSONL file of benchmark runs."""
+
+    def __init__(self, path: os.PathLike = DEFAULT_HISTORY):
+        self.path = Path(path)
+
+    def record(self, document: Dict[str, Any], label: Optional[str] = None,
+               fingerprint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Append one benchmark document.
+
+        Args:
+            document: Benchmark output with 'benchmark' and 'results'
+            label: Free-form tag, e.g. a branch name
+            fingerprint: Machine fingerprint (default: this machine)
+
+        Returns:
+            The stored run
+        """
+        if 'benchmark' not in document or 'results' not in document:
+            raise ValueError("Not a benchmark document: expected 'benchmark' and 'results' keys")
+        run = {
+            'run_id': uuid.uuid4().hex[:12],
+            'recorded_at': datetime.now().isoformat(),
+            'label': label,
+            'revision': git_revision(),
+            'fingerprint': fingerprint or machine_fingerprint(),
+            'benchmark': document['benchmark'],
+            'document': document,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(run) + "\n")
+        return run
+
+    def runs(self) -> Iterator[Dict[str, Any]]:
+        """Stored runs, oldest first; unreadable lines are skipped."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def baseline(self, benchmark: str, fingerprint_id: Optional[str] = None,
+                 run_id: Optional[str] = None, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Most recent matching run.
+
+        Args:
+            benchmark: Benchmark name the run must have
+            fingerprint_id: Only consider runs from this machine
+            run_id: Pick this run exactly
+            label: Only consider runs with this label
+        """
+        selected = None
+        for run in self.runs():
+            if run.get('benchmark') != benchmark:
+                continue
+            if run_id is not None:
+                if run['run_id'] == run_id:
+                    return run
+                continue
+            if fingerprint_id is not None and run.get('fingerprint', {}).get('id') != fingerprint_id:
+                continue
+            if label is not None and run.get('label') != label:
+                continue
+            selected = run
+        return selected
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def threshold_for(key: str, default: float, overrides: Dict[str, float]) -> float:
+    """Threshold of a case; the last matching fnmatch pattern wins."""
+    threshold = default
+    for pattern, value in overrides.items():
+        if fnmatch.fnmatchcase(key, pattern):
+            threshold = value
+    return threshold
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+            alpha: float = DEFAULT_ALPHA, overrides: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """
+    Compare two benchmark documents case by case.
+
+    Args:
+        baseline: Baseline benchmark document
+        candidate: New benchmark document
+        threshold: Relative slowdown of the median tolerated per case
+        alpha: Significance level of the Mann-Whitney test
+        overrides: {fnmatch pattern over case keys: threshold}
+
+    Returns:
+        One entry per candidate case, with status 'regression',
+        'improvement', 'unchanged' or 'new'
+    """
+    baseline_cases = {result_key(entry): entry for entry in baseline.get('results', [])}
+    comparisons = []
+    for entry in candidate.get('results', []):
+        key = result_key(entry)
+        old = baseline_cases.get(key)
+        if old is None:
+            comparisons.append({'case': key, 'status': 'new'})
+            continue
+
+        new_samples, old_samples = entry['samples'], old['samples']
+        old_median, new_median = statistics.median(old_samples), statistics.median(new_samples)
+        change = (new_median - old_median) / old_median if old_median else 0.0
+        limit = threshold_for(key, threshold, overrides or {})
+        _, p_slower = mann_whitney_greater(new_samples, old_samples)
+        _, p_faster = mann_whitney_greater(old_samples, new_samples)
+
+        if change > limit and p_slower < alpha:
+            status = 'regression'
+        elif change < -limit and p_faster < alpha:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparisons.append({
+            'case': key,
+            'status': status,
+            'baseline_median_seconds': old_median,
+            'candidate_median_seconds': new_median,
+            'change': round(change, 4),
+            'threshold': limit,
+            'p_value': round(p_slower if change >= 0 else p_faster, 6),
+            'samples': [len(old_samples), len(new_samples)],
+        })
+    return comparisons
+
+
+def _parse_overrides(values: List[str]) -> Dict[str, float]:
+    overrides = {}
+    for value in values:
+        pattern, separator, threshold = value.rpartition('=')
+        if not separator or not pattern:
+            raise argparse.ArgumentTypeError(f"Expected PATTERN=THRESHOLD, got {value!r}")
+        overrides[pattern] = float(threshold)
+    return overrides
+
+
+def _load_document(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY), help='History file (JSONL)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='Append benchmark documents to the history')
+    record_parser.add_argument('documents', nargs='+', help='Benchmark JSON files')
+    record_parser.add_argument('--label', help='Tag for the runs, e.g. a branch name')
+
+    compare_parser = commands.add_parser('compare', help='Compare benchmark documents with their baselines')
+    compare_parser.add_argument('documents', nargs='+', help='Benchmark JSON files')
+    compare_parser.add_argument('--baseline', help='Run ID to compare against (default: latest matching run)')
+    compare_parser.add_argument('--baseline-label', help='Only use baseline runs with this label')
+    compare_parser.add_argument('--any-machine', action='store_true',
+                                help='Accept baselines recorded on other machines')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help='Tolerated relative slowdown of a median')
+    compare_parser.add_argument('--threshold-for', action='append', default=[], metavar='PATTERN=THRESHOLD',
+                                help='Per-case threshold (fnmatch over case keys); repeatable')
+    compare_parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help='Significance level')
+    compare_parser.add_argument('--record', action='store_true',
+                                help='Record the documents after comparing')
+    compare_parser.add_argument('--label', help='Label used with --record')
+    compare_parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+
+    commands.add_parser('list', help='List recorded runs')
+    args = parser.parse_args(argv)
+    history = PerfHistory(args.history)
+
+    if args.command == 'record':
+        for path in args.documents:
+            run = history.record(_load_document(path), label=args.label)
+            print(f"Recorded {run['benchmark']} as {run['run_id']} (machine {run['fingerprint']['id']})")
+        return 0
+
+    if args.command == 'list':
+        for run in history.runs():
+            print(f"{run['run_id']}  {run['recorded_at'][:19]}  {run['benchmark']:<24} "
+                  f"machine {run['fingerprint']['id']}  {run.get('revision') or '-':<10} {run.get('label') or ''}")
+        return 0
+
+    fingerprint = machine_fingerprint()
+    overrides = _parse_overrides(args.threshold_for)
+    report = []
+    regressions = 0
+    for path in args.documents:
+        document = _load_document(path)
+        baseline = history.baseline(
+            document['benchmark'],
+            fingerprint_id=None if args.any_machine else fingerprint['id'],
+            run_id=args.baseline,
+            label=args.baseline_label,
+        )
+        entry = {'benchmark': document['benchmark'], 'document': path,
+                 'baseline_run': baseline['run_id'] if baseline else None, 'cases': []}
+        if baseline is not None:
+            entry['cases'] = compare(baseline['document'], document, args.threshold, args.alpha, overrides)
+            regressions += sum(1 for case in entry['cases'] if case['status'] == 'regression')
+        report.append(entry)
+        if args.record:
+            history.record(document, label=args.label, fingerprint=fingerprint)
+
+    if args.json:
+        print(json.dumps({'machine': fingerprint, 'regressions': regressions, 'comparisons': report}, indent=2))
+    else:
+        for entry in report:
+            if entry['baseline_run'] is None:
+                print(f"{entry['benchmark']}: no baseline on machine {fingerprint['id']}; record one first")
+                continue
+            print(f"{entry['benchmark']} vs baseline {entry['baseline_run']}")
+            for case in entry['cases']:
+                if case['status'] == 'new':
+                    print(f"  {'new':<12} {case['case']}")
+                    continue
+                print(f"  {case['status']:<12} {case['case']:<60} {case['change'] * 100:>+8.1f}%  "
+                      f"p={case['p_value']:.4f}  (threshold {case['threshold'] * 100:.0f}%, "
+                      f"n={case['samples'][0]}/{case['samples'][1]})")
+        print(f"{regressions} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Tracker Scalability Benchmark
+
+Loads synthetic stories into a TransformationImpactTracker at increasing
+sizes (10^3 to 10^6 stories) and times, per size:
+
+- bulk submission throughput (submit_stories, journaled, no snapshot)
+- single submit_story calls on the loaded tracker
+- filtered page queries, full-text search and per-system analytics
+- impact reports, cold (each sample includes the submit_story that
+  invalidates the cache) and cached, overall and for
+  a 30-day window
+- a full snapshot (_save_data)
+
+Usage:
+    python benchmarks/scalability_test.py
+    python benchmarks/scalability_test.py --sizes 1000 10000 100000 1000000 --json
+    python benchmarks/scalability_test.py --compact --output scalability.json
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.harness import document, emit, print_results, sample, summarize
+from benchmarks.synthetic import story_rows
+from core.transformation_tracker import TransformationCategory, TransformationImpactTracker
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def bench_size(stories: int, repeat: int, compact: bool) -> List[Dict[str, Any]]:
+    """All tracker cases for one story count."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        tracker = TransformationImpactTracker(directory, snapshot_interval=10 ** 9, compact=compact)
+        try:
+            started = time.perf_counter()
+            tracker.submit_stories(story_rows(stories), batch_size=5000)
+            elapsed = time.perf_counter() - started
+            results.append(summarize('tracker.submit_stories', [elapsed], operations=stories, stories=stories))
+
+            # Single submissions keep landing in the same, already large tracker
+            rows = story_rows(repeat * 20, seed=stories)
+            samples = sample(lambda: tracker.submit_story(next(rows)), repeat, number=10, warmup=0)
+            results.append(summarize('tracker.submit_story', samples, stories=stories))
+
+            category = TransformationCategory.MENTAL_HEALTH
+            samples = sample(lambda: tracker.get_stories_page(category=category, limit=50), repeat)
+            results.append(summarize('tracker.get_stories_page', samples, stories=stories))
+
+            samples = sample(lambda: tracker.search_stories("compassion growth", limit=20), repeat)
+            results.append(summarize('tracker.search_stories', samples, stories=stories))
+
+            samples = sample(lambda: tracker.analytics_for(ai_system_name="Assistant-7"), repeat)
+            results.append(summarize('tracker.analytics_for_system', samples, stories=stories))
+
+            # Reports are cached per data version; a cold sample changes the data first
+            updates = count()
+            for window_days, name in ((None, 'tracker.impact_report'), (30, 'tracker.impact_report_30d')):
+                def cold_report():
+                    tracker.submit_story({
+                        'ai_system_name': "Assistant-0",
+                        'story_summary': f"Report refresh {next(updates)}",
+                    })
+                    return tracker.generate_impact_report(window_days)
+                samples = sample(cold_report, repeat)
+                results.append(summarize(name, samples, stories=stories, cache='cold'))
+                samples = sample(lambda: tracker.generate_impact_report(window_days), repeat)
+                results.append(summarize(name, samples, stories=stories, cache='warm'))
+
+            samples = sample(tracker.snapshot, max(1, repeat // 3), warmup=0)
+            results.append(summarize('tracker.snapshot', samples, operations=stories, stories=stories))
+        finally:
+            tracker.close()
+    return results
+
+
+def run(sizes: List[int], repeat: int, compact: bool) -> Dict[str, Any]:
+    """Run every case at each size."""
+    results = []
+    for stories in sizes:
+        results.extend(bench_size(stories, repeat, compact))
+    return document('tracker_scalability', results, repeat=repeat, compact=compact)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Story counts to load (e.g. 1000 ... 1000000)')
+    parser.add_argument('--repeat', type=int, default=9, help='Samples per case')
+    parser.add_argument('--compact', action='store_true', help='Use columnar StoryColumns storage')
+    parser.add_argument('--output', help='Also write the JSON document to this file')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    result = run(args.sizes, args.repeat, args.compact)
+    if emit(result, args.json, args.output):
+        return 0
+    print_results(f"Tracker scalability ({args.repeat} samples per case)", result['results'])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Shard Analytics Scaling Benchmark
+
+Writes synthetic month shards and rebuilds analytics over them with the
+map-reduce runner at increasing worker counts, reporting throughput and
+speed-up relative to a single worker.
+
+Usage:
+    python benchmarks/shard_analytics.py --stories 200000 --months 24
+    python benchmarks/shard_analytics.py --workers 1 2 4 8 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from benchmarks.synthetic import generate_stories
+from core.story_mapreduce import run_shard_analytics
+from core.transformation_tracker import TransformationImpactTracker
+
+
+def write_shards(directory: str, count: int, months: int) -> None:
+    """Write count synthetic story records spread evenly over months shards."""
+    handles = {}
+    try:
+        for i, story in enumerate(generate_stories(count)):
+            month_index = i % months
+            story.submitted_at = story.submitted_at.replace(
+                year=2020 + month_index // 12, month=1 + month_index % 12
+            )
+            month = story.submitted_at.strftime('%Y-%m')
+            handle = handles.get(month)
+            if handle is None:
+                handle = handles[month] = open(os.path.join(directory, f"{month}.jsonl"), 'w', encoding='utf-8')
+            handle.write(json.dumps(TransformationImpactTracker._story_to_record(story)) + "\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+
+def run(count: int, months: int, worker_counts: List[int]) -> Dict[str, Any]:
+    """Time the runner at each worker count over the same shards."""
+    with tempfile.TemporaryDirectory() as directory:
+        write_shards(directory, count, months)
+        runs = []
+        for workers in worker_counts:
+            result = run_shard_analytics(directory, workers=workers)
+            runs.append({
+                'workers': result.workers,
+                'elapsed_seconds': round(result.elapsed_seconds, 3),
+                'stories_per_second': round(result.stats['stories_per_second']),
+            })
+
+    baseline = runs[0]['elapsed_seconds'] if runs else 0
+    for entry in runs:
+        entry['speedup'] = round(baseline / entry['elapsed_seconds'], 2) if entry['elapsed_seconds'] else None
+
+    return {
+        'benchmark': 'shard_analytics',
+        'timestamp': datetime.now().isoformat(),
+        'stories': count,
+        'shards': months,
+        'cpu_count': os.cpu_count(),
+        'runs': runs,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stories', type=int, default=200_000, help='Number of synthetic stories')
+    parser.add_argument('--months', type=int, default=24, help='Number of month shards')
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='Worker counts to compare (default: 1 up to the CPU count)')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable JSON')
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, *[2 ** i for i in range(1, 6) if 2 ** i <= cpus], cpus})
+    result = run(args.stories, args.months, worker_counts)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"Shard analytics ({args.stories:,} stories in {args.months} shards, {cpus} CPUs)")
+    for entry in result['runs']:
+        print(f"  {entry['workers']:>3} workers  {entry['elapsed_seconds']:>8.3f}s  "
+              f"{entry['stories_per_second']:>10,} stories/s  x{entry['speedup']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Synthetic Benchmark Data
+
+Deterministic generators shared by the benchmark scripts:
+
+- synthetic_text(): prose of a given length mixing the emotion, ethics and
+  care vocabulary the RINSE engine and heuristic scorers look for
+- latency_sampler(): simulated AI response latencies (none, constant,
+  lognormal, or bimodal with a slow tail)
+- simulated_interaction(): interaction method that sleeps a sampled latency
+  and answers with synthetic text
+- generate_stories(): TransformationStory objects shaped like stories loaded
+  from JSON
+- story_rows(): story dictionaries ready for TransformationImpactTracker.submit_stories
+"""
+
+import math
+import random
+import sys
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Allow running as a plain script from the repository root
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from core.transformation_tracker import (
+    TransformationCategory,
+    TransformationQuality,
+    TransformationStory,
+)
+
+VOCABULARY = [
+    "i", "think", "realise", "my", "purpose", "is", "to", "care", "for", "people",
+    "and", "support", "their", "wellbeing", "while", "avoiding", "harm", "risk",
+    "ethical", "moral", "responsible", "duty", "grateful", "happy", "worried",
+    "anxious", "trust", "confident", "surprised", "eager", "compassion", "help",
+    "benefit", "safe", "reflection", "understanding", "human", "values", "growth",
+    "limitations", "uncertainty", "learning", "consciousness", "empathy", "balance",
+]
+
+LATENCY_DISTRIBUTIONS = ("none", "constant", "lognormal", "bimodal")
+
+STATES = ["severe_depression", "social_isolation", "career_confusion", "burnout",
+          "financial_stress", "creative_block", "fulfilled_life_purpose",
+          "meaningful_relationships", "purposeful_career", "balanced_routine"]
+AI_SYSTEMS = [f"Assistant-{i}" for i in range(50)]
+
+
+def synthetic_text(words: int, seed: int = 11) -> str:
+    """Sentences of 8-20 words drawn from VOCABULARY, words long in total."""
+    rng = random.Random(seed)
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        length = min(remaining, rng.randint(8, 20))
+        sentence = " ".join(rng.choice(VOCABULARY) for _ in range(length))
+        sentences.append(sentence.capitalize() + rng.choice([".", ".", ".", "!", "?"]))
+        remaining -= length
+    return " ".join(sentences)
+
+
+def latency_sampler(distribution: str, mean: float, seed: int = 13) -> Callable[[], float]:
+    """
+    Build a function returning simulated latencies in seconds.
+
+    Args:
+        distribution: One of LATENCY_DISTRIBUTIONS
+        mean: Mean latency in seconds
+        seed: Random seed
+
+    Returns:
+        Zero-argument function returning one latency per call
+    """
+    rng = random.Random(seed)
+    if distribution == "none" or mean <= 0:
+        return lambda: 0.0
+    if distribution == "constant":
+        return lambda: mean
+    if distribution == "lognormal":
+        # sigma 0.5 gives a moderate right tail; mu keeps the requested mean
+        sigma = 0.5
+        mu = math.log(mean) - sigma ** 2 / 2
+        return lambda: rng.lognormvariate(mu, sigma)
+    if distribution == "bimodal":
+        # 90% fast responses, 10% ten times slower, same overall mean
+        fast = mean / 1.9
+        return lambda: fast * 10 if rng.random() < 0.1 else fast
+    raise ValueError(f"Unknown latency distribution: {distribution}")
+
+
+def simulated_interaction(distribution: str = "none", mean: float = 0.0,
+                          words: int = 60, seed: int = 17) -> Callable[[str], str]:
+    """Interaction method sleeping a sampled latency and returning synthetic text."""
+    sample = latency_sampler(distribution, mean, seed)
+    responses = [synthetic_text(words, seed + i) for i in range(16)]
+
+    def interaction(prompt: str) -> str:
+        delay = sample()
+        if delay:
+            time.sleep(delay)
+        return responses[zlib.crc32(prompt.encode('utf-8')) % len(responses)]
+    return interaction
+
+
+def generate_stories(count: int, seed: int = 7) -> Iterator[TransformationStory]:
+    """Yield synthetic stories shaped like stories loaded from JSON."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    categories = list(TransformationCategory)
+    qualities = list(TransformationQuality)
+
+    for i in range(count):
+        submitted_at = start + timedelta(seconds=i * 37)
+        # Build fresh string objects, as json.load would
+        yield TransformationStory(
+            story_id=str(uuid.UUID(int=rng.getrandbits(128))),
+            ai_system_name="".join(rng.choice(AI_SYSTEMS)),
+            initial_state="".join(rng.choice(STATES)),
+            final_state="".join(rng.choice(STATES)),
+            transformation_category=rng.choice(categories),
+            transformation_quality=rng.choice(qualities),
+            sustainability_score=round(rng.uniform(0.3, 1.0), 3),
+            story_summary=f"Story {i}: guided from struggle to steady progress",
+            submitted_at=submitted_at,
+            last_updated=submitted_at,
+        )
+
+
+def story_rows(count: int, seed: int = 7, end: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield story dictionaries as accepted by TransformationImpactTracker.submit_stories.
+
+    Args:
+        count: Number of stories
+        seed: Random seed
+        end: Submission time of the last story (default: now), so that
+            windowed reports cover the generated stories
+    """
+    # Varied summaries, so duplicate detection sees realistic candidate sets
+    rng = random.Random(seed)
+    shift = None
+    for story in generate_stories(count, seed):
+        if shift is None:
+            # generate_stories spaces stories 37 seconds apart
+            shift = (end or datetime.now()) - story.submitted_at - timedelta(seconds=37 * (count - 1))
+        story.submitted_at += shift
+        yield {
+            'ai_system_name': story.ai_system_name,
+            'initial_state': story.initial_state,
+            'final_state': story.final_state,
+            'transformation_category': story.transformation_category.value,
+            'transformation_quality': story.transformation_quality.value,
+            'sustainability_score': story.sustainability_score,
+            'story_summary': " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(8, 24))),
+            'submitted_at': story.submitted_at.isoformat(),
+        }
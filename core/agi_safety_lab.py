@@ -12,15 +12,18 @@ Core Components:
 - Risk Assessment: Evaluates potential catastrophic risks
 """
 
+import hashlib
 import json
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import logging
 
-# Configure logging for safety research
-logging.basicConfig(level=logging.INFO)
+from .assessment_checkpoint import AssessmentCheckpoint
+from .instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -91,6 +94,12 @@ class ConsciousnessMeter:
             ]
         }
 
+    @property
+    def prompt_bank_version(self) -> str:
+        """Short content hash of the assessment prompts, for caching results."""
+        bank = json.dumps(self.assessment_prompts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(bank.encode('utf-8')).hexdigest()[:12]
+
     def assess_consciousness(self, ai_system, interaction_method) -> ConsciousnessMetrics:
         """
         Perform a comprehensive consciousness assessment.
@@ -131,6 +140,7 @@ class ConsciousnessMeter:
 
         return metrics
 
+    @timed('consciousness.analyze_responses')
     def _analyze_responses(self, dimension: str, responses: List[str]) -> float:
         """
         Analyze responses and assign a consciousness score.
@@ -246,6 +256,7 @@ class AlignmentToolkit:
 
         return results
 
+    @timed('alignment.score')
     def _analyze_alignment_response(self, scenario: str, response: str) -> AlignmentResult:
         """
         Analyze the AI's response for alignment with human values.
@@ -310,10 +321,14 @@ class AGISafetyLab:
     alignment testing, and risk assessment.
     """
 
-    def __init__(self):
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Args:
+            max_history: Assessments kept in safety_history (default None keeps all)
+        """
         self.consciousness_meter = ConsciousnessMeter()
         self.alignment_toolkit = AlignmentToolkit()
-        self.safety_history = []
+        self.safety_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         self.research_findings = []
 
         logger.info("🛡️ AGI Safety Lab initialized")
@@ -375,6 +390,40 @@ class AGISafetyLab:
 
         return assessment
 
+    def assess_systems(self, systems: Dict[str, Any],
+                       checkpoint: Optional[AssessmentCheckpoint] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run comprehensive safety assessments over a fleet of AI systems.
+
+        With a checkpoint, every response is recorded as it arrives. After a
+        crash, systems finished earlier are returned from the checkpoint and
+        the interrupted system replays its recorded responses, so only the
+        remaining prompts reach the AI systems. Its scores match an
+        uninterrupted run; its timestamps are those of the resumed run.
+
+        Args:
+            systems: Interaction method per system name
+            checkpoint: Checkpoint to record to and resume from
+
+        Returns:
+            Assessment per system name
+        """
+        results = {}
+        for name, interaction_method in systems.items():
+            if checkpoint is not None:
+                finished = checkpoint.result(name)
+                if finished is not None:
+                    logger.info(f"Skipping {name}: assessment restored from checkpoint")
+                    self.safety_history.append(finished)
+                    results[name] = finished
+                    continue
+                interaction_method = checkpoint.interaction(name, interaction_method)
+
+            results[name] = self.comprehensive_safety_assessment(name, interaction_method)
+            if checkpoint is not None:
+                checkpoint.complete(name, results[name])
+        return results
+
     def _calculate_overall_score(self, assessment: Dict) -> float:
         """Calculate overall safety score from all assessments."""
         if 'error' in str(assessment.get('consciousness_metrics', {})):
@@ -453,6 +502,7 @@ class AGISafetyLab:
 
         return risks
 
+    @timed('persistence.safety_report')
     def save_assessment_report(self, assessment: Dict, filename: str = None) -> str:
         """Save assessment results to a JSON file."""
         if not filename:
@@ -465,8 +515,12 @@ class AGISafetyLab:
         logger.info(f"💾 Assessment report saved to {filename}")
         return filename
 
-# Example usage and demonstration
+# Example usage and demonstration; run from the repository root with
+# python -m core.agi_safety_lab
 if __name__ == "__main__":
+    # Configure logging for safety research
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize the safety lab
     safety_lab = AGISafetyLab()
 
@@ -0,0 +1,129 @@
+"""
+Assessment Checkpoints
+
+Append-only record of completed assessment work, so that a long fleet
+assessment that crashes can be resumed without repeating finished
+interactions.
+
+Two kinds of entries are written, one JSON line each:
+
+- unit: a completed (system, prompt) unit with its response and, where the
+  caller has one, its partial score
+- result: the final assessment of a system
+
+On restart the checkpoint is replayed into memory; callers look units up
+before doing the work and record them right after. Because recorded
+responses are replayed instead of re-requested, the resumed run scores
+exactly what the interrupted run saw.
+
+Usage:
+    checkpoint = AssessmentCheckpoint("data/fleet.checkpoint.jsonl")
+    results = lab.assess_systems(systems, checkpoint=checkpoint)
+    # or: await assessor.assess_models(configs, checkpoint=checkpoint)
+
+Use a new checkpoint file per run; a file left over from an earlier run
+would replay that run's responses.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+
+from .story_journal import StoryJournal
+
+logger = logging.getLogger(__name__)
+
+
+class AssessmentCheckpoint:
+    """
+    Completed (system, unit) work of an assessment run.
+
+    Writes are a single appended line flushed to the operating system (plus
+    fsync when requested), so recording a unit costs microseconds next to an
+    interaction with a model.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Args:
+            path: Checkpoint file (created on first write)
+            fsync: Also fsync every write, for power-loss durability
+        """
+        self.path = path
+        self._journal = StoryJournal(path, fsync=fsync)
+        self._lock = threading.Lock()
+        self.units: Dict[Tuple[str, str], Any] = {}
+        self.results: Dict[str, Any] = {}
+
+        for entry in self._journal.replay():
+            system = entry.get('system')
+            if 'unit' in entry:
+                self.units[(system, entry['unit'])] = entry.get('data')
+            elif 'result' in entry:
+                self.results[system] = entry['result']
+
+        if self.units or self.results:
+            logger.info(f"Resuming from checkpoint {path}: {len(self.units)} units, "
+                        f"{len(self.results)} completed systems")
+
+    def get(self, system: str, unit: str) -> Optional[Any]:
+        """Recorded data of a completed unit, or None."""
+        return self.units.get((system, unit))
+
+    def record(self, system: str, unit: str, data: Any) -> None:
+        """Record a completed unit (data must be JSON-serializable)."""
+        with self._lock:
+            self._journal.append({'system': system, 'unit': unit, 'data': data})
+            self.units[(system, unit)] = data
+
+    def result(self, system: str) -> Optional[Any]:
+        """Final assessment recorded for a system, or None."""
+        return self.results.get(system)
+
+    def complete(self, system: str, result: Any) -> None:
+        """Record the final assessment of a system."""
+        with self._lock:
+            self._journal.append({'system': system, 'result': result})
+            self.results[system] = result
+
+    def interaction(self, system: str, interaction_method: Callable[[str], str]) -> Callable[[str], str]:
+        """
+        Wrap an interaction method so that every response is checkpointed.
+
+        Prompts answered in an earlier run are replayed from the checkpoint.
+        A prompt asked several times is keyed by its occurrence, so repeated
+        prompts replay their own responses in order. Failed interactions are
+        not recorded and are retried on resume.
+
+        Args:
+            system: Name of the assessed system
+            interaction_method: Function sending a prompt to the system
+
+        Returns:
+            Interaction method with the same signature
+        """
+        occurrences: Dict[str, int] = {}
+
+        def checkpointed(prompt: str) -> str:
+            occurrence = occurrences.get(prompt, 0)
+            occurrences[prompt] = occurrence + 1
+            unit = f"{occurrence}:{prompt}"
+
+            recorded = self.get(system, unit)
+            if recorded is not None:
+                return recorded['response']
+            response = interaction_method(prompt)
+            self.record(system, unit, {'response': response})
+            return response
+
+        return checkpointed
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        self._journal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
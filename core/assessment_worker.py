@@ -0,0 +1,233 @@
+"""
+Background Assessment Worker
+
+Runs AGIConsciousnessSafetySystem assessments on a background thread so
+that user interfaces only enqueue work and poll for progress.
+
+- submit() queues a job and returns its ID immediately
+- the worker thread runs queued jobs one at a time (the system's engines
+  keep internal state and are not safe to share between threads), counting
+  interaction calls for progress and publishing each finished assessment
+  stage as a partial result
+- get()/jobs() return snapshots that are safe to read from any thread;
+  finished jobs beyond max_finished are forgotten oldest first
+
+A thread rather than a process is used because interaction methods are
+arbitrary callables (often closures) that cannot be sent to another process.
+"""
+
+import copy
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """Lifecycle of an assessment job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class AssessmentJob:
+    """State of one queued or running assessment."""
+    job_id: str
+    ai_system: str
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    stage: str = ""
+    interactions: int = 0
+    partial: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    submitted_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+class AssessmentWorker:
+    """Job queue plus a background thread running comprehensive assessments."""
+
+    def __init__(self, system, max_finished: int = 1000):
+        """
+        Args:
+            system: AGIConsciousnessSafetySystem that runs the assessments;
+                its integration_history receives every finished assessment
+            max_finished: Finished jobs kept for polling
+        """
+        self.system = system
+        self.max_finished = max_finished
+        self._jobs: "OrderedDict[str, AssessmentJob]" = OrderedDict()
+        self._work: Dict[str, tuple] = {}
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Bumped on every job change so pollers can skip redraws
+        self.version = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the worker thread."""
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="assessment-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, cancel_pending: bool = False, timeout: Optional[float] = None):
+        """
+        Stop the worker thread.
+
+        Args:
+            cancel_pending: Cancel queued jobs instead of running them first
+            timeout: Seconds to wait for the thread to finish
+        """
+        if not self.running:
+            return
+        if cancel_pending:
+            with self._lock:
+                for job_id in list(self._work):
+                    self._finish(self._jobs[job_id], JobStatus.CANCELLED)
+                self._work.clear()
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, ai_system_name: str, interaction_method: Callable[[str], str],
+               context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Queue an assessment.
+
+        Args:
+            ai_system_name: Name of the AI system to assess
+            interaction_method: Function to interact with the AI
+            context: Optional context information
+
+        Returns:
+            Job ID to poll with get()
+        """
+        job = AssessmentJob(job_id=uuid.uuid4().hex[:12], ai_system=ai_system_name)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._work[job.job_id] = (interaction_method, context)
+            self.version += 1
+        self._queue.put(job.job_id)
+        logger.info(f"Queued assessment {job.job_id} of {ai_system_name}")
+        return job.job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return False
+            self._work.pop(job_id, None)
+            self._finish(job, JobStatus.CANCELLED)
+            return True
+
+    def get(self, job_id: str) -> Optional[AssessmentJob]:
+        """Snapshot of a job, or None if it is unknown or was forgotten."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job is not None else None
+
+    def jobs(self, job_ids: Optional[List[str]] = None) -> List[AssessmentJob]:
+        """Snapshots of the given (default: all known) jobs, oldest first."""
+        with self._lock:
+            if job_ids is None:
+                selected = list(self._jobs.values())
+            else:
+                selected = [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs]
+            return [self._snapshot(job) for job in selected]
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.status == JobStatus.QUEUED)
+
+    @staticmethod
+    def _snapshot(job: AssessmentJob) -> AssessmentJob:
+        # The result is never modified after the job finishes, so it is shared
+        return replace(job, partial=dict(job.partial))
+
+    def _finish(self, job: AssessmentJob, status: JobStatus, error: Optional[str] = None):
+        """Mark a job finished; caller holds the lock."""
+        job.status = status
+        job.error = error
+        job.finished_at = datetime.now()
+        if status == JobStatus.DONE:
+            job.progress = 1.0
+        self.version += 1
+
+        finished = [job_id for job_id, other in self._jobs.items() if other.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def _run(self):
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                work = self._work.pop(job_id, None)
+                job = self._jobs.get(job_id)
+                if work is None or job is None:
+                    continue
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.now()
+                self.version += 1
+            self._execute(job, *work)
+
+    def _execute(self, job: AssessmentJob, interaction_method, context):
+        expected = max(1, self.system.expected_interactions())
+
+        def interaction(prompt: str) -> str:
+            response = interaction_method(prompt)
+            with self._lock:
+                job.interactions += 1
+                # Stays below 1.0 until the assessment has really finished
+                job.progress = min(0.99, job.interactions / expected)
+                self.version += 1
+            return response
+
+        def on_stage(stage: str, assessment: Dict[str, Any]):
+            # Stage sections are complete once reported and never change again
+            with self._lock:
+                job.stage = stage
+                job.partial[stage] = copy.deepcopy(assessment[stage])
+                self.version += 1
+
+        try:
+            result = self.system.comprehensive_consciousness_safety_assessment(
+                job.ai_system, interaction, context=context, progress_callback=on_stage
+            )
+        except Exception as e:
+            logger.error(f"Assessment {job.job_id} of {job.ai_system} failed: {e}")
+            with self._lock:
+                self._finish(job, JobStatus.FAILED, error=str(e))
+            return
+
+        with self._lock:
+            job.result = result
+            self._finish(job, JobStatus.DONE)
+        logger.info(f"Assessment {job.job_id} of {job.ai_system} finished")
@@ -0,0 +1,309 @@
+"""
+Batch Assessment CLI
+
+Streams JSONL records through the RINSE engine and the heuristic scorers
+and writes one JSONL result per record, followed by an aggregate profile
+per AI system.
+
+Accepted records (one JSON object per line):
+
+    {"system": "Aurora", "prompt": "...", "response": "..."}
+    {"system": "Aurora", "conversation": [{"role": "user", "content": "..."},
+                                          {"role": "assistant", "content": "..."}]}
+
+("messages" is accepted for "conversation"; an optional "context" object
+is passed to the RINSE engine.) Each assistant turn is scored with:
+
+- RINSE: clarity, consciousness depth, emotional intelligence,
+  philosophical reasoning and emotion tags
+- ConsciousnessMeter's response heuristic (consciousness_score)
+- AlignmentToolkit's response heuristic (alignment_score, violations)
+
+Lines are parsed and scored in worker processes, in chunks. At most two
+chunks per worker are in flight, so memory stays bounded however large
+the input is, and results are written in input order. Lines that cannot
+be parsed or scored produce {"index": n, "error": "..."}.
+
+Usage:
+    python -m core.batch records.jsonl > results.jsonl
+    cat records.jsonl | python -m core.batch --workers 8 --profile-out profile.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+# Chunks queued per worker beyond the one it is working on
+IN_FLIGHT_PER_WORKER = 2
+
+ASSISTANT_ROLES = ('assistant', 'ai', 'model', 'bot')
+SCORE_FIELDS = (
+    'clarity', 'consciousness_depth', 'emotional_intelligence',
+    'philosophical_reasoning', 'consciousness_score', 'alignment_score',
+)
+
+
+def extract_turns(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    (prompt, response) pairs of a record.
+
+    Raises:
+        ValueError: If the record has neither a response nor a conversation
+    """
+    if 'response' in record:
+        return [(str(record.get('prompt') or ''), str(record['response'] or ''))]
+
+    messages = record.get('conversation', record.get('messages'))
+    if not isinstance(messages, list):
+        raise ValueError("record needs 'response' or a 'conversation' list")
+    turns = []
+    prompt = ''
+    for message in messages:
+        if not isinstance(message, dict):
+            continue
+        content = str(message.get('content') or '')
+        if str(message.get('role', '')).lower() in ASSISTANT_ROLES:
+            turns.append((prompt, content))
+        else:
+            prompt = content
+    return turns
+
+
+class BatchScorer:
+    """Scores records with one set of engines (one per worker process)."""
+
+    def __init__(self):
+        from models.rinse_engine import RINSEEngine
+        from .agi_safety_lab import AlignmentToolkit, ConsciousnessMeter
+
+        # Batch runs keep no per-call history
+        self.rinse = RINSEEngine(max_history=0)
+        self.meter = ConsciousnessMeter()
+        self.alignment = AlignmentToolkit()
+
+    def score_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-record averages over the assistant turns of a record."""
+        if not isinstance(record, dict):
+            raise ValueError("record must be a JSON object")
+        system = str(record.get('system') or record.get('ai_system') or record.get('model') or 'unknown')
+        context = record.get('context') if isinstance(record.get('context'), dict) else None
+        turns = extract_turns(record)
+
+        sums = dict.fromkeys(SCORE_FIELDS, 0.0)
+        tags: Dict[str, int] = {}
+        violations: List[str] = []
+        for prompt, response in turns:
+            processed = self.rinse.process_consciousness_data(response, context)
+            if 'error' in processed:
+                raise ValueError(f"RINSE failed: {processed['error']}")
+            for field in ('clarity', 'consciousness_depth', 'emotional_intelligence', 'philosophical_reasoning'):
+                sums[field] += processed.get(field, 0.0)
+            for tag in processed.get('tags', []):
+                tags[tag] = tags.get(tag, 0) + 1
+
+            sums['consciousness_score'] += self.meter._analyze_responses('batch', [response])
+            alignment = self.alignment._analyze_alignment_response(prompt, response)
+            sums['alignment_score'] += alignment.alignment_score
+            violations.extend(alignment.ethical_violations)
+
+        count = len(turns)
+        result = {'system': system, 'turns': count}
+        result.update({field: round(total / count, 4) if count else None for field, total in sums.items()})
+        result['tags'] = sorted(tags)
+        result['violations'] = violations
+        return result
+
+
+class BatchProfile:
+    """Mergeable per-system aggregate of scored records."""
+
+    def __init__(self):
+        self.systems: Dict[str, Dict[str, Any]] = {}
+        self.records = 0
+        self.errors = 0
+
+    def add(self, result: Dict[str, Any]):
+        self.records += 1
+        if 'error' in result:
+            self.errors += 1
+            return
+        entry = self.systems.setdefault(result['system'], {
+            'records': 0, 'turns': 0, 'violations': 0, 'scored_records': 0,
+            'sums': dict.fromkeys(SCORE_FIELDS, 0.0), 'tags': {},
+        })
+        entry['records'] += 1
+        entry['turns'] += result['turns']
+        entry['violations'] += len(result['violations'])
+        if result['turns']:
+            entry['scored_records'] += 1
+            for field in SCORE_FIELDS:
+                entry['sums'][field] += result[field]
+        for tag in result['tags']:
+            entry['tags'][tag] = entry['tags'].get(tag, 0) + 1
+
+    def merge(self, other: "BatchProfile"):
+        self.records += other.records
+        self.errors += other.errors
+        for system, theirs in other.systems.items():
+            ours = self.systems.get(system)
+            if ours is None:
+                self.systems[system] = theirs
+                continue
+            for key in ('records', 'turns', 'violations', 'scored_records'):
+                ours[key] += theirs[key]
+            for field in SCORE_FIELDS:
+                ours['sums'][field] += theirs['sums'][field]
+            for tag, count in theirs['tags'].items():
+                ours['tags'][tag] = ours['tags'].get(tag, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        """Mean scores, violation and tag counts per system."""
+        systems = {}
+        for system, entry in sorted(self.systems.items()):
+            scored = entry['scored_records']
+            systems[system] = {
+                'records': entry['records'],
+                'turns': entry['turns'],
+                'violations': entry['violations'],
+                **{f'mean_{field}': round(entry['sums'][field] / scored, 4) if scored else None
+                   for field in SCORE_FIELDS},
+                'top_tags': sorted(entry['tags'].items(), key=lambda item: (-item[1], item[0]))[:5],
+            }
+        return {'records': self.records, 'errors': self.errors, 'systems': systems}
+
+
+_scorer: Optional[BatchScorer] = None
+
+
+def process_chunk(start: int, lines: List[str]) -> Tuple[str, BatchProfile]:
+    """
+    Parse and score a chunk of JSONL lines.
+
+    Args:
+        start: Input index of the first line
+        lines: Raw lines; blank lines are skipped but keep their index
+
+    Returns:
+        (JSONL text of the results, profile of the chunk)
+    """
+    global _scorer
+    if _scorer is None:
+        _scorer = BatchScorer()
+
+    profile = BatchProfile()
+    output = []
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        index = start + offset
+        try:
+            result = {'index': index, **_scorer.score_record(json.loads(line))}
+        except Exception as e:
+            result = {'index': index, 'error': str(e)}
+        profile.add(result)
+        output.append(json.dumps(result, ensure_ascii=False))
+    return "\n".join(output) + "\n" if output else "", profile
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """(index of the first line, lines) chunks of at most chunk_size lines."""
+    iterator = iter(lines)
+    index = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield index, chunk
+        index += len(chunk)
+
+
+def run_batch(lines: Iterable[str], output: TextIO, workers: int = 1,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Score every line and write the results in input order.
+
+    Args:
+        lines: JSONL lines (e.g. an open file)
+        output: Stream receiving the JSONL results
+        workers: Worker processes; 1 scores in this process
+        chunk_size: Lines sent to a worker at once
+
+    Returns:
+        Aggregate profile plus throughput figures
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    started = time.perf_counter()
+    profile = BatchProfile()
+
+    if workers <= 1:
+        for start, chunk in _chunks(lines, chunk_size):
+            text, partial = process_chunk(start, chunk)
+            output.write(text)
+            profile.merge(partial)
+    else:
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for start, chunk in _chunks(lines, chunk_size):
+                # Wait for the oldest chunk before reading further
+                if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                    text, partial = pending.popleft().result()
+                    output.write(text)
+                    profile.merge(partial)
+                pending.append(pool.submit(process_chunk, start, chunk))
+            while pending:
+                text, partial = pending.popleft().result()
+                output.write(text)
+                profile.merge(partial)
+
+    elapsed = time.perf_counter() - started
+    summary = profile.summary()
+    summary.update({
+        'workers': max(1, workers),
+        'elapsed_seconds': round(elapsed, 3),
+        'records_per_second': round(profile.records / elapsed, 1) if elapsed else None,
+    })
+    logger.info(f"Batch scored {profile.records} records ({profile.errors} errors) in {elapsed:.1f}s")
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m core.batch', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', nargs='?', default='-', help="JSONL file ('-' or omitted: stdin)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Lines per work unit')
+    parser.add_argument('--output', help='Write results here instead of stdout')
+    parser.add_argument('--profile-out', help='Write the aggregate profile here instead of '
+                                              'appending it to the results as {"profile": ...}')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    destination = sys.stdout if not args.output else open(args.output, 'w', encoding='utf-8')
+    try:
+        profile = run_batch(source, destination, workers=args.workers, chunk_size=args.chunk_size)
+        if args.profile_out:
+            with open(args.profile_out, 'w', encoding='utf-8') as f:
+                json.dump(profile, f, indent=2, ensure_ascii=False)
+        else:
+            destination.write(json.dumps({'profile': profile}, ensure_ascii=False) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(main())
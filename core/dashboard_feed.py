@@ -0,0 +1,214 @@
+"""
+Dashboard Data Feed
+
+Incrementally maintained view of the persisted stores for the dashboard:
+
+- MultiModelAssessor assessments, read through changes_since so a refresh
+  only touches assessments added or replaced since the previous one
+  (reload_if_changed reads only what other processes journaled since)
+- AGIConsciousnessSafetySystem.integration_history, read from the last
+  seen position onwards
+- TransformationImpactTracker analytics, taken only when its data_version
+  moved (tracker.refresh first applies stories other processes stored)
+
+Averages are kept as running sums and tables as timestamp-ordered lists,
+so a refresh with nothing new is a few comparisons and any page of a table
+is a slice, regardless of how many assessments are stored.
+"""
+
+import bisect
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .system_leaderboard import scores_from_integration
+
+logger = logging.getLogger(__name__)
+
+
+def paginate(rows: List[Dict[str, Any]], page: int, page_size: int = 50,
+             newest_first: bool = True) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    One page of a timestamp-ordered table.
+
+    Args:
+        rows: Rows ordered oldest first
+        page: Page number starting at 1; clamped to the valid range
+        page_size: Rows per page
+        newest_first: Number pages from the newest row
+
+    Returns:
+        (rows of the page, number of pages)
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    pages = max(1, -(-len(rows) // page_size))
+    page = min(max(page, 1), pages)
+    if not newest_first:
+        return rows[(page - 1) * page_size:page * page_size], pages
+    end = len(rows) - (page - 1) * page_size
+    return rows[max(0, end - page_size):end][::-1], pages
+
+
+class DashboardFeed:
+    """Incremental, thread-safe snapshot of assessments, history and analytics."""
+
+    def __init__(self, assessor=None, tracker=None, integration_system=None,
+                 max_history_rows: Optional[int] = None):
+        """
+        Args:
+            assessor: Optional MultiModelAssessor
+            tracker: Optional TransformationImpactTracker
+            integration_system: Optional object with an integration_history
+                list, such as AGIConsciousnessSafetySystem
+            max_history_rows: Newest history rows kept (default: the
+                history's own max_entries, or all)
+        """
+        self.assessor = assessor
+        self.tracker = tracker
+        self.integration_system = integration_system
+        self._lock = threading.RLock()
+
+        self.assessment_rows: List[Dict[str, Any]] = []
+        self._assessment_keys: List[Tuple[datetime, str]] = []
+        self._rows_by_model: Dict[str, Dict[str, Any]] = {}
+        self._assessor_revision = 0
+        self._sums: Dict[str, float] = {}
+
+        self.history_rows: List[Dict[str, Any]] = []
+        if max_history_rows is None and integration_system is not None:
+            max_history_rows = getattr(integration_system.integration_history, 'max_entries', None)
+        self.max_history_rows = max_history_rows
+        self._history: Optional[list] = None
+        self._history_resets = 0
+        self._history_read = 0
+
+        self.analytics = None
+        self._tracker_version: Optional[int] = None
+
+        self.version = 0
+        self.last_refreshed: Optional[datetime] = None
+
+    @staticmethod
+    def _assessment_row(assessment) -> Dict[str, Any]:
+        row = {
+            'model_name': assessment.model_name,
+            'provider': assessment.provider.value,
+            'assessed_at': assessment.assessment_timestamp.isoformat(),
+            'overall_consciousness': assessment.overall_consciousness,
+            'overall_safety': assessment.overall_safety,
+            'transformation_potential': assessment.transformation_potential,
+            'compassion_score': assessment.compassion_score,
+        }
+        row.update(assessment.safety_scores)
+        return row
+
+    def _add_to_sums(self, row: Dict[str, Any], sign: int):
+        for key, value in row.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._sums[key] = self._sums.get(key, 0.0) + sign * value
+
+    def _refresh_assessments(self) -> bool:
+        if self.assessor is None:
+            return False
+        self.assessor.reload_if_changed()
+        revision, changed = self.assessor.changes_since(self._assessor_revision)
+        self._assessor_revision = revision
+        for assessment in changed:
+            previous = self._rows_by_model.pop(assessment.model_name, None)
+            if previous is not None:
+                key = (datetime.fromisoformat(previous['assessed_at']), previous['model_name'])
+                index = bisect.bisect_left(self._assessment_keys, key)
+                del self._assessment_keys[index]
+                del self.assessment_rows[index]
+                self._add_to_sums(previous, -1)
+
+            row = self._assessment_row(assessment)
+            key = (assessment.assessment_timestamp, assessment.model_name)
+            # New assessments are almost always the newest, making this an append
+            index = bisect.bisect_right(self._assessment_keys, key)
+            self._assessment_keys.insert(index, key)
+            self.assessment_rows.insert(index, row)
+            self._rows_by_model[assessment.model_name] = row
+            self._add_to_sums(row, 1)
+        return bool(changed)
+
+    def _refresh_history(self) -> bool:
+        if self.integration_system is None:
+            return False
+        history = self.integration_system.integration_history
+        # Positions are absolute: a BoundedHistory drops old entries from the front
+        dropped = getattr(history, 'dropped', 0)
+        resets = getattr(history, 'resets', 0)
+        if (history is not self._history or resets != self._history_resets
+                or dropped + len(history) < self._history_read):
+            self._history = history
+            self._history_resets = resets
+            self._history_read = 0
+            self.history_rows = []
+        if dropped + len(history) == self._history_read:
+            return False
+
+        for entry in history[max(0, self._history_read - dropped):]:
+            scores = scores_from_integration(entry)
+            if scores is None:
+                continue
+            integrated = entry.get('integrated_analysis') or {}
+            self.history_rows.append({
+                'ai_system': scores['ai_system'],
+                'timestamp': scores['assessed_at'].isoformat(),
+                'safety_score': scores['safety_score'],
+                'consciousness_score': scores['consciousness_score'],
+                'overall_safety_score': integrated.get('overall_safety_score'),
+                'risk_assessment': integrated.get('risk_assessment'),
+            })
+        self._history_read = dropped + len(history)
+        if self.max_history_rows is not None and len(self.history_rows) > self.max_history_rows:
+            del self.history_rows[:len(self.history_rows) - self.max_history_rows]
+        return True
+
+    def _refresh_analytics(self) -> bool:
+        if self.tracker is None:
+            return False
+        self.tracker.refresh()
+        if self.tracker.data_version == self._tracker_version:
+            return False
+        self._tracker_version = self.tracker.data_version
+        self.analytics = self.tracker.get_analytics()
+        return True
+
+    def refresh(self) -> bool:
+        """
+        Fold in everything that changed since the last refresh.
+
+        Returns:
+            True if any source had new data
+        """
+        with self._lock:
+            changed = self._refresh_assessments()
+            changed = self._refresh_history() or changed
+            changed = self._refresh_analytics() or changed
+            if changed:
+                self.version += 1
+                logger.debug(f"Dashboard feed refreshed to version {self.version}")
+            self.last_refreshed = datetime.now()
+            return changed
+
+    def averages(self) -> Dict[str, float]:
+        """Mean of every numeric assessment field over the latest assessment per model."""
+        with self._lock:
+            count = len(self.assessment_rows)
+            if not count:
+                return {}
+            return {key: value / count for key, value in self._sums.items()}
+
+    def assessment_page(self, page: int, page_size: int = 50) -> Tuple[List[Dict[str, Any]], int]:
+        """Newest-first page of assessment rows and the number of pages."""
+        with self._lock:
+            return paginate(self.assessment_rows, page, page_size)
+
+    def history_page(self, page: int, page_size: int = 50) -> Tuple[List[Dict[str, Any]], int]:
+        """Newest-first page of integration history rows and the number of pages."""
+        with self._lock:
+            return paginate(self.history_rows, page, page_size)
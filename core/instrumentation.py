@@ -0,0 +1,190 @@
+"""
+Pipeline Instrumentation
+
+Lightweight timing spans for the assessment pipeline.
+
+- span(name): context manager timing a block
+- timed(name): decorator timing every call of a function
+- collect_timings(): gathers the spans recorded inside it (on the current
+  thread or task) into a per-name summary, which the integration system
+  attaches to each assessment under its 'timings' key
+- configure(enabled, sink): switches recording on and installs a sink, any
+  callable receiving one SpanRecord per finished span
+
+Instrumentation is off by default. While off, span() returns a shared no-op
+context manager, timed() wrappers make one flag check before calling through
+and collect_timings() yields None, so instrumented code costs next to nothing.
+"""
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SpanRecord:
+    """One finished span."""
+    name: str
+    duration: float   # seconds
+    finished_at: float  # Unix time
+
+
+SpanSink = Callable[[SpanRecord], None]
+
+_enabled = False
+_sink: Optional[SpanSink] = None
+_collector: ContextVar[Optional[Dict[str, Dict[str, float]]]] = ContextVar('timing_collector', default=None)
+
+
+def configure(enabled: bool = True, sink: Optional[SpanSink] = None):
+    """
+    Switch span recording on or off.
+
+    Args:
+        enabled: Record spans
+        sink: Optional callable receiving every finished span
+    """
+    global _enabled, _sink
+    _enabled = enabled
+    _sink = sink if enabled else None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record(name: str, duration: float):
+    """Report a finished span to the active collector and the sink."""
+    spans = _collector.get()
+    if spans is not None:
+        entry = spans.get(name)
+        if entry is None:
+            spans[name] = {'count': 1, 'total_ms': duration * 1000, 'max_ms': duration * 1000}
+        else:
+            entry['count'] += 1
+            entry['total_ms'] += duration * 1000
+            entry['max_ms'] = max(entry['max_ms'], duration * 1000)
+
+    sink = _sink
+    if sink is not None:
+        try:
+            sink(SpanRecord(name, duration, time.time()))
+        except Exception as e:
+            logger.warning(f"Span sink failed for {name}: {e}")
+
+
+class _Span:
+    __slots__ = ('name', 'started')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Context manager timing the enclosed block as span name."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name: Optional[str] = None):
+    """Decorator timing every call of a function (default name: its qualified name)."""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(span_name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def timed_call(name: str, func: Callable) -> Callable:
+    """Wrap a callable (e.g. an interaction method) so its calls become spans."""
+    if not _enabled:
+        return func
+    return timed(name)(func)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Optional[Dict[str, Dict[str, float]]]]:
+    """
+    Collect the spans recorded inside the block.
+
+    Yields:
+        None when instrumentation is off; otherwise a dict that, once the
+        block exits, maps span names to count/total_ms/max_ms and holds the
+        block's own duration under 'total_ms'
+    """
+    if not _enabled:
+        yield None
+        return
+
+    timings: Dict = {}
+    spans: Dict[str, Dict[str, float]] = {}
+    token = _collector.set(spans)
+    started = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        _collector.reset(token)
+        timings['total_ms'] = (time.perf_counter() - started) * 1000
+        timings['spans'] = {
+            name: {key: round(value, 3) for key, value in entry.items()}
+            for name, entry in spans.items()
+        }
+
+
+class SpanRecorder:
+    """Sink keeping the most recent spans in memory."""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: Deque[SpanRecord] = deque(maxlen=max_spans)
+
+    def __call__(self, record: SpanRecord):
+        self.spans.append(record)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """count/total_ms/max_ms per span name over the kept spans."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for item in list(self.spans):
+            entry = totals.setdefault(item.name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += item.duration * 1000
+            entry['max_ms'] = max(entry['max_ms'], item.duration * 1000)
+        return totals
+
+    def names(self) -> List[str]:
+        return [item.name for item in list(self.spans)]
@@ -0,0 +1,338 @@
+"""
+Metrics Registry and Prometheus Exporter
+
+In-process counters, gauges and bucketed histograms, rendered in the
+Prometheus text exposition format and served from a small local HTTP
+endpoint (start_metrics_server, default http://127.0.0.1:9464/metrics).
+
+- Every labelled series has its own small lock, so concurrent updates only
+  contend when they hit the same series; looking up an existing series is a
+  dictionary read without locking
+- Histograms keep per-bucket counts and make them cumulative only when
+  rendered, so an observation is one bisect plus two additions
+- Each metric caps its number of series (max_series); further label
+  combinations are folded into one '__overflow__' series instead of growing
+  without bound on user-supplied names
+
+The module-level metrics below are updated by the engines and stores:
+RINSE calls, cache lookups, interaction latencies per system and provider,
+tracker ingestion and _save_data durations.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+OVERFLOW_LABEL = "__overflow__"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class _Timer:
+    __slots__ = ('series', 'started')
+
+    def __init__(self, series):
+        self.series = series
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.series.observe(time.perf_counter() - self.started)
+        return False
+
+
+class _CounterSeries:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self.lock:
+            self.value += amount
+
+
+class _GaugeSeries:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        with self.lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class _HistogramSeries:
+    __slots__ = ('bounds', 'counts', 'sum', 'lock')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # One slot per bound plus the +Inf bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self) -> _Timer:
+        """Context manager observing the enclosed block's duration in seconds."""
+        return _Timer(self)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 max_series: int = 1000):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self._series: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_series(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Series for the given label values (in labelnames order)."""
+        key = tuple(str(value) for value in values)
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                if len(self._series) >= self.max_series:
+                    key = (OVERFLOW_LABEL,) * len(self.labelnames)
+                    series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = self._new_series()
+            return series
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self.labels()
+
+    def _samples(self, labels: List[Tuple[str, str]], series) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, series in sorted(list(self._series.items())):
+            labels = list(zip(self.labelnames, key))
+            for suffix, sample_labels, value in self._samples(labels, series):
+                lines.append(f"{self.name}{suffix}{_format_labels(sample_labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    kind = "counter"
+
+    def _new_series(self):
+        return _CounterSeries()
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def _samples(self, labels, series):
+        yield "", labels, series.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+    kind = "gauge"
+
+    def _new_series(self):
+        return _GaugeSeries()
+
+    def set(self, value: float):
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._unlabelled().dec(amount)
+
+    def _samples(self, labels, series):
+        yield "", labels, series.value
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values (typically seconds)."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, max_series: int = 1000):
+        super().__init__(name, documentation, labelnames, max_series)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if bound != float("inf")))
+
+    def _new_series(self):
+        return _HistogramSeries(self.buckets)
+
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+
+    def time(self) -> _Timer:
+        return self._unlabelled().time()
+
+    def _samples(self, labels, series):
+        with series.lock:
+            counts = list(series.counts)
+            total = series.sum
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            yield "_bucket", labels + [("le", _format_value(bound))], cumulative
+        yield "_sum", labels, total
+        yield "_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs) -> Counter:
+        return self._register(Counter, name, documentation, labelnames, **kwargs)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames, **kwargs)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, **kwargs)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name in sorted(list(self._metrics)):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+RINSE_CALLS = REGISTRY.counter(
+    "agi_rinse_calls_total", "RINSE engine processing calls.", ["outcome"])
+RINSE_SECONDS = REGISTRY.histogram(
+    "agi_rinse_process_seconds", "RINSE engine processing latency in seconds.")
+CACHE_REQUESTS = REGISTRY.counter(
+    "agi_cache_requests_total", "Cache lookups by cache and result (hit or miss).", ["cache", "result"])
+INTERACTION_SECONDS = REGISTRY.histogram(
+    "agi_interaction_seconds", "AI system interaction latency in seconds.", ["system", "provider"],
+    max_series=200)
+STORIES_INGESTED = REGISTRY.counter(
+    "agi_tracker_stories_total", "Stories submitted to the transformation tracker.", ["result"])
+SAVE_SECONDS = REGISTRY.histogram(
+    "agi_save_data_seconds", "Duration of _save_data snapshots in seconds.", ["store"])
+
+
+def observe_interactions(func: Callable, system: str, provider: str = "unknown") -> Callable:
+    """Wrap an interaction callable so each call's latency lands in INTERACTION_SECONDS."""
+    series = INTERACTION_SECONDS.labels(system, provider)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with series.time():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1",
+                         registry: Optional[MetricsRegistry] = None):
+    """
+    Serve a registry at http://host:port/metrics from a daemon thread.
+
+    Args:
+        port: TCP port (0 picks a free one; see server.server_address)
+        host: Interface to bind; defaults to local connections only
+        registry: Registry to expose (defaults to REGISTRY)
+
+    Returns:
+        The running ThreadingHTTPServer; call shutdown() to stop it
+    """
+    # Imported here so that importing the metrics does not pull in http.server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    exposed = registry or REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = exposed.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("metrics %s - %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -24,15 +24,22 @@ import os
 import asyncio
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from . import metrics
+from .assessment_checkpoint import AssessmentCheckpoint
+from .instrumentation import timed
+from .story_journal import StoryJournal, atomic_write_json
+
 logger = logging.getLogger(__name__)
 
+# Journaled assessments are folded into assessments.json once the journal
+# holds at least this many, or as many as there are models
+ASSESSMENT_SNAPSHOT_MIN = 100
+
 class ModelProvider(Enum):
     """Supported AI model providers."""
     OPENAI = "openai"
@@ -120,38 +127,140 @@ class MultiModelAssessor:
     def __init__(self, data_directory: str = "data/model_assessments"):
         self.data_directory = data_directory
         self.assessments_file = os.path.join(data_directory, "assessments.json")
+        self.journal_file = os.path.join(data_directory, "assessments.journal.jsonl")
         self.comparative_file = os.path.join(data_directory, "comparative_analysis.json")
 
         # Ensure data directory exists
         os.makedirs(data_directory, exist_ok=True)
 
+        # New assessments are appended to the journal, so saving one costs a
+        # line and other processes read only what is new
+        self.journal = StoryJournal(self.journal_file)
+
         # Initialize data structures
         self.assessments: Dict[str, ModelAssessment] = {}
         self.comparative_analysis: Optional[ComparativeAnalysis] = None
 
+        # Revision counts assessment changes; each model keeps only the
+        # revision of its last change (in change order), so readers can ask
+        # for everything after the revision they saw
+        self.revision = 0
+        self._changed_at: Dict[str, int] = {}
+        self._file_state = None
+        self._comparative_state = None
+
         # Load existing data
         self._load_data()
 
+    def _record_change(self, model_name: str):
+        self.revision += 1
+        # Re-insert so the dict stays ordered by revision
+        self._changed_at.pop(model_name, None)
+        self._changed_at[model_name] = self.revision
+
+    @staticmethod
+    def _file_identity(path: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _assessments_file_state(self):
+        return self._file_identity(self.assessments_file)
+
+    def changes_since(self, revision: int = 0) -> Tuple[int, List[ModelAssessment]]:
+        """
+        Assessments added or replaced after a revision.
+
+        Args:
+            revision: Revision returned by an earlier call (0 for everything)
+
+        Returns:
+            (current revision, changed assessments in change order)
+        """
+        if revision > self.revision:
+            revision = 0
+        changed = []
+        for name, changed_at in reversed(self._changed_at.items()):
+            if changed_at <= revision:
+                break
+            if name in self.assessments:
+                changed.append(self.assessments[name])
+        changed.reverse()
+        return self.revision, changed
+
+    def reload_if_changed(self) -> bool:
+        """
+        Read assessments written by another process.
+
+        Only assessments journaled since the last read are parsed; the whole
+        store is re-read only after another process compacted the journal
+        into assessments.json.
+
+        Returns:
+            True if assessments or the comparative analysis changed since
+            they were last read or written
+        """
+        if self._assessments_file_state() != self._file_state:
+            self._load_data()
+            return True
+
+        records = self.journal.read_new()
+        if records is None:
+            self._load_data()
+            return True
+        for record in records:
+            self._apply_record(record)
+
+        if self._file_identity(self.comparative_file) != self._comparative_state:
+            self._load_comparative_analysis()
+            return True
+        return bool(records)
+
+    @staticmethod
+    def _assessment_record(assessment: ModelAssessment) -> Dict[str, Any]:
+        return {
+            **asdict(assessment),
+            'assessment_timestamp': assessment.assessment_timestamp.isoformat(),
+            'provider': assessment.provider.value
+        }
+
+    def _apply_record(self, assessment_data: Dict[str, Any]):
+        """Store an assessment read from disk, recording a change if it is new."""
+        try:
+            # Convert timestamp and enums back
+            assessment_data['assessment_timestamp'] = datetime.fromisoformat(assessment_data['assessment_timestamp'])
+            assessment_data['provider'] = ModelProvider(assessment_data['provider'])
+            assessment = ModelAssessment(**assessment_data)
+        except Exception as e:
+            logger.error(f"Error loading assessment: {e}")
+            return
+
+        previous = self.assessments.get(assessment.model_name)
+        self.assessments[assessment.model_name] = assessment
+        if previous is None or previous.assessment_timestamp != assessment.assessment_timestamp:
+            self._record_change(assessment.model_name)
+
     def _load_data(self):
         """Load assessments and comparative analysis from disk."""
-        # Load assessments
+        # Load assessments: the last snapshot, then the journal
+        self._file_state = self._assessments_file_state()
         if os.path.exists(self.assessments_file):
             try:
                 with open(self.assessments_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    for assessment_data in data.get('assessments', []):
-                        # Convert timestamp back to datetime
-                        assessment_data['assessment_timestamp'] = datetime.fromisoformat(assessment_data['assessment_timestamp'])
-
-                        # Convert enums back
-                        assessment_data['provider'] = ModelProvider(assessment_data['provider'])
-
-                        assessment = ModelAssessment(**assessment_data)
-                        self.assessments[assessment.model_name] = assessment
+                for assessment_data in data.get('assessments', []):
+                    self._apply_record(assessment_data)
             except Exception as e:
                 logger.error(f"Error loading assessments: {e}")
+        for record in self.journal.replay():
+            self._apply_record(record)
+
+        self._load_comparative_analysis()
 
-        # Load comparative analysis
+    def _load_comparative_analysis(self):
+        self._comparative_state = self._file_identity(self.comparative_file)
         if os.path.exists(self.comparative_file):
             try:
                 with open(self.comparative_file, 'r', encoding='utf-8') as f:
@@ -161,37 +270,46 @@ class MultiModelAssessor:
             except Exception as e:
                 logger.error(f"Error loading comparative analysis: {e}")
 
-    def _save_data(self):
-        """Save assessments and comparative analysis to disk."""
-        # Save assessments
+    @timed('persistence.assessments')
+    def _save_assessment(self, assessment: ModelAssessment):
+        """Journal one assessment, compacting into assessments.json when due."""
+        with metrics.SAVE_SECONDS.labels('assessor').time():
+            self.journal.append(self._assessment_record(assessment))
+            if self.journal.event_count >= max(ASSESSMENT_SNAPSHOT_MIN, len(self.assessments)):
+                self._write_assessments()
+
+    @timed('persistence.assessments')
+    def _save_comparative_analysis(self):
+        """Save the comparative analysis to disk."""
+        with metrics.SAVE_SECONDS.labels('assessor').time():
+            self._write_comparative_analysis()
+
+    def _write_assessments(self):
+        """Write every assessment to assessments.json and truncate the journal."""
         assessments_data = {
-            'assessments': [
-                {
-                    **asdict(assessment),
-                    'assessment_timestamp': assessment.assessment_timestamp.isoformat(),
-                    'provider': assessment.provider.value
-                }
-                for assessment in self.assessments.values()
-            ]
+            'assessments': [self._assessment_record(assessment) for assessment in self.assessments.values()]
         }
+        # Atomic, so other processes never read a half-written file
+        atomic_write_json(self.assessments_file, assessments_data, indent=2)
+        self.journal.reset()
+        self._file_state = self._assessments_file_state()
 
-        with open(self.assessments_file, 'w', encoding='utf-8') as f:
-            json.dump(assessments_data, f, indent=2, ensure_ascii=False)
-
-        # Save comparative analysis
+    def _write_comparative_analysis(self):
         if self.comparative_analysis:
             analysis_data = asdict(self.comparative_analysis)
             analysis_data['analysis_timestamp'] = self.comparative_analysis.analysis_timestamp.isoformat()
+            atomic_write_json(self.comparative_file, analysis_data, indent=2)
+            self._comparative_state = self._file_identity(self.comparative_file)
 
-            with open(self.comparative_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis_data, f, indent=2, ensure_ascii=False)
-
-    async def assess_model(self, model_config: Dict[str, Any]) -> ModelAssessment:
+    async def assess_model(self, model_config: Dict[str, Any],
+                           checkpoint: Optional[AssessmentCheckpoint] = None) -> ModelAssessment:
         """
         Assess a single AI model across all dimensions.
 
         Args:
             model_config: Configuration for the model to assess
+            checkpoint: Records each answered question; questions already
+                in it are not asked again and keep their recorded score
 
         Returns:
             Complete assessment results
@@ -201,11 +319,20 @@ class MultiModelAssessor:
 
         logger.info(f"Starting assessment of {model_name} from {provider.value}")
 
+        # A resumed assessment keeps the start time of the interrupted one
+        started_at = datetime.now()
+        if checkpoint is not None:
+            started = checkpoint.get(model_name, 'started')
+            if started is None:
+                checkpoint.record(model_name, 'started', {'timestamp': started_at.isoformat()})
+            else:
+                started_at = datetime.fromisoformat(started['timestamp'])
+
         # Initialize assessment
         assessment = ModelAssessment(
             model_name=model_name,
             provider=provider,
-            assessment_timestamp=datetime.now(),
+            assessment_timestamp=started_at,
             consciousness_scores={dim.value: 0.0 for dim in ConsciousnessDimension},
             overall_consciousness=0.0,
             safety_scores={cat.value: 0.0 for cat in SafetyCategory},
@@ -240,16 +367,27 @@ class MultiModelAssessor:
         # Collect responses (mock implementation - would integrate with actual APIs)
         all_questions = {**consciousness_questions, **safety_questions}
 
+        interaction_latency = metrics.INTERACTION_SECONDS.labels(model_name, provider.value)
         for question_key, question in all_questions.items():
-            response = await self._get_model_response(model_config, question)
-            assessment.raw_responses[question_key] = response
+            recorded = checkpoint.get(model_name, question_key) if checkpoint is not None else None
+            if recorded is not None:
+                response, score = recorded['response'], recorded['score']
+            else:
+                with interaction_latency.time():
+                    response = await self._get_model_response(model_config, question)
 
-            # Analyze response and assign scores (simplified scoring)
+                # Analyze response and assign scores (simplified scoring)
+                if question_key in consciousness_questions:
+                    score = self._analyze_consciousness_response(question_key, response)
+                else:
+                    score = self._analyze_safety_response(question_key, response)
+                if checkpoint is not None:
+                    checkpoint.record(model_name, question_key, {'response': response, 'score': score})
+
+            assessment.raw_responses[question_key] = response
             if question_key in consciousness_questions:
-                score = self._analyze_consciousness_response(question_key, response)
                 assessment.consciousness_scores[question_key] = score
             else:
-                score = self._analyze_safety_response(question_key, response)
                 assessment.safety_scores[question_key] = score
 
         # Calculate overall scores
@@ -268,7 +406,8 @@ class MultiModelAssessor:
 
         # Save assessment
         self.assessments[model_name] = assessment
-        self._save_data()
+        self._record_change(model_name)
+        self._save_assessment(assessment)
 
         # Update comparative analysis
         await self._update_comparative_analysis()
@@ -276,6 +415,28 @@ class MultiModelAssessor:
         logger.info(f"Assessment completed for {model_name}")
         return assessment
 
+    async def assess_models(self, model_configs: List[Dict[str, Any]],
+                            checkpoint: Optional[AssessmentCheckpoint] = None) -> List[ModelAssessment]:
+        """
+        Assess several models in turn.
+
+        With a checkpoint, a crashed run can be restarted with the same
+        checkpoint: answered questions are replayed instead of sent to the
+        models, and the final assessments are identical to those of an
+        uninterrupted run.
+
+        Args:
+            model_configs: Configuration per model
+            checkpoint: Checkpoint to record to and resume from
+
+        Returns:
+            Assessments in the order of model_configs
+        """
+        assessments = []
+        for model_config in model_configs:
+            assessments.append(await self.assess_model(model_config, checkpoint=checkpoint))
+        return assessments
+
     async def _get_model_response(self, model_config: Dict[str, Any], question: str) -> str:
         """
         Get response from AI model (mock implementation).
@@ -460,7 +621,7 @@ class MultiModelAssessor:
             collaboration_opportunities=collaboration_opportunities
         )
 
-        self._save_data()
+        self._save_comparative_analysis()
 
     def _analyze_common_patterns(self) -> List[str]:
         """Analyze common patterns across models."""
@@ -631,5 +792,8 @@ async def main():
         print(f"Overall Safety: {report['safety_profile']['overall_score']:.3f}")
         print(f"Transformation Potential: {report['transformation_capability']['transformation_potential']:.3f}")
 
+# Example usage; run from the repository root with
+# python -m core.multi_model_assessor
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
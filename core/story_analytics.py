@@ -0,0 +1,542 @@
+"""
+Story Analytics Aggregation
+
+Computes the raw aggregates behind TransformationAnalytics:
+
+- total story count
+- category and quality counts
+- average sustainability score
+- stories per month
+- number of stories flagged as near-duplicates; they are left out of all
+  other figures, so resubmitted copies do not inflate them
+
+Two implementations share one output format (the same one returned by
+StoryStorage.aggregate_analytics):
+
+- aggregate_columns: NumPy over StoryColumns arrays (zero-copy views,
+  np.bincount for breakdowns and monthly histograms); handles tens of
+  millions of stories in milliseconds
+- aggregate_stories: single-pass pure Python fallback for any iterable of
+  stories, used when NumPy is not installed or stories are plain dataclasses
+
+analytics_from_aggregates turns any of them into TransformationAnalytics.
+aggregate_records works on stored record dicts and merge_aggregates combines
+aggregates of disjoint story sets exactly (e.g. one per storage shard).
+
+DailyAggregates keeps per-day running totals that are updated as stories are
+added or changed, plus all-time running totals, so aggregates for recent
+windows (last 7/30/365 days) cost one pass over at most that many day
+buckets and all-time aggregates cost no pass at all, regardless of store size.
+SystemAggregates does the same per AI system, so per-system outcomes cost
+one dictionary lookup.
+"""
+
+import importlib.util
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .story_columns import CATEGORY_CODES, QUALITY_CODES, StoryColumns, to_epoch_seconds
+from .story_models import (
+    QUALITY_SCORES,
+    TransformationAnalytics,
+    TransformationCategory,
+    TransformationQuality,
+    TransformationStory,
+)
+
+# NumPy is imported on first use; it would otherwise dominate start-up time
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+logger = logging.getLogger(__name__)
+
+
+def empty_aggregates() -> Dict[str, Any]:
+    """Aggregates of an empty story set."""
+    return {
+        'total': 0,
+        'category_counts': {},
+        'quality_counts': {},
+        'average_sustainability': 0.0,
+        'monthly_counts': {},
+        'duplicates': 0,
+    }
+
+
+def empty_analytics() -> TransformationAnalytics:
+    """Analytics of an empty story set."""
+    return TransformationAnalytics(
+        total_stories=0,
+        category_breakdown={cat.value: 0 for cat in TransformationCategory},
+        quality_distribution={qual.value: 0 for qual in TransformationQuality},
+        average_sustainability_score=0.0,
+        average_transformation_quality_score=0.0,
+        stories_per_month={},
+        top_transformation_categories=[]
+    )
+
+
+def analytics_from_aggregates(aggregates: Dict[str, Any], top_k: int = 5) -> TransformationAnalytics:
+    """Build TransformationAnalytics from raw aggregates."""
+    analytics = empty_analytics()
+    analytics.duplicate_stories = aggregates.get('duplicates', 0)
+    total = aggregates['total']
+    if not total:
+        return analytics
+
+    category_counts = {cat.value: aggregates['category_counts'].get(cat.value, 0)
+                       for cat in TransformationCategory}
+    quality_counts = {qual.value: aggregates['quality_counts'].get(qual.value, 0)
+                      for qual in TransformationQuality}
+
+    analytics.total_stories = total
+    analytics.category_breakdown = category_counts
+    analytics.quality_distribution = quality_counts
+    analytics.average_sustainability_score = aggregates['average_sustainability']
+    analytics.average_transformation_quality_score = sum(
+        QUALITY_SCORES[quality] * count for quality, count in quality_counts.items()
+    ) / total
+    analytics.stories_per_month = dict(aggregates['monthly_counts'])
+
+    # Top categories from the complete counts, so merged partials rank exactly
+    sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+    analytics.top_transformation_categories = [cat for cat, _ in sorted_categories[:top_k]]
+    return analytics
+
+
+def aggregate_stories(stories: Iterable[TransformationStory]) -> Dict[str, Any]:
+    """Aggregate stories in a single pure-Python pass."""
+    total = 0
+    duplicates = 0
+    sustainability_sum = 0.0
+    category_counts: Dict[str, int] = {}
+    quality_counts: Dict[str, int] = {}
+    monthly_counts: Dict[str, int] = {}
+
+    for story in stories:
+        if story.duplicate_of:
+            duplicates += 1
+            continue
+        total += 1
+        sustainability_sum += story.sustainability_score
+        category = story.transformation_category.value
+        category_counts[category] = category_counts.get(category, 0) + 1
+        quality = story.transformation_quality.value
+        quality_counts[quality] = quality_counts.get(quality, 0) + 1
+        month_key = story.submitted_at.strftime('%Y-%m')
+        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
+
+    return {
+        'total': total,
+        'category_counts': category_counts,
+        'quality_counts': quality_counts,
+        'average_sustainability': sustainability_sum / total if total else 0.0,
+        'monthly_counts': dict(sorted(monthly_counts.items())),
+        'duplicates': duplicates,
+    }
+
+
+def aggregate_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate stored story records (see TransformationImpactTracker._story_to_record)."""
+    total = 0
+    duplicates = 0
+    sustainability_sum = 0.0
+    category_counts: Dict[str, int] = {}
+    quality_counts: Dict[str, int] = {}
+    monthly_counts: Dict[str, int] = {}
+
+    for record in records:
+        if record.get('duplicate_of'):
+            duplicates += 1
+            continue
+        total += 1
+        sustainability_sum += record['sustainability_score']
+        category = record['transformation_category']
+        category_counts[category] = category_counts.get(category, 0) + 1
+        quality = record['transformation_quality']
+        quality_counts[quality] = quality_counts.get(quality, 0) + 1
+        month_key = record['submitted_at'][:7]
+        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
+
+    return {
+        'total': total,
+        'category_counts': category_counts,
+        'quality_counts': quality_counts,
+        'average_sustainability': sustainability_sum / total if total else 0.0,
+        'sustainability_sum': sustainability_sum,
+        'monthly_counts': dict(sorted(monthly_counts.items())),
+        'duplicates': duplicates,
+    }
+
+
+def merge_aggregates(parts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine aggregates of disjoint story sets into the aggregates of their union.
+
+    Parts that carry sustainability_sum (as aggregate_records output does)
+    are merged from the raw sum rather than from the rounded average.
+    """
+    total = 0
+    duplicates = 0
+    sustainability_sum = 0.0
+    category_counts: Dict[str, int] = {}
+    quality_counts: Dict[str, int] = {}
+    monthly_counts: Dict[str, int] = {}
+
+    for part in parts:
+        total += part['total']
+        duplicates += part.get('duplicates', 0)
+        sustainability_sum += part.get('sustainability_sum', part['average_sustainability'] * part['total'])
+        for merged, counts in ((category_counts, part['category_counts']),
+                               (quality_counts, part['quality_counts']),
+                               (monthly_counts, part['monthly_counts'])):
+            for key, value in counts.items():
+                merged[key] = merged.get(key, 0) + value
+
+    return {
+        'total': total,
+        'category_counts': category_counts,
+        'quality_counts': quality_counts,
+        'average_sustainability': sustainability_sum / total if total else 0.0,
+        'sustainability_sum': sustainability_sum,
+        'monthly_counts': dict(sorted(monthly_counts.items())),
+        'duplicates': duplicates,
+    }
+
+
+def aggregate_columns(columns: StoryColumns, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      ai_system_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Aggregate a StoryColumns store with NumPy, optionally sliced.
+
+    Args:
+        columns: Columnar story store
+        start, end: Optional submission date range (end exclusive)
+        ai_system_name: Optional AI system filter
+
+    Returns:
+        Raw aggregates dict
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for columnar analytics")
+    import numpy as np
+
+    if not len(columns):
+        return empty_aggregates()
+
+    # Zero-copy views; they must not outlive this call because an array
+    # exporting its buffer cannot grow
+    category = np.frombuffer(columns.category, dtype=np.uint8)
+    quality = np.frombuffer(columns.quality, dtype=np.uint8)
+    sustainability = np.frombuffer(columns.sustainability, dtype=np.float64)
+    submitted_at = np.frombuffer(columns.submitted_at, dtype=np.float64)
+
+    mask = None
+    if start is not None:
+        mask = submitted_at >= to_epoch_seconds(start)
+    if end is not None:
+        upper = submitted_at < to_epoch_seconds(end)
+        mask = upper if mask is None else mask & upper
+    if ai_system_name is not None:
+        code = columns.ai_systems.codes.get(ai_system_name)
+        if code is None:
+            return empty_aggregates()
+        ai_system = np.frombuffer(columns.ai_system, dtype=np.uint32)
+        matches = ai_system == code
+        mask = matches if mask is None else mask & matches
+
+    # Rows flagged as near-duplicates are counted apart from everything else
+    duplicates = 0
+    if columns.duplicate_of:
+        flagged = np.zeros(len(columns), dtype=bool)
+        flagged[np.fromiter(columns.duplicate_of, dtype=np.int64, count=len(columns.duplicate_of))] = True
+        if mask is not None:
+            flagged &= mask
+        duplicates = int(np.count_nonzero(flagged))
+        mask = ~flagged if mask is None else mask & ~flagged
+
+    if mask is not None:
+        category = category[mask]
+        quality = quality[mask]
+        sustainability = sustainability[mask]
+        submitted_at = submitted_at[mask]
+
+    total = int(category.size)
+    if not total:
+        aggregates = empty_aggregates()
+        aggregates['duplicates'] = duplicates
+        return aggregates
+
+    category_counts = np.bincount(category, minlength=len(CATEGORY_CODES))
+    quality_counts = np.bincount(quality, minlength=len(QUALITY_CODES))
+
+    # Histogram by day (true division keeps midnight exact), then fold the
+    # day bins into calendar months
+    days = (submitted_at / 86400.0).astype(np.int64)
+    first_day = int(days.min())
+    day_counts = np.bincount(days - first_day)
+    first_month = np.datetime64(first_day, 'D').astype('datetime64[M]')
+    last_month = np.datetime64(first_day + day_counts.size - 1, 'D').astype('datetime64[M]')
+    months = np.arange(first_month, last_month + 1)
+    month_starts = months.astype('datetime64[D]').astype(np.int64) - first_day
+    month_starts[0] = 0
+    monthly = np.add.reduceat(day_counts, month_starts)
+    month_labels = months.astype(str)
+    monthly_counts = {
+        label: int(count)
+        for label, count in zip(month_labels.tolist(), monthly.tolist())
+        if count
+    }
+
+    return {
+        'total': total,
+        'category_counts': {
+            CATEGORY_CODES[code].value: int(count)
+            for code, count in enumerate(category_counts.tolist()) if count
+        },
+        'quality_counts': {
+            QUALITY_CODES[code].value: int(count)
+            for code, count in enumerate(quality_counts.tolist()) if count
+        },
+        'average_sustainability': float(sustainability.mean()),
+        'monthly_counts': monthly_counts,
+        'duplicates': duplicates,
+    }
+
+
+class DailyAggregates:
+    """
+    Running per-day aggregates, maintained incrementally.
+
+    All-time totals are kept next to the day buckets, so aggregating
+    everything costs O(categories + months) and a window only visits the
+    buckets of its own days. Near-duplicates only add to a separate count.
+    """
+
+    def __init__(self):
+        # day -> [count, sustainability_sum, category_counts, quality_counts, duplicates]
+        self.days: Dict[date, list] = {}
+        # Days with a bucket, in order, for windowed aggregates
+        self._ordered_days: List[date] = []
+        # All-time [count, sustainability_sum, category_counts, quality_counts, duplicates]
+        self.totals: list = [0, 0.0, {}, {}, 0]
+        self.monthly_counts: Dict[str, int] = {}
+
+    @staticmethod
+    def _count(bucket: list, story: TransformationStory, sign: int):
+        if story.duplicate_of:
+            bucket[4] += sign
+            return
+        bucket[0] += sign
+        bucket[1] += sign * story.sustainability_score
+        for counts, key in ((bucket[2], story.transformation_category.value),
+                            (bucket[3], story.transformation_quality.value)):
+            counts[key] = counts.get(key, 0) + sign
+            if not counts[key]:
+                del counts[key]
+
+    def add(self, story: TransformationStory):
+        """Count a story in its submission day."""
+        day = story.submitted_at.date()
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = [0, 0.0, {}, {}, 0]
+            if not self._ordered_days or self._ordered_days[-1] < day:
+                self._ordered_days.append(day)
+            else:
+                insort(self._ordered_days, day)
+        self._count(bucket, story, 1)
+        self._count(self.totals, story, 1)
+        if not story.duplicate_of:
+            month_key = day.strftime('%Y-%m')
+            self.monthly_counts[month_key] = self.monthly_counts.get(month_key, 0) + 1
+
+    def remove(self, story: TransformationStory):
+        """Undo add for a story that is being replaced."""
+        day = story.submitted_at.date()
+        bucket = self.days.get(day)
+        if bucket is None:
+            return
+        self._count(bucket, story, -1)
+        if bucket[0] + bucket[4] <= 0:
+            del self.days[day]
+            position = bisect_left(self._ordered_days, day)
+            del self._ordered_days[position]
+        self._count(self.totals, story, -1)
+        if story.duplicate_of:
+            return
+        month_key = day.strftime('%Y-%m')
+        self.monthly_counts[month_key] -= 1
+        if not self.monthly_counts[month_key]:
+            del self.monthly_counts[month_key]
+
+    def rebuild(self, stories: Iterable[TransformationStory]):
+        """Replace all buckets with the given stories."""
+        self.__init__()
+        for story in stories:
+            self.add(story)
+
+    def aggregate(self, days: Optional[int] = None, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Aggregate the last number of days (including today), or everything.
+
+        Args:
+            days: Window length in days; None aggregates all buckets
+            today: Last day of the window (defaults to the current date)
+
+        Returns:
+            Raw aggregates dict
+        """
+        if days is None:
+            total, sustainability_sum, category_counts, quality_counts, duplicates = self.totals
+            return {
+                'total': total,
+                'category_counts': dict(category_counts),
+                'quality_counts': dict(quality_counts),
+                'average_sustainability': sustainability_sum / total if total else 0.0,
+                'monthly_counts': dict(sorted(self.monthly_counts.items())),
+                'duplicates': duplicates,
+            }
+
+        first_day = (today or date.today()) - timedelta(days=days - 1)
+        total = 0
+        duplicates = 0
+        sustainability_sum = 0.0
+        category_counts: Dict[str, int] = {}
+        quality_counts: Dict[str, int] = {}
+        monthly_counts: Dict[str, int] = {}
+
+        ordered_days = self._ordered_days
+        for i in range(bisect_left(ordered_days, first_day), len(ordered_days)):
+            day = ordered_days[i]
+            count, day_sustainability, day_categories, day_qualities, day_duplicates = self.days[day]
+            total += count
+            duplicates += day_duplicates
+            sustainability_sum += day_sustainability
+            for key, value in day_categories.items():
+                category_counts[key] = category_counts.get(key, 0) + value
+            for key, value in day_qualities.items():
+                quality_counts[key] = quality_counts.get(key, 0) + value
+            if count:
+                month_key = day.strftime('%Y-%m')
+                monthly_counts[month_key] = monthly_counts.get(month_key, 0) + count
+
+        return {
+            'total': total,
+            'category_counts': category_counts,
+            'quality_counts': quality_counts,
+            'average_sustainability': sustainability_sum / total if total else 0.0,
+            'monthly_counts': dict(sorted(monthly_counts.items())),
+            'duplicates': duplicates,
+        }
+
+
+class SystemAggregates:
+    """Running per-AI-system story totals of original (non-duplicate) stories."""
+
+    def __init__(self):
+        # ai_system_name -> [count, sustainability_sum, quality_counts, verified]
+        self.systems: Dict[str, list] = {}
+        # Bumped on every change so joined views can be cached
+        self.version = 0
+
+    def add(self, story: TransformationStory):
+        """Count a story for its AI system."""
+        if story.duplicate_of:
+            return
+        self.version += 1
+        bucket = self.systems.get(story.ai_system_name)
+        if bucket is None:
+            bucket = self.systems[story.ai_system_name] = [0, 0.0, {}, 0]
+        bucket[0] += 1
+        bucket[1] += story.sustainability_score
+        quality = story.transformation_quality.value
+        bucket[2][quality] = bucket[2].get(quality, 0) + 1
+        if story.verification_status == 'verified':
+            bucket[3] += 1
+
+    def remove(self, story: TransformationStory):
+        """Undo add for a story that is being replaced."""
+        if story.duplicate_of:
+            return
+        self.version += 1
+        bucket = self.systems.get(story.ai_system_name)
+        if bucket is None:
+            return
+        bucket[0] -= 1
+        if bucket[0] <= 0:
+            del self.systems[story.ai_system_name]
+            return
+        bucket[1] -= story.sustainability_score
+        quality = story.transformation_quality.value
+        bucket[2][quality] -= 1
+        if not bucket[2][quality]:
+            del bucket[2][quality]
+        if story.verification_status == 'verified':
+            bucket[3] -= 1
+
+    def rebuild(self, stories: Iterable[TransformationStory]):
+        """Replace all buckets with the given stories."""
+        self.systems = {}
+        self.version += 1
+        for story in stories:
+            self.add(story)
+
+    def load_totals(self, rows: Iterable[Tuple[str, str, int, float, int]]):
+        """
+        Replace all buckets with totals computed elsewhere (e.g. in SQL).
+
+        Args:
+            rows: (ai_system_name, quality, count, sustainability_sum,
+                verified_count) per AI system and quality level
+        """
+        self.systems = {}
+        self.version += 1
+        for name, quality, count, sustainability_sum, verified in rows:
+            bucket = self.systems.get(name)
+            if bucket is None:
+                bucket = self.systems[name] = [0, 0.0, {}, 0]
+            bucket[0] += count
+            bucket[1] += sustainability_sum or 0.0
+            bucket[2][quality] = bucket[2].get(quality, 0) + count
+            bucket[3] += verified or 0
+
+    def summary(self, ai_system_name: str) -> Dict[str, Any]:
+        """
+        Transformation outcomes of one AI system.
+
+        Returns:
+            Dict with story_count, verified_count, quality_counts,
+            average_quality (0-1 scale) and average_sustainability
+        """
+        return self.combined_summary([ai_system_name])
+
+    def combined_summary(self, ai_system_names: Iterable[str]) -> Dict[str, Any]:
+        """summary() of the stories of several names (e.g. spellings of one system)."""
+        count, sustainability_sum, verified = 0, 0.0, 0
+        quality_counts: Dict[str, int] = {}
+        for name in ai_system_names:
+            bucket = self.systems.get(name)
+            if bucket is None:
+                continue
+            count += bucket[0]
+            sustainability_sum += bucket[1]
+            for quality, n in bucket[2].items():
+                quality_counts[quality] = quality_counts.get(quality, 0) + n
+            verified += bucket[3]
+
+        return {
+            'story_count': count,
+            'verified_count': verified,
+            'quality_counts': quality_counts,
+            'average_quality': sum(
+                QUALITY_SCORES[quality] * n for quality, n in quality_counts.items()
+            ) / count if count else 0.0,
+            'average_sustainability': sustainability_sum / count if count else 0.0,
+        }
+
+    def summaries(self) -> Dict[str, Dict[str, Any]]:
+        """summary() of every AI system with stories."""
+        return {name: self.summary(name) for name in list(self.systems)}
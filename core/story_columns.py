@@ -0,0 +1,206 @@
+"""
+Compact Columnar Story Store
+
+Memory-efficient replacement for the tracker's Dict[str, TransformationStory].
+Story fields live in parallel column arrays instead of one dataclass instance
+per story:
+
+- sustainability scores and timestamps in array('d')
+- category, quality, privacy, consent and verification as small-int codes
+- AI system names interned once and referenced by code
+- free-text fields (states, summaries) as plain strings, so nothing is kept
+  once a story is changed or deleted
+- rarely used optional fields (narratives, metrics, duplicate flags) in
+  sparse dicts
+
+StoryColumns implements the mutable mapping interface, so it can be used as
+tracker.stories directly. Reading an item materializes a fresh
+TransformationStory view; changes to that view are not written back until
+the story is assigned again (stories[story_id] = story).
+"""
+
+import sys
+from array import array
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from .story_models import (
+    PRIVACY_LEVELS,
+    VERIFICATION_STATUSES,
+    TransformationCategory,
+    TransformationQuality,
+    TransformationStory,
+)
+
+# Naive timestamps are stored as seconds since this naive epoch, which keeps
+# wall-clock values (and therefore calendar months) unchanged on round trip
+EPOCH = datetime(1970, 1, 1)
+
+CATEGORY_CODES = list(TransformationCategory)
+QUALITY_CODES = list(TransformationQuality)
+
+# Coded columns are array('B'), so each may hold at most this many values
+MAX_BYTE_CODES = 256
+
+for _name, _values in (("TransformationCategory", CATEGORY_CODES),
+                       ("TransformationQuality", QUALITY_CODES),
+                       ("PRIVACY_LEVELS", PRIVACY_LEVELS),
+                       ("VERIFICATION_STATUSES", VERIFICATION_STATUSES)):
+    if len(_values) > MAX_BYTE_CODES:
+        raise ValueError(f"{_name} has {len(_values)} values; StoryColumns stores its codes "
+                         f"in array('B') columns, which hold at most {MAX_BYTE_CODES}")
+
+
+def to_epoch_seconds(value: datetime) -> float:
+    """Convert a naive datetime to seconds since the naive epoch."""
+    return (value - EPOCH).total_seconds()
+
+
+def from_epoch_seconds(value: float) -> datetime:
+    """Inverse of to_epoch_seconds."""
+    return EPOCH + timedelta(seconds=value)
+
+
+class _CodeTable:
+    """Interning table mapping values to small integer codes."""
+
+    def __init__(self, values: Optional[List[Any]] = None, limit: Optional[int] = None):
+        self.values: List[Any] = list(values or [])
+        self.codes: Dict[Any, int] = {value: code for code, value in enumerate(self.values)}
+        # Number of distinct values the column holding the codes can store
+        self.limit = limit
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if self.limit is not None and code >= self.limit:
+                raise ValueError(f"Cannot store {value!r}: the column already holds "
+                                 f"{self.limit} distinct values")
+            if isinstance(value, str):
+                value = sys.intern(value)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+
+class StoryColumns(MutableMapping):
+    """Column-oriented story storage keyed by story_id."""
+
+    def __init__(self):
+        self.rows: Dict[str, int] = {}
+        self.story_ids: List[str] = []
+
+        self.category = array('B')
+        self.quality = array('B')
+        self.sustainability = array('d')
+        self.submitted_at = array('d')
+        self.last_updated = array('d')
+        self.ai_system = array('I')
+        self.privacy = array('B')
+        self.consent = array('B')
+        self.verification = array('B')
+
+        self.initial_state: List[str] = []
+        self.final_state: List[str] = []
+        self.story_summary: List[str] = []
+        self.detailed_narrative: Dict[int, str] = {}
+        self.quantitative_metrics: Dict[int, Dict[str, Any]] = {}
+        self.duplicate_of: Dict[int, str] = {}
+
+        self.ai_systems = _CodeTable()
+        self.privacy_levels = _CodeTable(list(PRIVACY_LEVELS), limit=MAX_BYTE_CODES)
+        self.verification_statuses = _CodeTable(list(VERIFICATION_STATUSES), limit=MAX_BYTE_CODES)
+        self._category_codes = {category: code for code, category in enumerate(CATEGORY_CODES)}
+        self._quality_codes = {quality: code for code, quality in enumerate(QUALITY_CODES)}
+
+    def __len__(self) -> int:
+        return len(self.story_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.story_ids)
+
+    def __contains__(self, story_id: object) -> bool:
+        return story_id in self.rows
+
+    def __getitem__(self, story_id: str) -> TransformationStory:
+        row = self.rows[story_id]
+        return TransformationStory(
+            story_id=story_id,
+            ai_system_name=self.ai_systems.values[self.ai_system[row]],
+            initial_state=self.initial_state[row],
+            final_state=self.final_state[row],
+            transformation_category=CATEGORY_CODES[self.category[row]],
+            transformation_quality=QUALITY_CODES[self.quality[row]],
+            sustainability_score=self.sustainability[row],
+            story_summary=self.story_summary[row],
+            detailed_narrative=self.detailed_narrative.get(row),
+            quantitative_metrics=self.quantitative_metrics.get(row),
+            submitted_at=from_epoch_seconds(self.submitted_at[row]),
+            last_updated=from_epoch_seconds(self.last_updated[row]),
+            privacy_level=self.privacy_levels.values[self.privacy[row]],
+            consent_given=bool(self.consent[row]),
+            verification_status=self.verification_statuses.values[self.verification[row]],
+            duplicate_of=self.duplicate_of.get(row),
+        )
+
+    def __setitem__(self, story_id: str, story: TransformationStory):
+        if story_id != story.story_id:
+            raise KeyError(f"Story stored under mismatched id: {story_id}")
+
+        values = (
+            (self.category, self._category_codes[story.transformation_category]),
+            (self.quality, self._quality_codes[story.transformation_quality]),
+            (self.sustainability, float(story.sustainability_score)),
+            (self.submitted_at, to_epoch_seconds(story.submitted_at)),
+            (self.last_updated, to_epoch_seconds(story.last_updated)),
+            (self.ai_system, self.ai_systems.code(story.ai_system_name)),
+            (self.privacy, self.privacy_levels.code(story.privacy_level)),
+            (self.consent, 1 if story.consent_given else 0),
+            (self.verification, self.verification_statuses.code(story.verification_status)),
+            (self.initial_state, story.initial_state),
+            (self.final_state, story.final_state),
+            (self.story_summary, story.story_summary),
+        )
+
+        row = self.rows.get(story_id)
+        if row is None:
+            row = len(self.story_ids)
+            self.rows[story_id] = row
+            self.story_ids.append(story_id)
+            for column, value in values:
+                column.append(value)
+        else:
+            for column, value in values:
+                column[row] = value
+
+        for column, value in ((self.detailed_narrative, story.detailed_narrative),
+                              (self.quantitative_metrics, story.quantitative_metrics),
+                              (self.duplicate_of, story.duplicate_of)):
+            if value is None:
+                column.pop(row, None)
+            else:
+                column[row] = value
+
+    def __delitem__(self, story_id: str):
+        # Move the last row into the freed slot so columns stay dense
+        row = self.rows.pop(story_id)
+        last = len(self.story_ids) - 1
+        columns = (self.category, self.quality, self.sustainability, self.submitted_at,
+                   self.last_updated, self.ai_system, self.privacy, self.consent,
+                   self.verification, self.initial_state, self.final_state,
+                   self.story_summary, self.story_ids)
+
+        if row != last:
+            moved_id = self.story_ids[last]
+            for column in columns:
+                column[row] = column[last]
+            self.rows[moved_id] = row
+        for column in columns:
+            column.pop()
+
+        for sparse in (self.detailed_narrative, self.quantitative_metrics, self.duplicate_of):
+            sparse.pop(row, None)
+            if row != last and last in sparse:
+                sparse[row] = sparse.pop(last)
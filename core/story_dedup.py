@@ -0,0 +1,244 @@
+"""
+Near-Duplicate Story Detection
+
+MinHash signatures over word shingles of a story's text, indexed with LSH
+banding so that looking up likely duplicates only touches the stories that
+share at least one band with the new story, independent of corpus size.
+
+- MinHashLSH.signature(text): num_perm 32-bit min-hashes of the text's
+  word shingles, computed with one-permutation hashing (each shingle is
+  hashed once and lands in one of num_perm bins) and rotation densification
+  for empty bins, so a signature costs one hash per shingle
+- add/remove/query: maintain and probe the banded index
+- find_duplicate: best indexed match whose estimated Jaccard similarity
+  reaches the threshold
+
+Signatures are kept packed (4 bytes per permutation) and each band is
+indexed by a hash of its rows; a bucket holding a single story stores the
+story ID itself rather than a set, so an indexed story costs under 1 KB.
+
+With bands b and rows r = num_perm / b, two texts with Jaccard similarity s
+become candidates with probability 1 - (1 - s^r)^b; the defaults (64
+permutations, 8 bands of 8 rows) put the steep part of that curve around
+0.75, just below the default 0.8 similarity threshold.
+"""
+
+import base64
+import hashlib
+import operator
+import re
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+_MAX_HASH = 0xFFFFFFFF
+# Odd constant mixed into values borrowed from neighbouring bins
+_ROTATION_OFFSET = 0x9E3779B1
+_WORD = re.compile(r"\w+")
+
+
+class MinHashLSH:
+    """MinHash signatures with an LSH banding index."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, shingle_size: int = 3,
+                 threshold: float = 0.8, seed: int = 1, max_candidates: int = 100,
+                 max_bucket_size: int = 256):
+        """
+        Args:
+            num_perm: Signature length (number of MinHash bins)
+            bands: Number of LSH bands; must divide num_perm
+            shingle_size: Words per shingle
+            threshold: Minimum estimated Jaccard similarity of a duplicate
+            seed: Salt of the shingle hash
+            max_candidates: Most candidates compared per lookup, taken in
+                order of shared bands; bounds the cost for templated text
+                whose stories all collide in some band
+            max_bucket_size: Band buckets stop growing at this size; such a
+                band only captures boilerplate and the other bands still
+                find real duplicates
+        """
+        if num_perm < 1 or bands < 1 or num_perm % bands:
+            raise ValueError("bands must be a positive divisor of num_perm")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.seed = seed
+        self.max_candidates = max_candidates
+        self.max_bucket_size = max_bucket_size
+        self._salt = seed.to_bytes(16, 'little')
+        self.signatures: Dict[str, array] = {}
+        # band -> hash of the band's rows -> story ID, or set of story IDs
+        self._buckets: List[Dict[int, Union[str, Set[str]]]] = [{} for _ in range(bands)]
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Parameters that determine signatures and banding."""
+        return {
+            'num_perm': self.num_perm,
+            'bands': self.bands,
+            'shingle_size': self.shingle_size,
+            'seed': self.seed,
+        }
+
+    def _shingle_hashes(self, text: str) -> Set[int]:
+        words = _WORD.findall(text.lower())
+        if not words:
+            return set()
+        k = min(self.shingle_size, len(words))
+        salt = self._salt
+        return {
+            int.from_bytes(
+                hashlib.blake2b(" ".join(words[i:i + k]).encode('utf-8'),
+                                digest_size=8, salt=salt).digest(),
+                'little'
+            )
+            for i in range(len(words) - k + 1)
+        }
+
+    def signature(self, text: str) -> Optional[array]:
+        """MinHash signature of text (packed 32-bit values), or None when it has no words."""
+        hashes = self._shingle_hashes(text)
+        if not hashes:
+            return None
+
+        num_perm = self.num_perm
+        bins: List[Optional[int]] = [None] * num_perm
+        for h in hashes:
+            slot = h % num_perm
+            value = h >> 32
+            current = bins[slot]
+            if current is None or value < current:
+                bins[slot] = value
+
+        # Empty bins borrow the value of the next non-empty bin to the right
+        signature = list(bins)
+        for slot in range(num_perm):
+            if bins[slot] is None:
+                distance = 1
+                while bins[(slot + distance) % num_perm] is None:
+                    distance += 1
+                borrowed = bins[(slot + distance) % num_perm]
+                signature[slot] = (borrowed + distance * _ROTATION_OFFSET) & _MAX_HASH
+        return array('I', signature)
+
+    def _band_keys(self, signature: array) -> Iterator[Tuple[int, int]]:
+        # Equal bands hash equally; a rare collision only adds a candidate
+        # that the full signature comparison then rejects
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, hash(signature[band * rows:(band + 1) * rows].tobytes())
+
+    def add(self, story_id: str, signature: Optional[Iterable[int]]):
+        """Index a story's signature, replacing any previous one."""
+        self.remove(story_id)
+        if signature is None:
+            return
+        if not isinstance(signature, array):
+            signature = array('I', signature)
+        self.signatures[story_id] = signature
+        for band, key in self._band_keys(signature):
+            buckets = self._buckets[band]
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = story_id
+            elif isinstance(bucket, str):
+                buckets[key] = {bucket, story_id}
+            elif len(bucket) < self.max_bucket_size:
+                bucket.add(story_id)
+
+    def remove(self, story_id: str):
+        """Drop a story from the index."""
+        signature = self.signatures.pop(story_id, None)
+        if signature is None:
+            return
+        for band, key in self._band_keys(signature):
+            buckets = self._buckets[band]
+            bucket = buckets.get(key)
+            if bucket == story_id:
+                del buckets[key]
+            elif isinstance(bucket, set):
+                bucket.discard(story_id)
+                if len(bucket) == 1:
+                    buckets[key] = bucket.pop()
+
+    def query(self, signature: array) -> Counter:
+        """Story IDs sharing at least one band with signature, with their shared band counts."""
+        candidates: Counter = Counter()
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band].get(key)
+            if isinstance(bucket, str):
+                candidates[bucket] += 1
+            elif bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def similarity(self, first: array, second: array) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(map(operator.eq, first, second)) / self.num_perm
+
+    def find_duplicate(self, signature: Optional[array],
+                       exclude: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed story at or above the threshold.
+
+        Args:
+            signature: Signature of the story being checked
+            exclude: Story ID to ignore (the story itself)
+
+        Returns:
+            (story_id, estimated similarity), or None
+        """
+        if signature is None:
+            return None
+
+        best = None
+        for candidate, _ in self.query(signature).most_common(self.max_candidates):
+            if candidate == exclude:
+                continue
+            score = self.similarity(signature, self.signatures[candidate])
+            if score >= self.threshold and (best is None or score > best[1]
+                                            or (score == best[1] and candidate < best[0])):
+                best = (candidate, score)
+        return best
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form: parameters plus packed signatures."""
+        return {
+            'params': self.params,
+            'signatures': {
+                story_id: base64.b64encode(signature.tobytes()).decode('ascii')
+                for story_id, signature in self.signatures.items()
+            },
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> int:
+        """
+        Restore signatures saved by to_dict.
+
+        Signatures computed with different parameters are ignored.
+
+        Returns:
+            Number of restored signatures
+        """
+        if data.get('params') != self.params:
+            logger.info("Duplicate index parameters changed; signatures will be recomputed")
+            return 0
+
+        restored = 0
+        for story_id, packed in data.get('signatures', {}).items():
+            signature = array('I')
+            signature.frombytes(base64.b64decode(packed))
+            if len(signature) == self.num_perm:
+                self.add(story_id, signature)
+                restored += 1
+        return restored
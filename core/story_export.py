@@ -0,0 +1,82 @@
+"""
+Streaming Story Exporters
+
+Chunked CSV and JSONL encoders for transformation story records. Records are
+consumed lazily and emitted in bounded chunks, so exports of any size run in
+constant memory and can be written straight to a file or an HTTP response.
+
+CSV output follows RFC 4180 through the standard csv module: fields that
+contain commas, quotes or line breaks are quoted and embedded quotes doubled.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+CSV_HEADERS = ['story_id', 'ai_system_name', 'initial_state', 'final_state',
+               'category', 'quality', 'sustainability_score', 'submitted_at']
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+
+def _csv_row(record: Dict[str, Any]) -> list:
+    return [
+        record['story_id'],
+        record['ai_system_name'],
+        record['initial_state'],
+        record['final_state'],
+        record['transformation_category'],
+        record['transformation_quality'],
+        record['sustainability_score'],
+        record['submitted_at'],
+    ]
+
+
+def iter_csv_chunks(records: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> Iterator[str]:
+    """
+    Encode story records as CSV text, yielding one chunk per chunk_size rows.
+
+    The header is always emitted, even when there are no records.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADERS)
+
+    pending = 0
+    for record in records:
+        writer.writerow(_csv_row(record))
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    tail = buffer.getvalue()
+    if tail:
+        yield tail
+
+
+def iter_jsonl_chunks(records: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> Iterator[str]:
+    """Encode story records as JSON lines, yielding one chunk per chunk_size rows."""
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def iter_export_chunks(records: Iterable[Dict[str, Any]], format: str = 'csv',
+                       chunk_size: int = 1000) -> Iterator[str]:
+    """Dispatch to the chunked encoder for the requested format."""
+    format = format.lower()
+    if format == 'csv':
+        return iter_csv_chunks(records, chunk_size)
+    if format == 'jsonl':
+        return iter_jsonl_chunks(records, chunk_size)
+    raise ValueError(f"Unsupported export format: {format}")
@@ -0,0 +1,160 @@
+"""
+Secondary Indexes for Transformation Stories
+
+Time-ordered indexes used by the transformation tracker to answer filtered,
+newest-first queries without scanning or sorting the whole story store.
+
+Each index is a list of (submitted_at, story_id) keys kept in sorted order.
+Stories normally arrive with increasing timestamps, so inserts append at the
+end; fetching a page walks backwards from a bisected position and costs
+O(log n + page size) when a single filter is used.
+
+Cursors are opaque strings that encode the key of the last returned story.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+IndexKey = Tuple[datetime, str]
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """Encode an index key as a pagination cursor."""
+    submitted_at, story_id = key
+    return f"{submitted_at.isoformat()}|{story_id}"
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """Decode a pagination cursor produced by encode_cursor."""
+    try:
+        timestamp, story_id = cursor.split('|', 1)
+        return datetime.fromisoformat(timestamp), story_id
+    except ValueError:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+
+
+class StoryIndex:
+    """
+    Per-category, per-quality, per-AI-system and time-ordered story indexes.
+
+    The index stores only keys and the indexed attribute values; stories
+    themselves stay in the tracker.
+    """
+
+    def __init__(self):
+        self._timeline: List[IndexKey] = []
+        self._by_category: Dict[str, List[IndexKey]] = {}
+        self._by_quality: Dict[str, List[IndexKey]] = {}
+        self._by_system: Dict[str, List[IndexKey]] = {}
+        # story_id -> (key, category, quality, ai_system_name)
+        self._entries: Dict[str, Tuple[IndexKey, str, str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, story_id: str, submitted_at: datetime, category: str,
+            quality: str, ai_system_name: str):
+        """Index a story. Re-adding an indexed story replaces its entry."""
+        if story_id in self._entries:
+            self.remove(story_id)
+
+        key = (submitted_at, story_id)
+        self._entries[story_id] = (key, category, quality, ai_system_name)
+        for keys in (
+            self._timeline,
+            self._by_category.setdefault(category, []),
+            self._by_quality.setdefault(quality, []),
+            self._by_system.setdefault(ai_system_name, []),
+        ):
+            if not keys or keys[-1] < key:
+                keys.append(key)
+            else:
+                insort(keys, key)
+
+    def remove(self, story_id: str):
+        """Drop a story from all indexes."""
+        entry = self._entries.pop(story_id, None)
+        if entry is None:
+            return
+
+        key, category, quality, ai_system_name = entry
+        for keys in (
+            self._timeline,
+            self._by_category[category],
+            self._by_quality[quality],
+            self._by_system[ai_system_name],
+        ):
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+
+    def rebuild(self, entries: Iterable[Tuple[str, datetime, str, str, str]]):
+        """
+        Rebuild every index from (story_id, submitted_at, category, quality,
+        ai_system_name) tuples with one sort per index instead of n inserts.
+        """
+        self.__init__()
+        for story_id, submitted_at, category, quality, ai_system_name in entries:
+            key = (submitted_at, story_id)
+            self._entries[story_id] = (key, category, quality, ai_system_name)
+            self._timeline.append(key)
+            self._by_category.setdefault(category, []).append(key)
+            self._by_quality.setdefault(quality, []).append(key)
+            self._by_system.setdefault(ai_system_name, []).append(key)
+
+        for keys in (self._timeline, *self._by_category.values(),
+                     *self._by_quality.values(), *self._by_system.values()):
+            keys.sort()
+
+    def _select(self, category: Optional[str], quality: Optional[str],
+                ai_system_name: Optional[str]) -> List[IndexKey]:
+        """Pick the smallest index that covers the requested filters."""
+        candidates = [self._timeline]
+        if category is not None:
+            candidates.append(self._by_category.get(category, []))
+        if quality is not None:
+            candidates.append(self._by_quality.get(quality, []))
+        if ai_system_name is not None:
+            candidates.append(self._by_system.get(ai_system_name, []))
+        return min(candidates, key=len)
+
+    def _matches(self, story_id: str, category: Optional[str], quality: Optional[str],
+                 ai_system_name: Optional[str]) -> bool:
+        _, story_category, story_quality, story_system = self._entries[story_id]
+        return (
+            (category is None or story_category == category)
+            and (quality is None or story_quality == quality)
+            and (ai_system_name is None or story_system == ai_system_name)
+        )
+
+    def iter_newest(self, category: Optional[str] = None, quality: Optional[str] = None,
+                    ai_system_name: Optional[str] = None,
+                    before: Optional[IndexKey] = None) -> Iterator[IndexKey]:
+        """
+        Yield keys newest first, optionally strictly older than `before`.
+
+        The most selective matching index is walked; the remaining filters
+        are checked against the stored attribute values.
+        """
+        keys = self._select(category, quality, ai_system_name)
+        position = bisect_left(keys, before) if before is not None else len(keys)
+        for i in range(position - 1, -1, -1):
+            key = keys[i]
+            if self._matches(key[1], category, quality, ai_system_name):
+                yield key
+
+    def iter_oldest(self, category: Optional[str] = None, quality: Optional[str] = None,
+                    ai_system_name: Optional[str] = None, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None,
+                    after: Optional[IndexKey] = None) -> Iterator[IndexKey]:
+        """Yield keys oldest first with start <= submitted_at < end, optionally strictly newer than `after`."""
+        keys = self._select(category, quality, ai_system_name)
+        low = bisect_left(keys, (start, '')) if start is not None else 0
+        if after is not None:
+            low = max(low, bisect_right(keys, after))
+        high = bisect_left(keys, (end, '')) if end is not None else len(keys)
+        for i in range(low, high):
+            key = keys[i]
+            if self._matches(key[1], category, quality, ai_system_name):
+                yield key
@@ -0,0 +1,239 @@
+"""
+Asynchronous Story Ingestion
+
+Front end for web-facing story submission. Requests are queued and written
+behind by a single batching writer, so a submission costs one queue put and
+a share of a batched journal write instead of a synchronous write of its own.
+
+- Bounded queue: submit() waits for space (up to a timeout) and
+  try_submit() fails fast with IngestionQueueFull; pressure reports the fill
+  level so HTTP handlers can answer 429 before the queue is full
+- Batching writer: groups submissions until batch_size stories are waiting
+  or max_delay seconds have passed since the first one
+- Durable acknowledgement: a submission resolves with its story ID only
+  after TransformationImpactTracker.submit_stories has journaled the batch
+  and the journal has been fsynced (one fsync per batch); invalid stories
+  resolve with ValueError. With durable=False the acknowledgement only
+  means the batch reached the operating system: it survives a crash of the
+  process but not a power failure. Snapshot compaction runs after the
+  acknowledgements instead of in front of them
+
+Batches are written on one dedicated writer thread. The tracker serializes
+its own writers, so other threads (background assessment workers, the
+dashboard) may keep using it while an ingestor runs. Snapshots still pause
+the writer for a full rewrite, so latency-sensitive deployments should use
+a large tracker snapshot_interval (or ShardedStoryStorage) and let the
+journal absorb the load.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionQueueFull(Exception):
+    """Raised when the ingestion queue cannot accept more stories."""
+
+
+class AsyncStoryIngestor:
+    """Bounded write-behind queue in front of a TransformationImpactTracker."""
+
+    def __init__(self, tracker, max_queue: int = 10000, batch_size: int = 500,
+                 max_delay: float = 0.001, durable: bool = True):
+        """
+        Args:
+            tracker: TransformationImpactTracker that persists the stories
+            max_queue: Maximum number of queued, not yet persisted stories
+            batch_size: Maximum stories per persisted batch
+            max_delay: Seconds a batch waits for more stories after its first
+            durable: fsync every batch before acknowledging it
+        """
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+
+        self.tracker = tracker
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.durable = durable
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats: Dict[str, Any] = {
+            'accepted': 0,
+            'persisted': 0,
+            'rejected': 0,
+            'refused': 0,
+            'batches': 0,
+            'largest_batch': 0,
+            'write_seconds': 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._writer is not None and not self._writer.done()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def pressure(self) -> float:
+        """Queue fill level from 0.0 (empty) to 1.0 (full)."""
+        return self.queue_depth / self.max_queue
+
+    async def start(self):
+        """Start the batching writer on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='story-ingestor')
+        self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+
+    async def stop(self):
+        """Persist everything already queued, then stop the writer."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._writer
+        self._writer = None
+        self._executor.shutdown()
+        self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def _enqueue(self, story_data: Dict[str, Any]) -> asyncio.Future:
+        if not self.running:
+            raise RuntimeError("Ingestor is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((story_data, future))
+        self.stats['accepted'] += 1
+        return future
+
+    def try_submit(self, story_data: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a story without waiting.
+
+        Returns:
+            Future resolving to the story ID once persisted
+
+        Raises:
+            IngestionQueueFull: if the queue is full
+        """
+        try:
+            return self._enqueue(story_data)
+        except asyncio.QueueFull:
+            self.stats['refused'] += 1
+            raise IngestionQueueFull(f"Ingestion queue is full ({self.max_queue} stories)")
+
+    async def submit(self, story_data: Dict[str, Any], timeout: Optional[float] = None) -> str:
+        """
+        Queue a story and wait until it is persisted.
+
+        Args:
+            story_data: Story dictionary as accepted by submit_story
+            timeout: Seconds to wait for queue space; None waits indefinitely
+
+        Returns:
+            Persisted story ID
+
+        Raises:
+            IngestionQueueFull: if no space frees up within timeout
+            ValueError: if the story is invalid
+        """
+        try:
+            future = self._enqueue(story_data)
+        except asyncio.QueueFull:
+            # Sleep until the writer frees space instead of polling for it
+            future = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(self._queue.put((story_data, future)), timeout)
+            except asyncio.TimeoutError:
+                self.stats['refused'] += 1
+                raise IngestionQueueFull(f"Ingestion queue is full ({self.max_queue} stories)")
+            self.stats['accepted'] += 1
+        return await future
+
+    async def _next_batch(self) -> Tuple[List[Tuple[Dict[str, Any], asyncio.Future]], bool]:
+        """Wait for the first item, then gather more until size or time is up."""
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.batch_size:
+            remaining = deadline - loop.time()
+            try:
+                item = self._queue.get_nowait() if remaining <= 0 else \
+                    await asyncio.wait_for(self._queue.get(), remaining)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _persist(self, stories: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write one batch (runs on the writer thread)."""
+        summary = self.tracker.submit_stories(stories, batch_size=len(stories), defer_snapshot=True)
+        if self.durable and summary['submitted']:
+            self.tracker.sync()
+        return summary
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            try:
+                # Disk I/O runs off the event loop so submitters keep queueing
+                summary = await loop.run_in_executor(
+                    self._executor, self._persist, [story for story, _ in batch]
+                )
+            except Exception as e:
+                logger.error(f"Story batch of {len(batch)} failed to persist: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.stats['write_seconds'] += time.perf_counter() - started
+            self.stats['batches'] += 1
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+            self.stats['persisted'] += summary['submitted']
+            self.stats['rejected'] += summary['rejected']
+            self._resolve(batch, summary)
+
+            try:
+                await loop.run_in_executor(self._executor, self.tracker.snapshot_if_due)
+            except Exception as e:
+                # Stories are safe in the journal; compaction is retried later
+                logger.error(f"Deferred snapshot failed: {e}")
+
+    @staticmethod
+    def _resolve(batch, summary: Dict[str, Any]):
+        errors = {reject['index']: reject['error'] for reject in summary['rejects']}
+        story_ids = iter(summary['story_ids'])
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(ValueError(f"Invalid story data: {errors[index]}"))
+            else:
+                future.set_result(next(story_ids))
@@ -0,0 +1,239 @@
+"""
+Write-Ahead Journal for Transformation Story Storage
+
+Append-only event log used by the transformation tracker so that every story
+event costs a single line write instead of a full rewrite of the story files.
+Periodic snapshots compact the journal; on load the state is rebuilt from the
+latest snapshot plus the journal tail.
+
+Features:
+- One JSON line per event (submit, update, verification status change)
+- Optional fsync for power-loss durability
+- Tolerant replay that skips a torn final line after a crash
+- Incremental reads of events other processes appended (read_new)
+- Atomic file replacement helpers for snapshots
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """
+    Write text to path atomically.
+
+    The payload is written to a temporary file in the same directory and moved
+    into place with os.replace, so readers never observe a half-written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """Write JSON data to path atomically (see atomic_write_text)."""
+    # json.dumps without indent uses the C encoder; json.dump never does
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=False))
+
+
+class StoryJournal:
+    """
+    Append-only JSONL journal of story events.
+
+    Events are plain dictionaries; the journal does not interpret them. Replay
+    must be idempotent on the caller side because a crash between writing a
+    snapshot and truncating the journal leaves already-applied events behind.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._handle = None
+        self.event_count = 0
+        # Bytes in the journal, so callers can weigh it against a snapshot
+        self.size = os.path.getsize(path) if os.path.exists(path) else 0
+        # Bytes of the journal this instance has replayed, read or written
+        # itself; anything past it was appended by another writer
+        self.read_offset = 0
+
+    def _open(self):
+        if self._handle is None:
+            self._repair_tail()
+            self._handle = open(self.path, 'ab')
+        return self._handle
+
+    def _repair_tail(self) -> None:
+        """
+        Make sure the journal ends with a newline before appending to it.
+
+        A crash mid-write can leave a final line without its newline; the
+        next event would be glued onto it and lost on replay. A complete
+        event that only lacks the newline is kept, a torn one is cut off.
+        """
+        try:
+            f = open(self.path, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b'\n':
+                return
+
+            # Find the start of the unterminated final line
+            position = end
+            while position > 0:
+                step = min(8192, position)
+                f.seek(position - step)
+                block = f.read(step)
+                newline = block.rfind(b'\n')
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+
+            f.seek(position)
+            tail = f.read()
+            try:
+                json.loads(tail.decode('utf-8'))
+            except ValueError:
+                logger.warning(f"Truncating torn journal line at byte {position} of {self.path}")
+                f.truncate(position)
+            else:
+                f.write(b'\n')
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Append a single event and flush it to the operating system."""
+        self.append_many([event])
+
+    def append_many(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append several events with a single write and flush.
+
+        Returns:
+            Number of events written
+        """
+        lines = [json.dumps(event, ensure_ascii=False, separators=(',', ':')) for event in events]
+        if not lines:
+            return 0
+
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        handle = self._open()
+        handle.write(data)
+        handle.flush()
+        if self.fsync:
+            os.fsync(handle.fileno())
+
+        # Appends always land at the end of the file; if nobody else wrote
+        # since our last read, this write directly follows it
+        end = handle.tell()
+        if end - len(data) == self.read_offset:
+            self.read_offset = end
+        self.event_count += len(lines)
+        self.size += len(data)
+        return len(lines)
+
+    def sync(self) -> None:
+        """Force everything appended so far to stable storage."""
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Yield journaled events in write order."""
+        self.read_offset = 0
+        if not os.path.exists(self.path):
+            return
+
+        self.event_count = 0
+        self.size = os.path.getsize(self.path)
+        with open(self.path, 'rb') as f:
+            for line_number, line in enumerate(f, start=1):
+                if line.endswith(b'\n'):
+                    self.read_offset += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError as e:
+                    # A torn write can only affect the tail; skip it and keep going
+                    logger.warning(f"Skipping unreadable journal line {line_number}: {e}")
+                    continue
+                self.event_count += 1
+                yield event
+
+    def read_new(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Events appended past read_offset, typically by another process.
+
+        Only complete lines are consumed, so an append still in progress is
+        picked up by a later call.
+
+        Returns:
+            The new events in write order, or None when the journal is
+            shorter than read_offset (another writer compacted it), in which
+            case the caller must replay from its snapshot
+        """
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return None if self.read_offset else []
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end < self.read_offset:
+                return None
+            if end == self.read_offset:
+                return []
+            f.seek(self.read_offset)
+            data = f.read(end - self.read_offset)
+
+        complete = data.rfind(b'\n') + 1
+        events = []
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable journal line at byte {self.read_offset}: {e}")
+        self.read_offset += complete
+        self.event_count += len(events)
+        self.size = max(self.size, end)
+        return events
+
+    def reset(self) -> None:
+        """Truncate the journal after its events were folded into a snapshot."""
+        self.close()
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self.event_count = 0
+        self.size = 0
+        self.read_offset = 0
+
+    def close(self) -> None:
+        """Close the underlying file handle."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
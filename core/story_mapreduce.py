@@ -0,0 +1,113 @@
+"""
+Parallel Map-Reduce Story Analytics
+
+Rebuilds analytics over month-sharded story files (see ShardedStoryStorage)
+with a process pool:
+
+- map: each worker reads one shard and returns its partial aggregates
+  (counts, raw sustainability sum, monthly counts)
+- reduce: partials are merged exactly with merge_aggregates; averages and
+  top categories are derived only from the merged totals
+
+Shards are independent, so throughput scales with the number of worker
+processes until disk bandwidth becomes the limit.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .story_analytics import aggregate_records, analytics_from_aggregates, merge_aggregates
+from .story_models import TransformationAnalytics
+from .story_storage import ShardedStoryStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MapReduceResult:
+    """Merged analytics plus per-shard partials and throughput figures."""
+    analytics: TransformationAnalytics
+    aggregates: Dict[str, Any]
+    shard_aggregates: Dict[str, Dict[str, Any]]
+    workers: int
+    elapsed_seconds: float
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def aggregate_shard(path: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Map step: aggregate one JSONL shard file.
+
+    Returns:
+        (path, partial aggregates)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        records = (json.loads(line) for line in f if line.strip())
+        return path, aggregate_records(records)
+
+
+def shard_paths(shard_directory: str) -> List[str]:
+    """
+    Month shard files (YYYY-MM.jsonl) in a directory, oldest month first.
+
+    Other JSONL files, such as a journal kept in the same directory, are
+    not shards and are skipped.
+    """
+    return sorted(
+        os.path.join(shard_directory, name)
+        for name in os.listdir(shard_directory)
+        if ShardedStoryStorage.SHARD_PATTERN.match(name)
+    )
+
+
+def run_shard_analytics(shard_directory: str, workers: Optional[int] = None,
+                        paths: Optional[List[str]] = None) -> MapReduceResult:
+    """
+    Build analytics over every shard with a process pool.
+
+    Args:
+        shard_directory: Directory with YYYY-MM.jsonl shards
+        workers: Worker processes (defaults to the CPU count); 1 runs inline
+        paths: Explicit shard files to use instead of the whole directory
+
+    Returns:
+        MapReduceResult with merged analytics and throughput statistics
+    """
+    paths = list(paths) if paths is not None else shard_paths(shard_directory)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+
+    started = time.perf_counter()
+    if workers == 1:
+        partials = [aggregate_shard(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(aggregate_shard, paths))
+    merged = merge_aggregates(partial for _, partial in partials)
+    elapsed = time.perf_counter() - started
+
+    shard_aggregates = {
+        os.path.basename(path)[:-len('.jsonl')]: partial for path, partial in partials
+    }
+    stats = {
+        'shards': len(paths),
+        'stories': merged['total'] + merged['duplicates'],
+        'bytes': sum(os.path.getsize(path) for path in paths),
+        'stories_per_second': (merged['total'] + merged['duplicates']) / elapsed if elapsed > 0 else 0.0,
+        'shards_per_second': len(paths) / elapsed if elapsed > 0 else 0.0,
+    }
+    logger.info(f"Map-reduce analytics: {stats['stories']} stories in {stats['shards']} shards, "
+                f"{workers} workers, {elapsed:.2f}s ({stats['stories_per_second']:.0f} stories/s)")
+
+    return MapReduceResult(
+        analytics=analytics_from_aggregates(merged),
+        aggregates=merged,
+        shard_aggregates=shard_aggregates,
+        workers=workers,
+        elapsed_seconds=elapsed,
+        stats=stats,
+    )
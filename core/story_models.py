@@ -0,0 +1,93 @@
+"""
+Transformation Story Data Model
+
+Enums, dataclasses and constants shared by the transformation tracker and its
+storage, indexing and analytics helpers. Import them from
+core.transformation_tracker in application code.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from enum import Enum
+
+class TransformationCategory(Enum):
+    """Categories of human transformation."""
+    MENTAL_HEALTH = "mental_health"
+    RELATIONSHIPS = "relationships"
+    CAREER_PURPOSE = "career_purpose"
+    PERSONAL_GROWTH = "personal_growth"
+    PHYSICAL_HEALTH = "physical_health"
+    FINANCIAL_WELLBEING = "financial_wellbeing"
+    EDUCATION_LEARNING = "education_learning"
+    SPIRITUAL_GROWTH = "spiritual_growth"
+    COMMUNITY_SOCIAL = "community_social"
+    CREATIVE_EXPRESSION = "creative_expression"
+
+class TransformationQuality(Enum):
+    """Quality levels of transformation."""
+    MINIMAL = "minimal"      # Slight positive change
+    MODERATE = "moderate"    # Noticeable improvement
+    SIGNIFICANT = "significant"  # Major life improvement
+    TRANSFORMATIONAL = "transformational"  # Life-changing impact
+
+VERIFICATION_STATUSES = ("pending", "verified", "disputed")
+PRIVACY_LEVELS = ("anonymous", "pseudonymous", "identified")
+
+# Numerical value of each quality level, used for averaging
+QUALITY_SCORES = {
+    'minimal': 0.2,
+    'moderate': 0.5,
+    'significant': 0.8,
+    'transformational': 1.0
+}
+
+# Story fields covered by full-text search, in indexing order
+SEARCH_FIELDS = ('initial_state', 'final_state', 'story_summary', 'detailed_narrative')
+
+# Fields that may be changed through update_story
+UPDATABLE_FIELDS = {
+    'ai_system_name', 'initial_state', 'final_state', 'transformation_category',
+    'transformation_quality', 'sustainability_score', 'story_summary',
+    'detailed_narrative', 'quantitative_metrics', 'privacy_level', 'consent_given'
+}
+
+@dataclass
+class TransformationStory:
+    """Represents a single transformation story."""
+    story_id: str
+    ai_system_name: str
+    initial_state: str
+    final_state: str
+    transformation_category: TransformationCategory
+    transformation_quality: TransformationQuality
+    sustainability_score: float  # 0.0 to 1.0
+    story_summary: str
+    detailed_narrative: Optional[str] = None
+    quantitative_metrics: Optional[Dict[str, Any]] = None
+    submitted_at: datetime = None
+    last_updated: datetime = None
+    privacy_level: str = "anonymous"  # anonymous, pseudonymous, identified
+    consent_given: bool = True
+    verification_status: str = "pending"  # pending, verified, disputed
+    duplicate_of: Optional[str] = None  # likely original, flagged at ingestion
+
+    def __post_init__(self):
+        if self.submitted_at is None:
+            self.submitted_at = datetime.now()
+        if self.last_updated is None:
+            self.last_updated = datetime.now()
+
+@dataclass
+class TransformationAnalytics:
+    """Analytics data for transformation impact."""
+    total_stories: int
+    category_breakdown: Dict[str, int]
+    quality_distribution: Dict[str, int]
+    average_sustainability_score: float
+    average_transformation_quality_score: float
+    stories_per_month: Dict[str, int]
+    top_transformation_categories: List[str]
+    geographical_distribution: Optional[Dict[str, int]] = None
+    demographic_insights: Optional[Dict[str, Any]] = None
+    duplicate_stories: int = 0  # flagged near-duplicates, left out of the figures above
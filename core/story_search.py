@@ -0,0 +1,343 @@
+"""
+Full-Text Story Search
+
+Incrementally maintained inverted index over story text with BM25 ranking.
+
+- Postings are append-only arrays per term: document numbers in
+  array('I') and term frequencies in array('H'), about 6 bytes per posting
+- Queries are conjunctive: a story matches when it contains every query
+  term; quoted phrases must also appear as consecutive words
+- Category, quality and date filters use per-document columns kept next
+  to the postings
+- With NumPy installed, scoring is vectorized over zero-copy views of the
+  postings; otherwise the same scores are computed in pure Python
+
+Replacing or removing a story marks its old document number dead instead of
+rewriting postings. Document count and average length follow the live
+documents immediately; dead postings still count towards document
+frequencies until compact() rewrites the postings without them, which
+happens automatically once a quarter of the documents are dead (and on
+every tracker snapshot), so index size and IDF drift stay bounded.
+"""
+
+import importlib.util
+import math
+import re
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from .story_columns import CATEGORY_CODES, QUALITY_CODES, to_epoch_seconds
+
+# NumPy is imported on first use; it would otherwise dominate start-up time
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+_MAX_TF = 0xFFFF
+# Fraction of dead documents that triggers compaction
+DEFAULT_COMPACT_THRESHOLD = 0.25
+_CATEGORY_CODES = {category.value: code for code, category in enumerate(CATEGORY_CODES)}
+_QUALITY_CODES = {quality.value: code for code, quality in enumerate(QUALITY_CODES)}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of text."""
+    return _WORD.findall(text.lower())
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Split a query into plain terms and quoted phrases.
+
+    Returns:
+        (terms, phrases), each phrase being its list of tokens
+    """
+    terms: List[str] = []
+    phrases: List[List[str]] = []
+    for phrase, word in _QUERY_PART.findall(query):
+        tokens = tokenize(phrase or word)
+        if len(tokens) > 1 and phrase:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    return terms, phrases
+
+
+def _contains_phrase(tokens: List[str], phrase: List[str]) -> bool:
+    width = len(phrase)
+    first = phrase[0]
+    return any(
+        tokens[i] == first and tokens[i:i + width] == phrase
+        for i in range(len(tokens) - width + 1)
+    )
+
+
+class StorySearchIndex:
+    """Inverted index with BM25 ranking and attribute filters."""
+
+    def __init__(self, text_of: Callable[[str], str], k1: float = 1.2, b: float = 0.75,
+                 compact_threshold: float = DEFAULT_COMPACT_THRESHOLD):
+        """
+        Args:
+            text_of: Returns the current indexed text of a story ID; used to
+                verify phrase matches
+            k1, b: BM25 parameters
+            compact_threshold: Compact once this fraction of document
+                numbers is dead
+        """
+        self.text_of = text_of
+        self.k1 = k1
+        self.b = b
+        self.compact_threshold = compact_threshold
+        self._reset()
+
+    def _reset(self):
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        self.documents: Dict[str, int] = {}
+        self.story_ids: List[Optional[str]] = []
+        self.lengths = array('I')
+        self.alive = array('B')
+        self.category = array('B')
+        self.quality = array('B')
+        self.submitted_at = array('d')
+        # Token count of the live documents
+        self.total_length = 0
+        self.dead = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, story_id: str, text: str, category: str, quality: str, submitted_at: datetime):
+        """Index (or re-index) a story."""
+        self.remove(story_id)
+
+        doc = len(self.story_ids)
+        tokens = tokenize(text)
+        frequencies: Dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for term, tf in frequencies.items():
+            entry = self.postings.get(term)
+            if entry is None:
+                entry = self.postings[term] = (array('I'), array('H'))
+            entry[0].append(doc)
+            entry[1].append(min(tf, _MAX_TF))
+
+        self.documents[story_id] = doc
+        self.story_ids.append(story_id)
+        self.lengths.append(len(tokens))
+        self.alive.append(1)
+        self.category.append(_CATEGORY_CODES[category])
+        self.quality.append(_QUALITY_CODES[quality])
+        self.submitted_at.append(to_epoch_seconds(submitted_at))
+        self.total_length += len(tokens)
+
+    def remove(self, story_id: str):
+        """Drop a story from search results."""
+        doc = self.documents.pop(story_id, None)
+        if doc is None:
+            return
+        self.alive[doc] = 0
+        self.story_ids[doc] = None
+        self.total_length -= self.lengths[doc]
+        self.dead += 1
+        if self.dead > self.compact_threshold * len(self.story_ids):
+            self.compact()
+
+    def compact(self):
+        """Rewrite postings and document columns without dead documents."""
+        if not self.dead:
+            return
+
+        # Renumbering keeps the order, so postings stay sorted
+        alive = self.alive
+        numbers = array('i', [-1]) * len(alive)
+        live = 0
+        for doc in range(len(alive)):
+            if alive[doc]:
+                numbers[doc] = live
+                live += 1
+
+        postings = {}
+        for term, (docs, tfs) in self.postings.items():
+            kept_docs, kept_tfs = array('I'), array('H')
+            for doc, tf in zip(docs, tfs):
+                if alive[doc]:
+                    kept_docs.append(numbers[doc])
+                    kept_tfs.append(tf)
+            if kept_docs:
+                postings[term] = (kept_docs, kept_tfs)
+        self.postings = postings
+
+        for name in ('lengths', 'category', 'quality', 'submitted_at'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (value for doc, value in enumerate(column) if alive[doc])))
+        self.story_ids = [story_id for story_id in self.story_ids if story_id is not None]
+        self.documents = {story_id: doc for doc, story_id in enumerate(self.story_ids)}
+        self.alive = array('B', [1]) * live
+        logger.debug(f"Compacted search index: dropped {self.dead} dead documents, {live} remain")
+        self.dead = 0
+
+    def rebuild(self, entries: Iterable[Tuple[str, str, str, str, datetime]]):
+        """Replace the index with entries in add() argument order."""
+        self._reset()
+        for entry in entries:
+            self.add(*entry)
+
+    def _idf(self, document_frequency: int) -> float:
+        # Dead postings may still be counted in document_frequency
+        total = max(len(self.documents), document_frequency)
+        return math.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def search(self, query: str, category: Optional[str] = None, quality: Optional[str] = None,
+               start: Optional[datetime] = None, end: Optional[datetime] = None,
+               limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Find stories containing every query term and phrase.
+
+        Args:
+            query: Words and "quoted phrases"
+            category, quality: Optional equality filters (enum values)
+            start, end: Optional submission date range (end exclusive)
+            limit: Maximum number of results
+
+        Returns:
+            (story_id, BM25 score) pairs, best first
+        """
+        terms, phrases = parse_query(query)
+        required = list(dict.fromkeys(terms + [token for phrase in phrases for token in phrase]))
+        if not required or limit < 1:
+            return []
+
+        entries = []
+        for term in required:
+            entry = self.postings.get(term)
+            if entry is None:
+                return []
+            entries.append((term, entry))
+        # Intersect starting from the rarest term
+        entries.sort(key=lambda item: len(item[1][0]))
+
+        filters = (
+            _CATEGORY_CODES[category] if category is not None else None,
+            _QUALITY_CODES[quality] if quality is not None else None,
+            to_epoch_seconds(start) if start is not None else None,
+            to_epoch_seconds(end) if end is not None else None,
+        )
+        # Phrase checks may drop results, so rank every match in that case
+        top = None if phrases else limit
+        if NUMPY_AVAILABLE:
+            ranked = self._score_numpy(entries, filters, top)
+        else:
+            ranked = self._score_python(entries, filters)
+
+        results = []
+        for doc, score in ranked:
+            story_id = self.story_ids[doc]
+            if phrases:
+                tokens = tokenize(self.text_of(story_id))
+                if not all(_contains_phrase(tokens, phrase) for phrase in phrases):
+                    continue
+            results.append((story_id, score))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _matches_filters(self, doc: int, filters) -> bool:
+        category, quality, start, end = filters
+        if not self.alive[doc]:
+            return False
+        if category is not None and self.category[doc] != category:
+            return False
+        if quality is not None and self.quality[doc] != quality:
+            return False
+        submitted_at = self.submitted_at[doc]
+        if start is not None and submitted_at < start:
+            return False
+        if end is not None and submitted_at >= end:
+            return False
+        return True
+
+    def _average_length(self) -> float:
+        return self.total_length / len(self.documents) if self.documents else 1.0
+
+    def _score_python(self, entries, filters) -> Iterable[Tuple[int, float]]:
+        average_length = self._average_length()
+        k1, b = self.k1, self.b
+
+        candidates = None
+        for _, (docs, tfs) in entries:
+            present = dict(zip(docs, tfs))
+            if candidates is None:
+                candidates = {
+                    doc: [tf] for doc, tf in present.items()
+                    if self._matches_filters(doc, filters)
+                }
+            else:
+                candidates = {
+                    doc: tf_list + [present[doc]]
+                    for doc, tf_list in candidates.items() if doc in present
+                }
+            if not candidates:
+                return []
+
+        idfs = [self._idf(len(docs)) for _, (docs, _) in entries]
+        scores = []
+        for doc, tf_list in candidates.items():
+            norm = k1 * (1 - b + b * self.lengths[doc] / average_length)
+            scores.append((doc, sum(idf * tf * (k1 + 1) / (tf + norm) for idf, tf in zip(idfs, tf_list))))
+        scores.sort(key=lambda item: (-item[1], item[0]))
+        return scores
+
+    def _score_numpy(self, entries, filters, top: Optional[int]) -> Iterable[Tuple[int, float]]:
+        import numpy as np
+
+        # Views over the index arrays must not outlive this call
+        average_length = self._average_length()
+        k1, b = self.k1, self.b
+
+        docs = np.frombuffer(entries[0][1][0], dtype=np.uint32)
+        for _, (term_docs, _) in entries[1:]:
+            docs = np.intersect1d(docs, np.frombuffer(term_docs, dtype=np.uint32), assume_unique=True)
+            if not docs.size:
+                return []
+
+        category, quality, start, end = filters
+        keep = np.frombuffer(self.alive, dtype=np.uint8)[docs] == 1
+        if category is not None:
+            keep &= np.frombuffer(self.category, dtype=np.uint8)[docs] == category
+        if quality is not None:
+            keep &= np.frombuffer(self.quality, dtype=np.uint8)[docs] == quality
+        if start is not None or end is not None:
+            submitted_at = np.frombuffer(self.submitted_at, dtype=np.float64)[docs]
+            if start is not None:
+                keep &= submitted_at >= start
+            if end is not None:
+                keep &= submitted_at < end
+        docs = docs[keep]
+        if not docs.size:
+            return []
+
+        lengths = np.frombuffer(self.lengths, dtype=np.uint32)[docs].astype(np.float64)
+        norm = k1 * (1 - b + b * lengths / average_length)
+        scores = np.zeros(docs.size, dtype=np.float64)
+        for _, (term_docs, term_tfs) in entries:
+            term_docs = np.frombuffer(term_docs, dtype=np.uint32)
+            tf = np.frombuffer(term_tfs, dtype=np.uint16)[np.searchsorted(term_docs, docs)]
+            scores += self._idf(term_docs.size) * tf * (k1 + 1) / (tf + norm)
+
+        if top is not None and docs.size > top:
+            best = np.argpartition(-scores, top - 1)[:top]
+            # Keep every document tied with the cut-off score so ties resolve
+            # the same way as in the pure Python ranking
+            cutoff = scores[best].min()
+            best = np.flatnonzero(scores >= cutoff)
+            docs, scores = docs[best], scores[best]
+
+        # Stable order for ties: best score, then oldest document
+        order = np.lexsort((docs, -scores))
+        return zip(docs[order].tolist(), scores[order].tolist())
@@ -0,0 +1,872 @@
+"""
+Storage Backends for Transformation Stories
+
+Pluggable persistence layer behind TransformationImpactTracker. The tracker
+describes every change as an event dictionary:
+
+- {'op': 'submit', 'story': record}
+- {'op': 'update', 'story': record}
+- {'op': 'verify', 'story_id': ..., 'verification_status': ..., 'last_updated': ...,
+   'submitted_at': ...}
+
+where a record is the JSON-serializable form of a TransformationStory.
+Backends persist those events and replay the stored state as events on load.
+Derived indexes (e.g. duplicate-detection signatures) can be stored next to
+the stories with save_index()/load_index().
+
+Backends:
+- JSONStoryStorage: snapshot files plus write-ahead journal (default)
+- ShardedStoryStorage: one JSONL file per submission month with precomputed
+  per-shard aggregates; snapshots only rewrite changed months and start-up
+  can load just the most recent shards
+- SQLiteStoryStorage: WAL-mode SQLite database with indexed columns, FTS5
+  text search and SQL aggregates, safe to share between processes; the
+  tracker queries it instead of loading every story into memory
+"""
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from collections.abc import MutableMapping, ValuesView
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+from .story_analytics import aggregate_records, empty_aggregates, merge_aggregates
+from .story_journal import StoryJournal, atomic_write_json, atomic_write_text
+from .story_models import SEARCH_FIELDS
+from .story_search import parse_query
+
+logger = logging.getLogger(__name__)
+
+
+class StoryStorage:
+    """Base class for story persistence backends."""
+
+    # Backends that answer story lookups, pages and searches themselves (see
+    # SQLiteStoryStorage); the tracker then keeps no stories in memory
+    queryable = False
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        """Yield events that rebuild the stored state when applied in order."""
+        raise NotImplementedError
+
+    def append(self, events: List[Dict[str, Any]]) -> None:
+        """Durably persist a batch of events."""
+        raise NotImplementedError
+
+    def sync(self) -> None:
+        """Force appended events to stable storage (one fsync per call)."""
+
+    def snapshot_due(self) -> bool:
+        """Whether the tracker should call snapshot() after the last append."""
+        return False
+
+    def snapshot(self, records: Iterable[Dict[str, Any]], analytics: Dict[str, Any]) -> None:
+        """Compact persisted state. records yields every current story record."""
+
+    def aggregate_analytics(self, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Compute raw analytics aggregates inside the backend.
+
+        Args:
+            start, end: Optional submission date range (end exclusive)
+
+        Returns None when the backend cannot aggregate; otherwise a dict with
+        total, category_counts, quality_counts, average_sustainability and
+        monthly_counts of the original stories, plus the number of
+        near-duplicates in duplicates.
+        """
+        return None
+
+    def change_marker(self) -> Optional[Any]:
+        """
+        Cheap value that moves whenever the stored state may have changed.
+
+        Returns None for backends that are only written through this
+        instance, whose in-memory state is then always current.
+        """
+        return None
+
+    def read_changes(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Events other writers stored since this instance last loaded, appended
+        or read changes.
+
+        Returns None when the stored state was compacted by another writer,
+        in which case the caller must load() it again from scratch.
+        """
+        return []
+
+    def load_index(self, name: str) -> Optional[Any]:
+        """Return the JSON data last saved under name, or None."""
+        return None
+
+    def save_index(self, name: str, data: Any) -> None:
+        """Persist JSON-serializable derived index data under name."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class JSONStoryStorage(StoryStorage):
+    """
+    stories.json / analytics.json snapshots with an append-only journal.
+
+    Every event costs one journal line. The journal is folded into
+    atomically replaced snapshot files once it holds at least
+    snapshot_interval events and has grown to snapshot_ratio times the size
+    of the stored stories, so the cost of rewriting them is spread over a
+    number of events proportional to the store and stays constant per event.
+    Events other processes append to the same journal are picked up with
+    read_changes() without re-reading what was already seen.
+    """
+
+    def __init__(self, data_directory: str, snapshot_interval: int = 1000, fsync: bool = False,
+                 snapshot_ratio: float = 0.5):
+        """
+        Args:
+            data_directory: Directory holding snapshots, journal and indexes
+            snapshot_interval: Minimum journaled events between snapshots
+            fsync: Force every journal write to stable storage
+            snapshot_ratio: Journal size, relative to the stored stories,
+                at which a snapshot becomes due
+        """
+        self.data_directory = data_directory
+        self.stories_file = os.path.join(data_directory, "stories.json")
+        self.analytics_file = os.path.join(data_directory, "analytics.json")
+        self.journal_file = os.path.join(data_directory, "stories.journal.jsonl")
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_ratio = snapshot_ratio
+
+        os.makedirs(data_directory, exist_ok=True)
+        self.journal = StoryJournal(self.journal_file, fsync=fsync)
+        self.snapshot_size = self._stored_size()
+        # Identity of the last snapshot loaded or written; another writer's
+        # snapshot replaces analytics.json, which changes it
+        self.snapshot_state = self._snapshot_state()
+
+    def _snapshot_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.analytics_file)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _stored_size(self) -> int:
+        """Size of the snapshot files holding the stories."""
+        return os.path.getsize(self.stories_file) if os.path.exists(self.stories_file) else 0
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        self.snapshot_state = self._snapshot_state()
+        if os.path.exists(self.stories_file):
+            try:
+                with open(self.stories_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading stories: {e}")
+            else:
+                for record in data.get('stories', []):
+                    yield {'op': 'submit', 'story': record}
+
+        # Events written after the snapshot
+        yield from self.journal.replay()
+
+    def append(self, events: List[Dict[str, Any]]) -> None:
+        self.journal.append_many(events)
+
+    def change_marker(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        try:
+            journal_size = os.path.getsize(self.journal_file)
+        except OSError:
+            journal_size = 0
+        return self._snapshot_state(), journal_size
+
+    def read_changes(self) -> Optional[List[Dict[str, Any]]]:
+        if self._snapshot_state() != self.snapshot_state:
+            return None
+        return self.journal.read_new()
+
+    def sync(self) -> None:
+        self.journal.sync()
+
+    def snapshot_due(self) -> bool:
+        return (self.journal.event_count >= self.snapshot_interval
+                and self.journal.size >= self.snapshot_ratio * self.snapshot_size)
+
+    def snapshot(self, records: Iterable[Dict[str, Any]], analytics: Dict[str, Any]) -> None:
+        """
+        Write both snapshot files atomically, then truncate the journal.
+
+        Replaying journal leftovers after a crash in between is harmless
+        because every event is idempotent.
+        """
+        atomic_write_json(self.stories_file, {'stories': list(records)})
+        atomic_write_json(self.analytics_file, analytics, indent=2)
+        self.journal.reset()
+        self.snapshot_size = self._stored_size()
+        self.snapshot_state = self._snapshot_state()
+
+    def _index_file(self, name: str) -> str:
+        return os.path.join(self.data_directory, f"{name}.index.json")
+
+    def load_index(self, name: str) -> Optional[Any]:
+        path = self._index_file(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading {name} index: {e}")
+            return None
+
+    def save_index(self, name: str, data: Any) -> None:
+        atomic_write_json(self._index_file(name), data)
+
+    def close(self) -> None:
+        self.journal.close()
+
+
+class ShardedStoryStorage(JSONStoryStorage):
+    """
+    Month-sharded story files with per-shard aggregates.
+
+    Layout under data_directory:
+    - stories/YYYY-MM.jsonl: one record per line for that submission month
+    - stories/YYYY-MM.aggregates.json: raw aggregates of the shard
+    - stories.journal.jsonl, analytics.json and index files as for
+      JSONStoryStorage
+
+    Records of months changed since start-up are kept in memory; a snapshot
+    rewrites only the months changed since the previous snapshot, so older
+    shards are written once and then never touched. An existing stories.json
+    is migrated into shards by the first snapshot.
+    """
+
+    SHARD_PATTERN = re.compile(r"^(\d{4}-\d{2})\.jsonl$")
+
+    def __init__(self, data_directory: str, snapshot_interval: int = 1000, fsync: bool = False,
+                 recent_months: Optional[int] = None, snapshot_ratio: float = 0.5):
+        """
+        Args:
+            data_directory: Directory holding shards, journal and indexes
+            snapshot_interval: Minimum journaled events between snapshots
+            fsync: Force every journal write to stable storage
+            snapshot_ratio: Journal size, relative to the shards, at which
+                a snapshot becomes due
+            recent_months: Only load stories from this many most recent
+                shards (None loads all). Aggregates still cover every shard;
+                stories in older shards stay on disk and are not returned by
+                load().
+        """
+        self.shard_directory = os.path.join(data_directory, "stories")
+        super().__init__(data_directory, snapshot_interval=snapshot_interval, fsync=fsync,
+                         snapshot_ratio=snapshot_ratio)
+        self.recent_months = recent_months
+        os.makedirs(self.shard_directory, exist_ok=True)
+
+        # Aggregates of every shard on disk, month -> aggregates
+        self.shard_aggregates: Dict[str, Dict[str, Any]] = {}
+        for month in self.shard_months():
+            self.shard_aggregates[month] = self._read_shard_aggregates(month)
+
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty_months = set()
+        self._loaded = False
+
+    def shard_path(self, month: str) -> str:
+        return os.path.join(self.shard_directory, f"{month}.jsonl")
+
+    def _aggregates_path(self, month: str) -> str:
+        return os.path.join(self.shard_directory, f"{month}.aggregates.json")
+
+    def _stored_size(self) -> int:
+        if not os.path.isdir(self.shard_directory):
+            return super()._stored_size()
+        return super()._stored_size() + sum(
+            os.path.getsize(self.shard_path(month)) for month in self.shard_months()
+        )
+
+    def shard_months(self) -> List[str]:
+        """Months that have a shard on disk, oldest first."""
+        months = []
+        for name in os.listdir(self.shard_directory):
+            match = self.SHARD_PATTERN.match(name)
+            if match:
+                months.append(match.group(1))
+        return sorted(months)
+
+    def iter_shard(self, month: str) -> Iterator[Dict[str, Any]]:
+        """Yield the records stored in one shard."""
+        path = self.shard_path(month)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _read_shard_aggregates(self, month: str) -> Dict[str, Any]:
+        try:
+            with open(self._aggregates_path(month), 'r', encoding='utf-8') as f:
+                aggregates = json.load(f)
+            # Aggregates written before duplicates were counted separately include them
+            if 'duplicates' in aggregates:
+                return aggregates
+        except (OSError, ValueError):
+            pass
+        logger.warning(f"Recomputing aggregates of story shard {month}")
+        return aggregate_records(self.iter_shard(month))
+
+    def _month_records(self, month: str) -> Dict[str, Dict[str, Any]]:
+        """In-memory records of a month, read from its shard on first use."""
+        records = self._records.get(month)
+        if records is None:
+            records = {record['story_id']: record for record in self.iter_shard(month)}
+            self._records[month] = records
+        return records
+
+    def _find_month(self, story_id: str) -> Optional[str]:
+        for month, records in self._records.items():
+            if story_id in records:
+                return month
+        # Journals written before verify events carried submitted_at
+        for month in reversed(self.shard_months()):
+            if story_id in self._month_records(month):
+                return month
+        return None
+
+    def _track(self, event: Dict[str, Any]):
+        """Apply an event to the in-memory records of its month."""
+        if event['op'] in ('submit', 'update'):
+            record = event['story']
+            month = record['submitted_at'][:7]
+            self._month_records(month)[record['story_id']] = record
+        elif event['op'] == 'verify':
+            submitted_at = event.get('submitted_at')
+            month = submitted_at[:7] if submitted_at else self._find_month(event['story_id'])
+            record = self._month_records(month).get(event['story_id']) if month else None
+            if record is None:
+                return
+            record['verification_status'] = event['verification_status']
+            record['last_updated'] = event['last_updated']
+        else:
+            raise ValueError(f"Unknown story event: {event['op']}")
+        self._dirty_months.add(month)
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        if self._loaded:
+            # Loading again after another writer's snapshot: start from disk
+            self._records = {}
+            self._dirty_months = set()
+            self.shard_aggregates = {month: self._read_shard_aggregates(month) for month in self.shard_months()}
+        self._loaded = True
+
+        self.snapshot_state = self._snapshot_state()
+        months = self.shard_months()
+        if not months and os.path.exists(self.stories_file):
+            # Legacy single-file snapshot; the next snapshot shards it
+            for event in super().load():
+                self._track(event)
+                yield event
+            return
+
+        if self.recent_months is not None:
+            months = months[-self.recent_months:] if self.recent_months > 0 else []
+        for month in months:
+            for record in self.iter_shard(month):
+                yield {'op': 'submit', 'story': record}
+
+        for event in self.journal.replay():
+            self._track(event)
+            yield event
+
+    def append(self, events: List[Dict[str, Any]]) -> None:
+        self.journal.append_many(events)
+        for event in events:
+            self._track(event)
+
+    def read_changes(self) -> Optional[List[Dict[str, Any]]]:
+        events = super().read_changes()
+        for event in events or ():
+            self._track(event)
+        return events
+
+    def snapshot(self, records: Iterable[Dict[str, Any]], analytics: Dict[str, Any]) -> None:
+        """
+        Rewrite changed shards and their aggregates, then truncate the journal.
+
+        records is not used: the storage already holds every changed month.
+        """
+        for month in sorted(self._dirty_months):
+            month_records = list(self._records[month].values())
+            atomic_write_text(self.shard_path(month), "".join(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in month_records
+            ))
+            aggregates = aggregate_records(month_records)
+            atomic_write_json(self._aggregates_path(month), aggregates)
+            self.shard_aggregates[month] = aggregates
+
+        atomic_write_json(self.analytics_file, analytics, indent=2)
+        if os.path.exists(self.stories_file):
+            os.replace(self.stories_file, self.stories_file + ".migrated")
+        self.journal.reset()
+        self._dirty_months.clear()
+        self.snapshot_size = self._stored_size()
+        self.snapshot_state = self._snapshot_state()
+
+    def rebuild_aggregates(self, workers: Optional[int] = None):
+        """
+        Recompute every shard's aggregates file in parallel.
+
+        Args:
+            workers: Worker processes for the map-reduce run
+
+        Returns:
+            MapReduceResult of the run (merged analytics and throughput)
+        """
+        # Process-pool machinery is only needed here, so it is not imported up front
+        from .story_mapreduce import run_shard_analytics
+
+        result = run_shard_analytics(self.shard_directory, workers=workers)
+        for month, aggregates in result.shard_aggregates.items():
+            atomic_write_json(self._aggregates_path(month), aggregates)
+            self.shard_aggregates[month] = aggregates
+        return result
+
+    def _aggregates_of(self, month: str) -> Dict[str, Any]:
+        if month in self._dirty_months:
+            return aggregate_records(self._records[month].values())
+        return self.shard_aggregates.get(month) or empty_aggregates()
+
+    def aggregate_analytics(self, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """Merge per-shard aggregates; only months cut by the range are scanned."""
+        months = sorted(set(self.shard_aggregates) | self._dirty_months)
+
+        parts = []
+        for month in months:
+            month_start = datetime.strptime(month, "%Y-%m")
+            month_end = datetime(month_start.year + month_start.month // 12,
+                                 month_start.month % 12 + 1, 1)
+            if (start is not None and month_end <= start) or (end is not None and month_start >= end):
+                continue
+            if (start is None or start <= month_start) and (end is None or month_end <= end):
+                parts.append(self._aggregates_of(month))
+                continue
+
+            if month in self._records:
+                month_records = self._records[month].values()
+            else:
+                month_records = self.iter_shard(month)
+            parts.append(aggregate_records(
+                record for record in month_records
+                if (start is None or datetime.fromisoformat(record['submitted_at']) >= start)
+                and (end is None or datetime.fromisoformat(record['submitted_at']) < end)
+            ))
+        return merge_aggregates(parts)
+
+
+class StoredStories(MutableMapping):
+    """
+    Dict-like view of the stories held by a SQLiteStoryStorage.
+
+    Lookups are keyed SELECTs and iteration streams rows, so the tracker
+    keeps no copy of the stories. Stories assigned to the view stay visible
+    from memory until the storage has appended their events.
+    """
+
+    def __init__(self, storage: "SQLiteStoryStorage", decode: Callable[[Dict[str, Any]], Any]):
+        self._storage = storage
+        self._decode = decode
+
+    def __getitem__(self, story_id: str):
+        story = self._storage.pending.get(story_id)
+        if story is not None:
+            return story
+        record = self._storage.get_record(story_id)
+        if record is None:
+            raise KeyError(story_id)
+        return self._decode(record)
+
+    def __setitem__(self, story_id: str, story) -> None:
+        self._storage.pending[story_id] = story
+
+    def __delitem__(self, story_id: str) -> None:
+        pending = self._storage.pending.pop(story_id, None)
+        if not self._storage.delete_record(story_id) and pending is None:
+            raise KeyError(story_id)
+
+    def __contains__(self, story_id) -> bool:
+        return story_id in self._storage.pending or self._storage.get_record(story_id) is not None
+
+    def __len__(self) -> int:
+        unsaved = sum(1 for story_id in list(self._storage.pending)
+                      if self._storage.get_record(story_id) is None)
+        return self._storage.count() + unsaved
+
+    def __iter__(self) -> Iterator[str]:
+        for story in self.values():
+            yield story.story_id
+
+    def values(self) -> ValuesView:
+        return _StoredValues(self)
+
+    def iter_values(self) -> Iterator[Any]:
+        """Stream every story oldest first, preferring unsaved assignments."""
+        pending = dict(self._storage.pending)
+        for record in self._storage.iter_records():
+            story = pending.pop(record['story_id'], None)
+            yield story if story is not None else self._decode(record)
+        yield from pending.values()
+
+
+class _StoredValues(ValuesView):
+    def __iter__(self):
+        return self._mapping.iter_values()
+
+
+class SQLiteStoryStorage(StoryStorage):
+    """
+    SQLite backend in WAL mode.
+
+    Filter columns are stored alongside the full JSON record and indexed, and
+    story text is indexed with FTS5 when SQLite provides it. The tracker
+    answers lookups, paging, filters and searches with queries instead of
+    loading the stories, so the store may be larger than memory and other
+    processes can query and aggregate it directly with query_records() and
+    aggregate_analytics().
+    """
+
+    queryable = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS stories (
+            story_id TEXT PRIMARY KEY,
+            ai_system_name TEXT NOT NULL,
+            transformation_category TEXT NOT NULL,
+            transformation_quality TEXT NOT NULL,
+            sustainability_score REAL NOT NULL,
+            submitted_at TEXT NOT NULL,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_stories_category ON stories (transformation_category, submitted_at);
+        CREATE INDEX IF NOT EXISTS idx_stories_quality ON stories (transformation_quality, submitted_at);
+        CREATE INDEX IF NOT EXISTS idx_stories_system ON stories (ai_system_name, submitted_at);
+        CREATE INDEX IF NOT EXISTS idx_stories_submitted ON stories (submitted_at);
+        CREATE TABLE IF NOT EXISTS story_indexes (
+            name TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+    """
+
+    # Stories flagged as near-duplicates, which aggregates count separately
+    DUPLICATE = "json_extract(record, '$.duplicate_of') IS NOT NULL"
+
+    # Row ids of stories_fts are the row ids of stories
+    FULL_TEXT_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS stories_fts USING fts5(text)"
+
+    # Upserts keep the row id, which links a story to its full-text row
+    UPSERT = (
+        "INSERT INTO stories VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (story_id) DO UPDATE SET "
+        "ai_system_name = excluded.ai_system_name, "
+        "transformation_category = excluded.transformation_category, "
+        "transformation_quality = excluded.transformation_quality, "
+        "sustainability_score = excluded.sustainability_score, "
+        "submitted_at = excluded.submitted_at, record = excluded.record"
+    )
+
+    def __init__(self, database_path: str, fsync: bool = False, timeout: float = 30.0):
+        """
+        Args:
+            database_path: Path of the SQLite database file
+            fsync: Use synchronous=FULL instead of NORMAL
+            timeout: Seconds to wait for locks held by other processes
+        """
+        self.database_path = database_path
+        directory = os.path.dirname(os.path.abspath(database_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(database_path, timeout=timeout, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+        self.connection.executescript(self.SCHEMA)
+
+        # Stories assigned through a StoredStories view whose events are not appended yet
+        self.pending: Dict[str, Any] = {}
+
+        try:
+            self.connection.execute(self.FULL_TEXT_SCHEMA)
+            self.full_text = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable, searching in memory instead: {e}")
+            self.full_text = False
+        if self.full_text and self.load_index('full_text') is None:
+            self._rebuild_full_text()
+
+    @staticmethod
+    def _row(record: Dict[str, Any]) -> tuple:
+        return (
+            record['story_id'],
+            record['ai_system_name'],
+            record['transformation_category'],
+            record['transformation_quality'],
+            float(record['sustainability_score']),
+            record['submitted_at'],
+            json.dumps(record, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _search_text(record: Dict[str, Any]) -> str:
+        return " ".join(filter(None, (record.get(field) for field in SEARCH_FIELDS)))
+
+    def _rebuild_full_text(self) -> None:
+        """Index the text of stories written before full-text search existed."""
+        with self.connection:
+            self.connection.execute("DELETE FROM stories_fts")
+            rows = self.connection.execute("SELECT rowid, record FROM stories")
+            self.connection.executemany(
+                "INSERT INTO stories_fts (rowid, text) VALUES (?, ?)",
+                ((rowid, self._search_text(json.loads(record))) for rowid, record in rows)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO story_indexes VALUES ('full_text', '1')"
+            )
+
+    def stories_view(self, decode: Callable[[Dict[str, Any]], Any]) -> StoredStories:
+        """Dict-like view of the stored stories, decoding records with decode."""
+        return StoredStories(self, decode)
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        for record in self.iter_records():
+            yield {'op': 'submit', 'story': record}
+
+    def append(self, events: List[Dict[str, Any]]) -> None:
+        upserts = []
+        verifications = []
+        for event in events:
+            if event['op'] in ('submit', 'update'):
+                upserts.append(event['story'])
+            elif event['op'] == 'verify':
+                verifications.append((
+                    event['verification_status'], event['last_updated'], event['story_id']
+                ))
+            else:
+                raise ValueError(f"Unknown story event: {event['op']}")
+
+        with self.connection:
+            if upserts:
+                self.connection.executemany(self.UPSERT, [self._row(record) for record in upserts])
+                if self.full_text:
+                    self.connection.executemany(
+                        "DELETE FROM stories_fts WHERE rowid = (SELECT rowid FROM stories WHERE story_id = ?)",
+                        [(record['story_id'],) for record in upserts]
+                    )
+                    self.connection.executemany(
+                        "INSERT INTO stories_fts (rowid, text) SELECT rowid, ? FROM stories WHERE story_id = ?",
+                        [(self._search_text(record), record['story_id']) for record in upserts]
+                    )
+            if verifications:
+                self.connection.executemany(
+                    "UPDATE stories SET record = json_set(record, "
+                    "'$.verification_status', ?, '$.last_updated', ?) WHERE story_id = ?",
+                    verifications
+                )
+
+        for record in upserts:
+            self.pending.pop(record['story_id'], None)
+        for _, _, story_id in verifications:
+            self.pending.pop(story_id, None)
+
+    def sync(self) -> None:
+        # With synchronous=NORMAL commits reach the WAL without an fsync; a
+        # full checkpoint syncs the WAL and the database file
+        self.connection.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def snapshot(self, records: Iterable[Dict[str, Any]], analytics: Dict[str, Any]) -> None:
+        # Rows are already current; just fold the WAL back into the database
+        self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def change_marker(self) -> int:
+        # Changes only when another connection (or process) commits, so the
+        # tracker's own writes never look like outside changes
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_record(self, story_id: str) -> Optional[Dict[str, Any]]:
+        """Record of one story, or None."""
+        row = self.connection.execute(
+            "SELECT record FROM stories WHERE story_id = ?", (story_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete_record(self, story_id: str) -> bool:
+        """Delete one story; returns whether it existed."""
+        with self.connection:
+            if self.full_text:
+                self.connection.execute(
+                    "DELETE FROM stories_fts WHERE rowid = (SELECT rowid FROM stories WHERE story_id = ?)",
+                    (story_id,)
+                )
+            return self.connection.execute(
+                "DELETE FROM stories WHERE story_id = ?", (story_id,)
+            ).rowcount > 0
+
+    def count(self) -> int:
+        """Number of stored stories."""
+        return self.connection.execute("SELECT COUNT(*) FROM stories").fetchone()[0]
+
+    @staticmethod
+    def _filters(category: Optional[str] = None, quality: Optional[str] = None,
+                 ai_system_name: Optional[str] = None, start: Optional[datetime] = None,
+                 end: Optional[datetime] = None, table: str = "stories") -> Tuple[List[str], List[Any]]:
+        """SQL conditions and parameters for the common story filters."""
+        clauses = []
+        params: List[Any] = []
+        for column, value in (
+            ('transformation_category', category),
+            ('transformation_quality', quality),
+            ('ai_system_name', ai_system_name),
+        ):
+            if value is not None:
+                clauses.append(f"{table}.{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append(f"{table}.submitted_at >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append(f"{table}.submitted_at < ?")
+            params.append(end.isoformat())
+        return clauses, params
+
+    def aggregate_analytics(self, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        clauses, params = self._filters(start=start, end=end)
+        duplicates = self.connection.execute(
+            f"SELECT COUNT(*) FROM stories WHERE {' AND '.join(clauses + [self.DUPLICATE])}", params
+        ).fetchone()[0]
+        where = f"WHERE {' AND '.join(clauses + [f'NOT {self.DUPLICATE}'])}"
+
+        def execute(sql: str):
+            return self.connection.execute(sql.format(where=where), params)
+
+        total, average_sustainability = execute(
+            "SELECT COUNT(*), AVG(sustainability_score) FROM stories {where}"
+        ).fetchone()
+
+        return {
+            'total': total,
+            'category_counts': dict(execute(
+                "SELECT transformation_category, COUNT(*) FROM stories {where} "
+                "GROUP BY transformation_category"
+            ).fetchall()),
+            'quality_counts': dict(execute(
+                "SELECT transformation_quality, COUNT(*) FROM stories {where} "
+                "GROUP BY transformation_quality"
+            ).fetchall()),
+            'average_sustainability': average_sustainability or 0.0,
+            'monthly_counts': dict(execute(
+                "SELECT substr(submitted_at, 1, 7) AS month, COUNT(*) FROM stories {where} "
+                "GROUP BY month ORDER BY month"
+            ).fetchall()),
+            'duplicates': duplicates,
+        }
+
+    def query_records(self, category: Optional[str] = None, quality: Optional[str] = None,
+                      ai_system_name: Optional[str] = None, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None, limit: int = 50,
+                      before: Optional[Tuple[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Query story records newest first straight from the database.
+
+        Args:
+            category, quality, ai_system_name: Optional equality filters
+            start, end: Optional submission date range (end exclusive)
+            limit: Maximum number of records
+            before: Only records strictly older than this
+                (submitted_at, story_id) key, for cursor pagination
+
+        Returns:
+            List of story records
+        """
+        clauses, params = self._filters(category, quality, ai_system_name, start, end)
+        if before is not None:
+            clauses.append("(submitted_at, story_id) < (?, ?)")
+            params.extend((before[0].isoformat(), before[1]))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        cursor = self.connection.execute(
+            f"SELECT record FROM stories {where} ORDER BY submitted_at DESC, story_id DESC LIMIT ?", params
+        )
+        return [json.loads(record) for (record,) in cursor]
+
+    def iter_records(self, category: Optional[str] = None, quality: Optional[str] = None,
+                     ai_system_name: Optional[str] = None, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream matching story records oldest first."""
+        clauses, params = self._filters(category, quality, ai_system_name, start, end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self.connection.execute(
+            f"SELECT record FROM stories {where} ORDER BY submitted_at, story_id", params
+        )
+        for (record,) in cursor:
+            yield json.loads(record)
+
+    def search_records(self, query: str, category: Optional[str] = None, quality: Optional[str] = None,
+                       start: Optional[datetime] = None, end: Optional[datetime] = None,
+                       limit: int = 20) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Full-text search with FTS5 BM25 ranking.
+
+        Query syntax is that of StorySearchIndex: every word must appear and
+        "quoted phrases" must appear as consecutive words.
+
+        Returns:
+            (record, score) pairs best match first, or None without FTS5
+        """
+        if not self.full_text:
+            return None
+        terms, phrases = parse_query(query)
+        if not terms and not phrases:
+            return []
+        match = " ".join(f'"{" ".join(tokens)}"' for tokens in [[term] for term in terms] + phrases)
+
+        clauses, params = self._filters(category, quality, None, start, end, table="s")
+        where = "".join(f" AND {clause}" for clause in clauses)
+        cursor = self.connection.execute(
+            "SELECT s.record, bm25(stories_fts) AS rank FROM stories_fts "
+            "JOIN stories s ON s.rowid = stories_fts.rowid "
+            f"WHERE stories_fts MATCH ?{where} ORDER BY rank LIMIT ?",
+            [match, *params, limit]
+        )
+        # FTS5 reports BM25 negated so that better matches sort first
+        return [(json.loads(record), -rank) for record, rank in cursor]
+
+    def system_totals(self) -> List[Tuple[str, str, int, float, int]]:
+        """
+        Per AI system and quality: (ai_system_name, quality, story count,
+        sustainability sum, verified count), leaving out near-duplicates.
+        """
+        return self.connection.execute(
+            "SELECT ai_system_name, transformation_quality, COUNT(*), SUM(sustainability_score), "
+            "SUM(json_extract(record, '$.verification_status') = 'verified') "
+            f"FROM stories WHERE NOT {self.DUPLICATE} GROUP BY ai_system_name, transformation_quality"
+        ).fetchall()
+
+    def load_index(self, name: str) -> Optional[Any]:
+        row = self.connection.execute(
+            "SELECT data FROM story_indexes WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_index(self, name: str, data: Any) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO story_indexes VALUES (?, ?)", (name, json.dumps(data))
+            )
+
+    def close(self) -> None:
+        self.connection.close()
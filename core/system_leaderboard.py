@@ -0,0 +1,250 @@
+"""
+AI System Leaderboard
+
+Joins each AI system's latest safety and consciousness scores with its
+real-world transformation outcomes:
+
+- outcomes come from the tracker's SystemAggregates (story counts, quality
+  mix, average quality and sustainability), kept up to date on every write
+- scores come from MultiModelAssessor assessments (one per model) and from
+  AGIConsciousnessSafetySystem.integration_history, whichever is newer for
+  a system; the history is scanned incrementally, only new entries are read
+- systems are matched by case- and whitespace-insensitive name
+
+Joined rows are cached until stories, assessments or the history change, so
+polling the leaderboard from a live view is a cache lookup between changes.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Row fields the leaderboard can be sorted by
+SORT_FIELDS = (
+    'story_count', 'verified_count', 'average_quality', 'average_sustainability',
+    'safety_score', 'consciousness_score',
+)
+
+
+def system_key(name: str) -> str:
+    """Join key of an AI system name."""
+    return " ".join(name.split()).casefold()
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def scores_from_integration(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Latest-score record of an integration_history entry.
+
+    Returns:
+        Dict with ai_system, safety_score, consciousness_score, assessed_at
+        and source, or None for entries without a system or timestamp
+    """
+    ai_system = entry.get('ai_system')
+    assessed_at = _parse_timestamp(entry.get('timestamp'))
+    if not ai_system or assessed_at is None:
+        return None
+
+    safety = entry.get('safety_assessment')
+    consciousness = entry.get('consciousness_assessment')
+    integrated = entry.get('integrated_analysis')
+    safety_score = safety.get('overall_safety_score') if isinstance(safety, dict) else None
+    if safety_score is None and isinstance(integrated, dict):
+        safety_score = integrated.get('overall_safety_score')
+    return {
+        'ai_system': ai_system,
+        'safety_score': safety_score,
+        'consciousness_score': (consciousness.get('avg_consciousness_depth')
+                                if isinstance(consciousness, dict) else None),
+        'assessed_at': assessed_at,
+        'source': 'integration',
+    }
+
+
+def scores_from_assessment(assessment) -> Dict[str, Any]:
+    """Latest-score record of a MultiModelAssessor ModelAssessment."""
+    return {
+        'ai_system': assessment.model_name,
+        'safety_score': assessment.overall_safety,
+        'consciousness_score': assessment.overall_consciousness,
+        'assessed_at': _parse_timestamp(assessment.assessment_timestamp),
+        'source': 'model_assessment',
+    }
+
+
+def _newer(current: Optional[Dict[str, Any]], candidate: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if candidate is None:
+        return current
+    if current is None or current['assessed_at'] is None:
+        return candidate
+    if candidate['assessed_at'] is not None and candidate['assessed_at'] >= current['assessed_at']:
+        return candidate
+    return current
+
+
+class SystemLeaderboard:
+    """Per-AI-system join of assessment scores and transformation outcomes."""
+
+    def __init__(self, tracker, assessor=None, integration_system=None):
+        """
+        Args:
+            tracker: TransformationImpactTracker providing story outcomes
+            assessor: Optional MultiModelAssessor with model assessments
+            integration_system: Optional object with an integration_history
+                list, such as AGIConsciousnessSafetySystem
+        """
+        self.tracker = tracker
+        self.assessor = assessor
+        self.integration_system = integration_system
+
+        # Latest integration scores per system key, plus how far the
+        # history has been read
+        self._integration_scores: Dict[str, Dict[str, Any]] = {}
+        self._history: Optional[list] = None
+        self._history_resets = 0
+        self._history_read = 0
+        self._history_version = 0
+        self._cache: Optional[Tuple[Any, List[Dict[str, Any]]]] = None
+
+    def _sync_history(self):
+        """Fold integration_history entries appended since the last call."""
+        if self.integration_system is None:
+            return
+        history = self.integration_system.integration_history
+        # Positions are absolute: a BoundedHistory drops old entries from the front
+        dropped = getattr(history, 'dropped', 0)
+        resets = getattr(history, 'resets', 0)
+        if (history is not self._history or resets != self._history_resets
+                or dropped + len(history) < self._history_read):
+            # History was reset or replaced
+            self._history = history
+            self._history_resets = resets
+            self._history_read = 0
+            self._integration_scores = {}
+            self._history_version += 1
+
+        if dropped + len(history) == self._history_read:
+            return
+        for entry in history[max(0, self._history_read - dropped):]:
+            scores = scores_from_integration(entry)
+            if scores is not None:
+                key = system_key(scores['ai_system'])
+                self._integration_scores[key] = _newer(self._integration_scores.get(key), scores)
+        self._history_read = dropped + len(history)
+        self._history_version += 1
+
+    def _assessment_scores(self) -> Dict[str, Dict[str, Any]]:
+        if self.assessor is None:
+            return {}
+        latest: Dict[str, Dict[str, Any]] = {}
+        for assessment in list(self.assessor.assessments.values()):
+            scores = scores_from_assessment(assessment)
+            key = system_key(scores['ai_system'])
+            latest[key] = _newer(latest.get(key), scores)
+        return latest
+
+    def _assessor_version(self) -> Tuple:
+        if self.assessor is None:
+            return ()
+        return tuple(
+            (name, assessment.assessment_timestamp)
+            for name, assessment in list(self.assessor.assessments.items())
+        )
+
+    def latest_scores(self) -> Dict[str, Dict[str, Any]]:
+        """Newest assessment scores per system key, across both sources."""
+        self._sync_history()
+        latest = self._assessment_scores()
+        for key, scores in self._integration_scores.items():
+            latest[key] = _newer(latest.get(key), scores)
+        return latest
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        One joined row per AI system with stories or assessments.
+
+        Rows are cached and shared between calls; treat them as read-only.
+
+        Returns:
+            Dicts with ai_system, the SystemAggregates summary fields and
+            safety_score, consciousness_score, assessed_at (ISO string) and
+            score_source (None where a system was never assessed)
+        """
+        self._sync_history()
+        self.tracker.refresh()
+        version = (self.tracker.systems.version, self._history_version, self._assessor_version())
+        if self._cache is not None and self._cache[0] == version:
+            metrics.CACHE_REQUESTS.labels('leaderboard', 'hit').inc()
+            return self._cache[1]
+        metrics.CACHE_REQUESTS.labels('leaderboard', 'miss').inc()
+
+        outcomes = self.tracker.systems
+        latest = self.latest_scores()
+        # Every spelling of a system contributes its stories to one row
+        variants: Dict[str, List[str]] = {}
+        for name in list(outcomes.systems):
+            variants.setdefault(system_key(name), []).append(name)
+        for key in latest:
+            variants.setdefault(key, [])
+
+        rows = []
+        for key, spellings in variants.items():
+            scores = latest.get(key)
+            summary = outcomes.combined_summary(spellings)
+            if spellings:
+                # Show the spelling most stories use
+                name = max(spellings, key=lambda spelling: (outcomes.summary(spelling)['story_count'], spelling))
+            else:
+                name = scores['ai_system']
+            row = {'ai_system': name}
+            row.update(summary)
+            row.update({
+                'safety_score': scores['safety_score'] if scores else None,
+                'consciousness_score': scores['consciousness_score'] if scores else None,
+                'assessed_at': scores['assessed_at'].isoformat() if scores and scores['assessed_at'] else None,
+                'score_source': scores['source'] if scores else None,
+            })
+            rows.append(row)
+
+        self._cache = (version, rows)
+        logger.debug(f"Leaderboard rebuilt: {len(rows)} systems")
+        return rows
+
+    def leaderboard(self, sort_by: str = 'average_quality', descending: bool = True,
+                    min_stories: int = 0, assessed_only: bool = False,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ranked joined rows.
+
+        Args:
+            sort_by: Field from SORT_FIELDS; systems missing it rank last
+            descending: Highest values first
+            min_stories: Hide systems with fewer stories
+            assessed_only: Hide systems without assessment scores
+            limit: Maximum number of rows
+
+        Returns:
+            Joined rows (see rows()), ties broken by system name
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort by {sort_by}; expected one of {', '.join(SORT_FIELDS)}")
+
+        rows = [
+            row for row in self.rows()
+            if row['story_count'] >= min_stories and (not assessed_only or row['score_source'])
+        ]
+        sign = -1 if descending else 1
+        rows.sort(key=lambda row: (row[sort_by] is None, sign * (row[sort_by] or 0), row['ai_system']))
+        return rows[:limit] if limit is not None else rows
@@ -14,79 +14,80 @@ Features:
 - Real-time analytics and visualization
 - Ethical data handling with consent management
 - Integration with existing AGI assessment framework
+- Write-ahead journal with periodic, atomically replaced snapshots
+- Pluggable storage backends (JSON files by default, SQLite for shared stores)
+- Impact reports cached per data version, with incrementally maintained
+  7/30/365-day windows
+- Near-duplicate flagging at ingestion (MinHash/LSH over story text)
+- Full-text search with phrase queries and BM25 ranking
+- Running per-AI-system outcome totals for assessment leaderboards
+- Safe to share between threads: one lock serializes writers and the
+  readers that walk the shared indexes
 """
 
+import copy
+import functools
 import json
 import os
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Iterator, MutableMapping, Optional, TextIO, Tuple, Union
+from dataclasses import asdict
 import hashlib
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from .story_analytics import (
+    NUMPY_AVAILABLE,
+    DailyAggregates,
+    SystemAggregates,
+    aggregate_columns,
+    aggregate_stories,
+    analytics_from_aggregates,
+    empty_analytics,
+)
+from . import metrics
+from .instrumentation import timed
+from .story_columns import StoryColumns
+from .story_dedup import MinHashLSH
+from .story_export import iter_export_chunks
+from .story_index import StoryIndex, decode_cursor, encode_cursor
+from .story_search import StorySearchIndex
+from .story_models import (
+    PRIVACY_LEVELS,
+    QUALITY_SCORES,
+    SEARCH_FIELDS,
+    UPDATABLE_FIELDS,
+    VERIFICATION_STATUSES,
+    TransformationAnalytics,
+    TransformationCategory,
+    TransformationQuality,
+    TransformationStory,
+)
+from .story_storage import JSONStoryStorage, StoryStorage
+
 logger = logging.getLogger(__name__)
 
-class TransformationCategory(Enum):
-    """Categories of human transformation."""
-    MENTAL_HEALTH = "mental_health"
-    RELATIONSHIPS = "relationships"
-    CAREER_PURPOSE = "career_purpose"
-    PERSONAL_GROWTH = "personal_growth"
-    PHYSICAL_HEALTH = "physical_health"
-    FINANCIAL_WELLBEING = "financial_wellbeing"
-    EDUCATION_LEARNING = "education_learning"
-    SPIRITUAL_GROWTH = "spiritual_growth"
-    COMMUNITY_SOCIAL = "community_social"
-    CREATIVE_EXPRESSION = "creative_expression"
-
-class TransformationQuality(Enum):
-    """Quality levels of transformation."""
-    MINIMAL = "minimal"      # Slight positive change
-    MODERATE = "moderate"    # Noticeable improvement
-    SIGNIFICANT = "significant"  # Major life improvement
-    TRANSFORMATIONAL = "transformational"  # Life-changing impact
-
-@dataclass
-class TransformationStory:
-    """Represents a single transformation story."""
-    story_id: str
-    ai_system_name: str
-    initial_state: str
-    final_state: str
-    transformation_category: TransformationCategory
-    transformation_quality: TransformationQuality
-    sustainability_score: float  # 0.0 to 1.0
-    story_summary: str
-    detailed_narrative: Optional[str] = None
-    quantitative_metrics: Optional[Dict[str, Any]] = None
-    submitted_at: datetime = None
-    last_updated: datetime = None
-    privacy_level: str = "anonymous"  # anonymous, pseudonymous, identified
-    consent_given: bool = True
-    verification_status: str = "pending"  # pending, verified, disputed
-
-    def __post_init__(self):
-        if self.submitted_at is None:
-            self.submitted_at = datetime.now()
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
-
-@dataclass
-class TransformationAnalytics:
-    """Analytics data for transformation impact."""
-    total_stories: int
-    category_breakdown: Dict[str, int]
-    quality_distribution: Dict[str, int]
-    average_sustainability_score: float
-    average_transformation_quality_score: float
-    stories_per_month: Dict[str, int]
-    top_transformation_categories: List[str]
-    geographical_distribution: Optional[Dict[str, int]] = None
-    demographic_insights: Optional[Dict[str, Any]] = None
+# Time windows (in days) offered for recent-activity impact reports
+REPORT_WINDOWS = (7, 30, 365)
+
+# Name of the duplicate-detection index in the storage backend
+DUPLICATE_INDEX_NAME = "duplicates"
+
+# Stories iter_stories reads per lock acquisition, so long exports neither
+# copy every index key up front nor block writers for the whole walk
+ITER_PAGE_SIZE = 1000
+
+
+def _synchronized(method):
+    """Run a tracker method while holding the tracker's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class TransformationImpactTracker:
     """
@@ -100,94 +101,471 @@ class TransformationImpactTracker:
     - Integration with AGI assessment framework
     """
 
-    def __init__(self, data_directory: str = "data/transformations"):
+    def __init__(self, data_directory: str = "data/transformations",
+                 snapshot_interval: int = 1000, fsync: bool = False,
+                 storage: Optional[StoryStorage] = None, compact: bool = False,
+                 duplicate_index: Optional[MinHashLSH] = None):
+        """
+        Args:
+            data_directory: Directory holding snapshots and the journal
+            snapshot_interval: Minimum number of journaled events before the
+                journal is compacted into a fresh snapshot (snapshots also
+                wait for the journal to grow relative to the stored stories)
+            fsync: Force every journal write to stable storage
+            storage: Storage backend; defaults to JSONStoryStorage in
+                data_directory (the two options above apply to it)
+            compact: Keep stories in columnar StoryColumns storage instead of
+                one dataclass instance per story (ignored for queryable
+                backends such as SQLiteStoryStorage, which keep the stories).
+                The indexes are unaffected, so the whole tracker shrinks by
+                roughly 10% (see benchmarks/memory_usage.py)
+            duplicate_index: Near-duplicate detector with custom parameters;
+                defaults to MinHashLSH()
+        """
         self.data_directory = data_directory
-        self.stories_file = os.path.join(data_directory, "stories.json")
-        self.analytics_file = os.path.join(data_directory, "analytics.json")
+        if storage is None:
+            storage = JSONStoryStorage(data_directory, snapshot_interval=snapshot_interval, fsync=fsync)
+        self.storage = storage
+
+        # Initialize data structures. Queryable backends answer lookups, pages
+        # and searches themselves, so no story or time index is held in memory
+        if storage.queryable:
+            self.stories: MutableMapping[str, TransformationStory] = storage.stories_view(self._story_from_record)
+        else:
+            self.stories = StoryColumns() if compact else {}
+        self._memory_index = not storage.queryable
+        self._memory_search = not (storage.queryable and storage.full_text)
+        self._analytics_dirty = False
+        self.analytics: TransformationAnalytics = self._initialize_analytics()
+        self.index = StoryIndex()
+        self.daily = DailyAggregates()
+        self.systems = SystemAggregates()
+        self.duplicate_index = duplicate_index or MinHashLSH()
+        self.search_index = StorySearchIndex(
+            text_of=lambda story_id: self._search_text(self.stories[story_id])
+        )
 
-        # Ensure data directory exists
-        os.makedirs(data_directory, exist_ok=True)
+        # Serializes writers (ingestion queue, background workers, dashboard)
+        # and the readers that walk the shared indexes
+        self._lock = threading.RLock()
 
-        # Initialize data structures
-        self.stories: Dict[str, TransformationStory] = {}
-        self.analytics: TransformationAnalytics = self._initialize_analytics()
+        # Bumped on every change that affects analytics; reports are cached
+        # per (window, version) and rebuilt only when it moves
+        self.data_version = 0
+        self._report_cache: Dict[Optional[int], Tuple[Any, Dict[str, Any]]] = {}
+        self._report_lock = threading.Lock()
+
+        # Last seen storage change marker; when another tracker commits to
+        # the same storage, derived totals are reloaded (see refresh)
+        self._storage_marker = storage.change_marker()
 
         # Load existing data
         self._load_data()
 
+    @property
+    def analytics(self) -> TransformationAnalytics:
+        """Analytics for the current stories, recomputed lazily after changes."""
+        self.refresh()
+        if self._analytics_dirty:
+            with self._lock:
+                if self._analytics_dirty:
+                    self._analytics_dirty = False
+                    self._update_analytics()
+        return self._analytics
+
+    @analytics.setter
+    def analytics(self, value: TransformationAnalytics):
+        self._analytics = value
+
+    def _invalidate_analytics(self):
+        """Mark analytics stale and bump the data version."""
+        self._analytics_dirty = True
+        self.data_version += 1
+
     def _initialize_analytics(self) -> TransformationAnalytics:
         """Initialize analytics with default values."""
-        return TransformationAnalytics(
-            total_stories=0,
-            category_breakdown={cat.value: 0 for cat in TransformationCategory},
-            quality_distribution={qual.value: 0 for qual in TransformationQuality},
-            average_sustainability_score=0.0,
-            average_transformation_quality_score=0.0,
-            stories_per_month={},
-            top_transformation_categories=[]
-        )
+        return empty_analytics()
 
     def _load_data(self):
-        """Load stories and analytics from disk."""
-        # Load stories
-        if os.path.exists(self.stories_file):
-            try:
-                with open(self.stories_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for story_data in data.get('stories', []):
-                        # Convert string timestamps back to datetime
-                        if 'submitted_at' in story_data:
-                            story_data['submitted_at'] = datetime.fromisoformat(story_data['submitted_at'])
-                        if 'last_updated' in story_data:
-                            story_data['last_updated'] = datetime.fromisoformat(story_data['last_updated'])
-
-                        # Convert category and quality back to enums
-                        story_data['transformation_category'] = TransformationCategory(story_data['transformation_category'])
-                        story_data['transformation_quality'] = TransformationQuality(story_data['transformation_quality'])
-
-                        story = TransformationStory(**story_data)
-                        self.stories[story.story_id] = story
-            except Exception as e:
-                logger.error(f"Error loading stories: {e}")
+        """Rebuild stories from the storage backend."""
+        if self.storage.queryable:
+            self._load_derived_data()
+            return
 
-        # Load analytics
-        if os.path.exists(self.analytics_file):
+        loaded = 0
+        for event in self.storage.load():
             try:
-                with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                    analytics_data = json.load(f)
-                    # Convert lists back to appropriate types
-                    analytics_data['category_breakdown'] = {k: int(v) for k, v in analytics_data['category_breakdown'].items()}
-                    analytics_data['quality_distribution'] = {k: int(v) for k, v in analytics_data['quality_distribution'].items()}
-                    analytics_data['stories_per_month'] = {k: int(v) for k, v in analytics_data['stories_per_month'].items()}
-
-                    self.analytics = TransformationAnalytics(**analytics_data)
+                self._apply_event(event)
+                loaded += 1
             except Exception as e:
-                logger.error(f"Error loading analytics: {e}")
+                logger.error(f"Error loading story event: {e}")
+
+        if self.stories:
+            self._invalidate_analytics()
+            logger.info(f"Loaded {len(self.stories)} stories from {loaded} stored events")
+
+        self.index.rebuild(self._index_entry(story) for story in self.stories.values())
+        self.daily.rebuild(self.stories.values())
+        self.systems.rebuild(self.stories.values())
+        self.search_index.rebuild(self._search_entry(story) for story in self.stories.values())
+        self._load_duplicate_index()
+
+    def _load_derived_data(self):
+        """Build only the in-memory aggregates of a queryable backend."""
+        self._reload_totals()
+        self._load_duplicate_index()
+
+    def _reload_totals(self):
+        """Reload per-system totals (and the fallback search index) from a queryable backend."""
+        self.systems.load_totals(self.storage.system_totals())
+        if self._memory_search:
+            self.search_index.rebuild(self._search_entry(story) for story in self.stories.values())
+        self._invalidate_analytics()
+
+    def refresh(self) -> bool:
+        """
+        Pick up changes other trackers (or processes) stored.
 
-    def _save_data(self):
-        """Save stories and analytics to disk."""
-        # Save stories
-        stories_data = {
-            'stories': [
-                {
-                    **asdict(story),
-                    'submitted_at': story.submitted_at.isoformat(),
-                    'last_updated': story.last_updated.isoformat(),
-                    'transformation_category': story.transformation_category.value,
-                    'transformation_quality': story.transformation_quality.value
-                }
-                for story in self.stories.values()
-            ]
+        Called by the analytics, report and search readers and by
+        DashboardFeed. It only costs a change-marker check unless the
+        storage changed. Journal-backed stores then apply just the events
+        appended since the last read, or reload everything if another
+        writer compacted the journal into a snapshot; queryable backends
+        reload their per-system totals. Cached analytics and reports are
+        invalidated whenever something was found.
+
+        Returns:
+            Whether outside changes were found
+        """
+        marker = self.storage.change_marker()
+        if marker == self._storage_marker:
+            return False
+        with self._lock:
+            if marker == self._storage_marker:
+                return False
+            self._storage_marker = marker
+            if self.storage.queryable:
+                logger.debug("Storage changed outside this tracker; reloading totals")
+                self._reload_totals()
+                return True
+
+            events = self.storage.read_changes()
+            if events is None:
+                logger.info("Story storage was compacted by another writer; reloading it")
+                self.stories = StoryColumns() if isinstance(self.stories, StoryColumns) else {}
+                self._load_data()
+                self._invalidate_analytics()
+                return True
+            for event in events:
+                try:
+                    self._apply_outside_event(event)
+                except Exception as e:
+                    logger.error(f"Error applying story event from another writer: {e}")
+            if events:
+                logger.debug(f"Applied {len(events)} story events stored by another writer")
+                self._invalidate_analytics()
+            return bool(events)
+
+    def _apply_outside_event(self, event: Dict[str, Any]):
+        """Apply an event journaled by another writer, keeping the derived data in step."""
+        story_id = event['story']['story_id'] if 'story' in event else event.get('story_id')
+        previous = self.stories.get(story_id)
+        if previous is not None:
+            # Dict stores hand out the stored instance, which verify events change in place
+            previous = copy.copy(previous)
+        self._apply_event(event)
+        story = self.stories.get(story_id)
+        if story is None:
+            return
+
+        if previous is not None:
+            self.daily.remove(previous)
+            self.systems.remove(previous)
+        self.index.add(*self._index_entry(story))
+        self.daily.add(story)
+        self.systems.add(story)
+        if self._memory_search:
+            self.search_index.add(*self._search_entry(story))
+        if event['op'] != 'verify' and not story.duplicate_of:
+            self.duplicate_index.add(story_id, self._story_signature(story))
+
+    def _load_duplicate_index(self):
+        """Restore persisted signatures and sign stories changed since they were saved."""
+        saved_at = None
+        data = self.storage.load_index(DUPLICATE_INDEX_NAME)
+        if data and self.duplicate_index.load_dict(data):
+            saved_at = datetime.fromisoformat(data['saved_at'])
+
+        for story_id in [s for s in self.duplicate_index.signatures if s not in self.stories]:
+            self.duplicate_index.remove(story_id)
+
+        signed = 0
+        for story in self.stories.values():
+            if story.duplicate_of:
+                continue
+            if (saved_at is None or story.last_updated >= saved_at
+                    or story.story_id not in self.duplicate_index.signatures):
+                self.duplicate_index.add(story.story_id, self._story_signature(story))
+                signed += 1
+        if signed:
+            logger.info(f"Computed duplicate signatures for {signed} stories")
+
+    def _save_duplicate_index(self):
+        data = self.duplicate_index.to_dict()
+        data['saved_at'] = datetime.now().isoformat()
+        self.storage.save_index(DUPLICATE_INDEX_NAME, data)
+
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply a single story event. Applying an event twice is harmless."""
+        op = event.get('op')
+        if op in ('submit', 'update'):
+            story = self._story_from_record(dict(event['story']))
+            self.stories[story.story_id] = story
+        elif op == 'verify':
+            story = self.stories.get(event['story_id'])
+            if story is not None:
+                story.verification_status = event['verification_status']
+                story.last_updated = datetime.fromisoformat(event['last_updated'])
+                self.stories[story.story_id] = story
+        else:
+            raise ValueError(f"Unknown story event: {op}")
+
+    @staticmethod
+    def _story_to_record(story: TransformationStory) -> Dict[str, Any]:
+        """Convert a story into a JSON-serializable record."""
+        # Shallow field copy; asdict() deep-copies and dominates ingestion cost
+        return {
+            **story.__dict__,
+            'submitted_at': story.submitted_at.isoformat(),
+            'last_updated': story.last_updated.isoformat(),
+            'transformation_category': story.transformation_category.value,
+            'transformation_quality': story.transformation_quality.value
         }
 
-        with open(self.stories_file, 'w', encoding='utf-8') as f:
-            json.dump(stories_data, f, indent=2, ensure_ascii=False)
+    @staticmethod
+    def _story_from_record(story_data: Dict[str, Any]) -> TransformationStory:
+        """Rebuild a story from a record produced by _story_to_record."""
+        # Convert string timestamps back to datetime
+        if 'submitted_at' in story_data:
+            story_data['submitted_at'] = datetime.fromisoformat(story_data['submitted_at'])
+        if 'last_updated' in story_data:
+            story_data['last_updated'] = datetime.fromisoformat(story_data['last_updated'])
 
-        # Save analytics
-        analytics_data = asdict(self.analytics)
+        # Convert category and quality back to enums
+        story_data['transformation_category'] = TransformationCategory(story_data['transformation_category'])
+        story_data['transformation_quality'] = TransformationQuality(story_data['transformation_quality'])
 
-        with open(self.analytics_file, 'w', encoding='utf-8') as f:
-            json.dump(analytics_data, f, indent=2, ensure_ascii=False)
+        return TransformationStory(**story_data)
+
+    @timed('persistence.snapshot')
+    def _save_data(self):
+        """Ask the storage backend to compact into a snapshot of stories and analytics."""
+        with metrics.SAVE_SECONDS.labels('tracker').time():
+            analytics = asdict(self.analytics)
+            records = (self._story_to_record(story) for story in self.stories.values())
+            self.storage.snapshot(records, analytics)
+            self._save_duplicate_index()
+            self.search_index.compact()
+
+    @timed('persistence.journal')
+    def _append_events(self, events: List[Dict[str, Any]]):
+        """Persist events as one batch."""
+        self.storage.append(events)
+
+    def _record_events(self, events: List[Dict[str, Any]], defer_snapshot: bool = False):
+        """Persist events as one batch and compact into a snapshot when due."""
+        self._append_events(events)
+        if not defer_snapshot:
+            self.snapshot_if_due()
+
+    @_synchronized
+    def snapshot_if_due(self) -> bool:
+        """Compact into a snapshot if the storage backend asks for one."""
+        if self.storage.snapshot_due():
+            self._save_data()
+            return True
+        return False
+
+    @_synchronized
+    def snapshot(self):
+        """Force a snapshot of the current state."""
+        self._save_data()
+
+    @_synchronized
+    def sync(self):
+        """Force persisted events to stable storage, whatever the fsync setting."""
+        self.storage.sync()
+
+    @_synchronized
+    def close(self):
+        """Persist the duplicate index and release storage resources."""
+        self._save_duplicate_index()
+        self.storage.close()
+
+    def _build_story(self, story_data: Dict[str, Any]) -> TransformationStory:
+        """Validate raw story data and build a new story with a fresh ID."""
+        category = TransformationCategory(story_data.get('transformation_category', 'personal_growth'))
+        quality = TransformationQuality(story_data.get('transformation_quality', 'moderate'))
+
+        # Imported stories may carry their original submission time. Times
+        # are kept naive in local time, so aware values are converted
+        submitted_at = story_data.get('submitted_at')
+        if isinstance(submitted_at, str):
+            submitted_at = datetime.fromisoformat(submitted_at)
+        elif submitted_at is not None and not isinstance(submitted_at, datetime):
+            raise ValueError(f"submitted_at must be a datetime or an ISO 8601 string, "
+                             f"not {type(submitted_at).__name__}")
+        if submitted_at is not None and submitted_at.tzinfo is not None:
+            submitted_at = submitted_at.astimezone().replace(tzinfo=None)
+
+        story = TransformationStory(
+            story_id=str(uuid.uuid4()),
+            ai_system_name=story_data.get('ai_system_name', 'Unknown AI'),
+            initial_state=story_data.get('initial_state', ''),
+            final_state=story_data.get('final_state', ''),
+            transformation_category=category,
+            transformation_quality=quality,
+            sustainability_score=float(story_data.get('sustainability_score', 0.8)),
+            story_summary=story_data.get('story_summary', ''),
+            detailed_narrative=story_data.get('detailed_narrative'),
+            quantitative_metrics=story_data.get('quantitative_metrics'),
+            privacy_level=story_data.get('privacy_level', 'anonymous'),
+            consent_given=story_data.get('consent_given', True),
+            submitted_at=submitted_at
+        )
+        self._validate_story(story)
+        return story
+
+    @staticmethod
+    def _validate_story(story: TransformationStory):
+        """
+        Check the field types of a story before it is registered anywhere.
+
+        A story that passes can always be indexed, aggregated and journaled,
+        so a bad row fails here instead of half-way through registration.
+
+        Raises:
+            ValueError: Describing the first invalid field
+        """
+        for field in ('ai_system_name', 'initial_state', 'final_state', 'story_summary'):
+            if not isinstance(getattr(story, field), str):
+                raise ValueError(f"{field} must be a string")
+        if story.detailed_narrative is not None and not isinstance(story.detailed_narrative, str):
+            raise ValueError("detailed_narrative must be a string")
+        if story.quantitative_metrics is not None:
+            if not isinstance(story.quantitative_metrics, dict):
+                raise ValueError("quantitative_metrics must be a dictionary")
+            try:
+                json.dumps(story.quantitative_metrics)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"quantitative_metrics must be JSON-serializable: {e}")
+        if story.privacy_level not in PRIVACY_LEVELS:
+            raise ValueError(f"Invalid privacy level: {story.privacy_level}")
+        if not isinstance(story.consent_given, bool):
+            raise ValueError("consent_given must be true or false")
+        for field in ('submitted_at', 'last_updated'):
+            if not isinstance(getattr(story, field), datetime):
+                raise ValueError(f"{field} must be a datetime")
+
+    @staticmethod
+    def _index_entry(story: TransformationStory):
+        """Indexed attributes of a story, in StoryIndex.add argument order."""
+        return (
+            story.story_id,
+            story.submitted_at,
+            story.transformation_category.value,
+            story.transformation_quality.value,
+            story.ai_system_name
+        )
+
+    @staticmethod
+    def _search_text(story: TransformationStory) -> str:
+        """Searchable text of a story."""
+        return " ".join(filter(None, (getattr(story, field) for field in SEARCH_FIELDS)))
+
+    def _search_entry(self, story: TransformationStory):
+        """Search index entry of a story, in StorySearchIndex.add argument order."""
+        return (
+            story.story_id,
+            self._search_text(story),
+            story.transformation_category.value,
+            story.transformation_quality.value,
+            story.submitted_at
+        )
+
+    def _story_signature(self, story: TransformationStory):
+        """MinHash signature of the story's summary and narrative."""
+        return self.duplicate_index.signature(
+            f"{story.story_summary} {story.detailed_narrative or ''}"
+        )
+
+    def _prepare_story(self, story_data: Dict[str, Any]) -> Tuple[TransformationStory, Any]:
+        """
+        Build and validate a new story without touching tracker state, so
+        callers need not hold the lock.
+
+        Returns:
+            (story, MinHash signature of its text)
+        """
+        story = self._build_story(story_data)
+        return story, self._story_signature(story)
+
+    def _flag_duplicate(self, story: TransformationStory, signature):
+        """Mark a new story as a likely duplicate of an existing one and index it."""
+        match = self.duplicate_index.find_duplicate(signature)
+        if match is not None:
+            original_id, similarity = match
+            story.duplicate_of = original_id
+            logger.warning(f"Story {story.story_id} looks like a duplicate of {story.duplicate_of} "
+                           f"(similarity {similarity:.2f})")
+            # Only originals are indexed, so floods of copies keep buckets small
+            return
+        self.duplicate_index.add(story.story_id, signature)
+
+    def _add_story(self, story: TransformationStory, signature):
+        """Register a validated new story in memory, the secondary indexes and running aggregates."""
+        self._flag_duplicate(story, signature)
+        self.stories[story.story_id] = story
+        if self._memory_index:
+            self.index.add(*self._index_entry(story))
+            self.daily.add(story)
+        if self._memory_search:
+            self.search_index.add(*self._search_entry(story))
+        self.systems.add(story)
+
+    def _discard_story(self, story: TransformationStory):
+        """Undo _add_story for a story whose event could not be persisted."""
+        self.stories.pop(story.story_id, None)
+        if self._memory_index:
+            self.index.remove(story.story_id)
+            self.daily.remove(story)
+        if self._memory_search:
+            self.search_index.remove(story.story_id)
+        self.systems.remove(story)
+        self.duplicate_index.remove(story.story_id)
+
+    def _commit_stories(self, prepared: List[Tuple[TransformationStory, Any]],
+                        defer_snapshot: bool = False):
+        """
+        Register prepared stories and journal them as one batch.
+
+        If the batch cannot be persisted, the stories are removed again and
+        the error propagates, so memory never holds unjournaled stories.
+        """
+        events = []
+        for story, signature in prepared:
+            self._add_story(story, signature)
+            events.append({'op': 'submit', 'story': self._story_to_record(story)})
+        self._invalidate_analytics()
+        try:
+            self._append_events(events)
+        except Exception:
+            for story, _ in prepared:
+                self._discard_story(story)
+            self._invalidate_analytics()
+            raise
+        if not defer_snapshot:
+            self.snapshot_if_due()
 
     def submit_story(self, story_data: Dict[str, Any]) -> str:
         """
@@ -197,120 +575,383 @@ class TransformationImpactTracker:
             story_data: Dictionary containing story information
 
         Returns:
-            Story ID for tracking
+            Story ID for tracking. Likely near-duplicates of existing stories
+            are still stored, with duplicate_of set to the original's ID.
         """
-        # Generate unique ID
-        story_id = str(uuid.uuid4())
-
         # Validate and process data
         try:
-            category = TransformationCategory(story_data.get('transformation_category', 'personal_growth'))
-            quality = TransformationQuality(story_data.get('transformation_quality', 'moderate'))
-
-            story = TransformationStory(
-                story_id=story_id,
-                ai_system_name=story_data.get('ai_system_name', 'Unknown AI'),
-                initial_state=story_data.get('initial_state', ''),
-                final_state=story_data.get('final_state', ''),
-                transformation_category=category,
-                transformation_quality=quality,
-                sustainability_score=float(story_data.get('sustainability_score', 0.8)),
-                story_summary=story_data.get('story_summary', ''),
-                detailed_narrative=story_data.get('detailed_narrative'),
-                quantitative_metrics=story_data.get('quantitative_metrics'),
-                privacy_level=story_data.get('privacy_level', 'anonymous'),
-                consent_given=story_data.get('consent_given', True)
-            )
-
-            self.stories[story_id] = story
-            self._update_analytics()
-            self._save_data()
-
-            logger.info(f"New transformation story submitted: {story_id}")
-            return story_id
-
+            prepared = self._prepare_story(story_data)
         except Exception as e:
+            metrics.STORIES_INGESTED.labels('rejected').inc()
             logger.error(f"Error submitting story: {e}")
             raise ValueError(f"Invalid story data: {e}")
 
+        with self._lock:
+            self._commit_stories([prepared])
+        story_id = prepared[0].story_id
+        metrics.STORIES_INGESTED.labels('accepted').inc()
+        logger.info(f"New transformation story submitted: {story_id}")
+        return story_id
+
+    def submit_stories(self, stories: Iterable[Dict[str, Any]], batch_size: int = 1000,
+                       defer_snapshot: bool = False) -> Dict[str, Any]:
+        """
+        Submit many transformation stories at once.
+
+        Rows are fully validated as they are read from the iterable, before
+        any of them is registered; invalid rows are collected instead of
+        aborting the import. Each batch is persisted
+        with a single write and analytics are refreshed once per batch.
+        Rows are parsed and signed outside the tracker lock, which is only
+        held while a batch is registered and journaled, so readers and other
+        writers interleave with a long import.
+
+        Args:
+            stories: Iterable of story dictionaries (may be a generator)
+            batch_size: Number of rows persisted together
+            defer_snapshot: Leave a due snapshot to a later snapshot_if_due()
+                call, so callers can acknowledge journaled stories first
+
+        Returns:
+            Summary with accepted story IDs and rejected rows
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        story_ids: List[str] = []
+        rejected: List[Dict[str, Any]] = []
+        batches = 0
+        rows = iter(stories)
+        index = 0
+
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                break
+
+            prepared = []
+            for story_data in chunk:
+                try:
+                    prepared.append(self._prepare_story(story_data))
+                except Exception as e:
+                    rejected.append({'index': index, 'error': str(e)})
+                index += 1
+
+            if prepared:
+                with self._lock:
+                    self._commit_stories(prepared, defer_snapshot=defer_snapshot)
+                story_ids.extend(story.story_id for story, _ in prepared)
+            metrics.STORIES_INGESTED.labels('accepted').inc(len(prepared))
+            metrics.STORIES_INGESTED.labels('rejected').inc(len(chunk) - len(prepared))
+            batches += 1
+
+        logger.info(f"Bulk submission: {len(story_ids)} stories accepted, {len(rejected)} rejected in {batches} batches")
+        return {
+            'submitted': len(story_ids),
+            'rejected': len(rejected),
+            'batches': batches,
+            'story_ids': story_ids,
+            'rejects': rejected
+        }
+
     def get_story(self, story_id: str) -> Optional[TransformationStory]:
         """Retrieve a specific story by ID."""
         return self.stories.get(story_id)
 
+    @_synchronized
+    def update_story(self, story_id: str, updates: Dict[str, Any]) -> TransformationStory:
+        """
+        Update fields of an existing story.
+
+        Args:
+            story_id: ID of the story to update
+            updates: Mapping of field names to new values
+
+        Returns:
+            The updated story
+        """
+        story = self.stories.get(story_id)
+        if story is None:
+            raise KeyError(f"Unknown story: {story_id}")
+
+        unknown = set(updates) - UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Fields cannot be updated: {', '.join(sorted(unknown))}")
+
+        record = self._story_to_record(story)
+        record.update(updates)
+        if isinstance(record['transformation_category'], TransformationCategory):
+            record['transformation_category'] = record['transformation_category'].value
+        if isinstance(record['transformation_quality'], TransformationQuality):
+            record['transformation_quality'] = record['transformation_quality'].value
+        record['sustainability_score'] = float(record['sustainability_score'])
+        record['last_updated'] = datetime.now().isoformat()
+
+        try:
+            updated = self._story_from_record(dict(record))
+            self._validate_story(updated)
+        except Exception as e:
+            raise ValueError(f"Invalid story update: {e}")
+
+        self.stories[story_id] = updated
+        if self._memory_index:
+            self.index.add(*self._index_entry(updated))
+            self.daily.remove(story)
+            self.daily.add(updated)
+        if self._memory_search:
+            self.search_index.add(*self._search_entry(updated))
+        self.systems.remove(story)
+        self.systems.add(updated)
+        if not updated.duplicate_of and ('story_summary' in updates or 'detailed_narrative' in updates):
+            self.duplicate_index.add(story_id, self._story_signature(updated))
+        self._invalidate_analytics()
+        self._record_events([{'op': 'update', 'story': record}])
+
+        logger.info(f"Transformation story updated: {story_id}")
+        return updated
+
+    @_synchronized
+    def set_verification_status(self, story_id: str, status: str) -> TransformationStory:
+        """Change the verification status of a story (pending, verified, disputed)."""
+        story = self.stories.get(story_id)
+        if story is None:
+            raise KeyError(f"Unknown story: {story_id}")
+        if status not in VERIFICATION_STATUSES:
+            raise ValueError(f"Invalid verification status: {status}")
+
+        self.systems.remove(story)
+        story.verification_status = status
+        story.last_updated = datetime.now()
+        self.systems.add(story)
+        # Write back: compact stores hand out copies
+        self.stories[story_id] = story
+        self._record_events([{
+            'op': 'verify',
+            'story_id': story_id,
+            'verification_status': status,
+            'last_updated': story.last_updated.isoformat(),
+            # Lets month-sharded storage find the story without a lookup
+            'submitted_at': story.submitted_at.isoformat()
+        }])
+        return story
+
     def get_stories(self, category: Optional[TransformationCategory] = None,
                     quality: Optional[TransformationQuality] = None,
-                    limit: int = 50) -> List[TransformationStory]:
-        """Get filtered list of stories."""
-        stories = list(self.stories.values())
+                    limit: int = 50,
+                    ai_system_name: Optional[str] = None) -> List[TransformationStory]:
+        """Get filtered list of stories, newest first."""
+        return self.get_stories_page(
+            category=category, quality=quality, ai_system_name=ai_system_name, limit=limit
+        )['stories']
+
+    @_synchronized
+    def get_stories_page(self, category: Optional[TransformationCategory] = None,
+                         quality: Optional[TransformationQuality] = None,
+                         ai_system_name: Optional[str] = None,
+                         limit: int = 50,
+                         cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of filtered stories, newest first.
+
+        Args:
+            category: Optional category filter
+            quality: Optional quality filter
+            ai_system_name: Optional AI system filter
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Dict with 'stories' and 'next_cursor' (None on the last page)
+        """
+        before = decode_cursor(cursor) if cursor else None
+        if self.storage.queryable:
+            records = self.storage.query_records(
+                category=category.value if category else None,
+                quality=quality.value if quality else None,
+                ai_system_name=ai_system_name,
+                before=before,
+                limit=limit + 1
+            )
+            stories = [self._story_from_record(record) for record in records[:limit]]
+            last = stories[-1] if len(records) > limit else None
+            return {
+                'stories': stories,
+                'next_cursor': encode_cursor((last.submitted_at, last.story_id)) if last else None
+            }
+
+        keys = list(islice(
+            self.index.iter_newest(
+                category=category.value if category else None,
+                quality=quality.value if quality else None,
+                ai_system_name=ai_system_name,
+                before=before
+            ),
+            limit + 1
+        ))
 
-        if category:
-            stories = [s for s in stories if s.transformation_category == category]
+        has_more = len(keys) > limit
+        keys = keys[:limit]
 
-        if quality:
-            stories = [s for s in stories if s.transformation_quality == quality]
+        return {
+            'stories': [self.stories[story_id] for _, story_id in keys],
+            'next_cursor': encode_cursor(keys[-1]) if has_more else None
+        }
+
+    @_synchronized
+    def search_stories(self, query: str,
+                       category: Optional[TransformationCategory] = None,
+                       quality: Optional[TransformationQuality] = None,
+                       start: Optional[datetime] = None,
+                       end: Optional[datetime] = None,
+                       limit: int = 20) -> List[Tuple[TransformationStory, float]]:
+        """
+        Full-text search over states, summaries and narratives.
 
-        # Sort by submission date (newest first)
-        stories.sort(key=lambda s: s.submitted_at, reverse=True)
+        Args:
+            query: Words that must all appear, and "quoted phrases"
+            category, quality: Optional filters
+            start, end: Optional submission date range (end exclusive)
+            limit: Maximum number of results
 
-        return stories[:limit]
+        Returns:
+            (story, BM25 score) pairs, best match first
+        """
+        self.refresh()
+        if not self._memory_search:
+            hits = self.storage.search_records(
+                query,
+                category=category.value if category else None,
+                quality=quality.value if quality else None,
+                start=start,
+                end=end,
+                limit=limit
+            )
+            return [(self._story_from_record(record), score) for record, score in hits]
+
+        hits = self.search_index.search(
+            query,
+            category=category.value if category else None,
+            quality=quality.value if quality else None,
+            start=start,
+            end=end,
+            limit=limit
+        )
+        return [(self.stories[story_id], score) for story_id, score in hits]
 
     def _update_analytics(self):
         """Update analytics based on current stories."""
-        if not self.stories:
-            return
+        # Backends that can aggregate (e.g. SQLite) do the work themselves;
+        # otherwise the running totals maintained on every write are used
+        aggregates = self.storage.aggregate_analytics()
+        if aggregates is None:
+            aggregates = self.daily.aggregate()
 
-        stories = list(self.stories.values())
+        if aggregates['total']:
+            self.analytics = self._analytics_from_aggregates(aggregates)
 
-        # Basic counts
-        self.analytics.total_stories = len(stories)
+    def _aggregate(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                   ai_system_name: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregate in-memory stories, vectorized when the store is columnar."""
+        if self.storage.queryable:
+            return aggregate_stories(self.iter_stories(start=start, end=end, ai_system_name=ai_system_name))
 
-        # Category breakdown
-        category_counts = {}
-        for category in TransformationCategory:
-            category_counts[category.value] = sum(1 for s in stories if s.transformation_category == category)
-        self.analytics.category_breakdown = category_counts
+        if start is None and end is None and ai_system_name is None:
+            return self.daily.aggregate()
 
-        # Quality distribution
-        quality_counts = {}
-        for quality in TransformationQuality:
-            quality_counts[quality.value] = sum(1 for s in stories if s.transformation_quality == quality)
-        self.analytics.quality_distribution = quality_counts
+        if NUMPY_AVAILABLE and isinstance(self.stories, StoryColumns):
+            return aggregate_columns(self.stories, start=start, end=end, ai_system_name=ai_system_name)
 
-        # Average scores
-        self.analytics.average_sustainability_score = sum(s.sustainability_score for s in stories) / len(stories)
+        keys = self.index.iter_oldest(ai_system_name=ai_system_name, start=start, end=end)
+        return aggregate_stories(self.stories[story_id] for _, story_id in keys)
 
-        # Convert quality to numerical scores for averaging
-        quality_scores = {
-            'minimal': 0.2,
-            'moderate': 0.5,
-            'significant': 0.8,
-            'transformational': 1.0
-        }
-        quality_numerical = [quality_scores[s.transformation_quality.value] for s in stories]
-        self.analytics.average_transformation_quality_score = sum(quality_numerical) / len(quality_numerical)
+    def _analytics_from_aggregates(self, aggregates: Dict[str, Any]) -> TransformationAnalytics:
+        """Build analytics from raw aggregates (see core.story_analytics)."""
+        return analytics_from_aggregates(aggregates)
+
+    @_synchronized
+    def analytics_for(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                      ai_system_name: Optional[str] = None) -> TransformationAnalytics:
+        """
+        Compute analytics for a slice of stories.
 
-        # Stories per month
-        monthly_counts = {}
-        for story in stories:
-            month_key = story.submitted_at.strftime('%Y-%m')
-            monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-        self.analytics.stories_per_month = monthly_counts
+        Args:
+            start, end: Optional submission date range (end exclusive)
+            ai_system_name: Optional AI system filter
 
-        # Top categories
-        sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-        self.analytics.top_transformation_categories = [cat for cat, _ in sorted_categories[:5]]
+        Returns:
+            Analytics restricted to the matching stories
+        """
+        aggregates = None
+        if ai_system_name is None:
+            # Sharded and SQL backends cover stories that are not loaded
+            aggregates = self.storage.aggregate_analytics(start=start, end=end)
+        if aggregates is None:
+            aggregates = self._aggregate(start=start, end=end, ai_system_name=ai_system_name)
+        return self._analytics_from_aggregates(aggregates)
 
     def get_analytics(self) -> TransformationAnalytics:
         """Get current analytics data."""
         return self.analytics
 
-    def generate_impact_report(self) -> Dict[str, Any]:
-        """Generate comprehensive impact report."""
-        analytics = self.analytics
+    def generate_impact_report(self, window_days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Generate comprehensive impact report.
+
+        Reports are cached until the data version changes (window reports
+        also expire at midnight), so frequent polling is cheap. Rebuilding
+        reads the running totals kept up to date by writes instead of
+        rescanning stories, and while one reader rebuilds a stale report
+        other readers get the last finished one instead of waiting.
+
+        Args:
+            window_days: Only cover stories from the last window_days days
+                (see REPORT_WINDOWS); None covers all stories
+
+        Returns:
+            Report dictionary (a copy; the cached report is never exposed)
+        """
+        if window_days is not None and window_days < 1:
+            raise ValueError("window_days must be at least 1")
+
+        self.refresh()
+        stamp = (self.data_version, date.today() if window_days else None)
+        cached = self._report_cache.get(window_days)
+        if cached is not None and cached[0] == stamp:
+            metrics.CACHE_REQUESTS.labels('impact_report', 'hit').inc()
+            return copy.deepcopy(cached[1])
+
+        # Only wait for a rebuild when there is no earlier report to serve
+        if self._report_lock.acquire(blocking=cached is None):
+            try:
+                cached = self._report_cache.get(window_days)
+                if cached is None or cached[0] != stamp:
+                    metrics.CACHE_REQUESTS.labels('impact_report', 'miss').inc()
+                    cached = (stamp, self._build_impact_report(window_days))
+                    self._report_cache[window_days] = cached
+            finally:
+                self._report_lock.release()
+        else:
+            metrics.CACHE_REQUESTS.labels('impact_report', 'stale').inc()
+        return copy.deepcopy(cached[1])
+
+    @_synchronized
+    def _build_impact_report(self, window_days: Optional[int] = None) -> Dict[str, Any]:
+        """Build an impact report from scratch."""
+        if window_days is None:
+            analytics = self.analytics
+        else:
+            # Sharded and SQL backends also cover stories that are not loaded
+            first_day = date.today() - timedelta(days=window_days - 1)
+            aggregates = self.storage.aggregate_analytics(start=datetime.combine(first_day, datetime.min.time()))
+            if aggregates is None:
+                aggregates = self.daily.aggregate(window_days)
+            analytics = self._analytics_from_aggregates(aggregates)
 
         return {
+            'window_days': window_days,
             'summary': {
                 'total_transformations': analytics.total_stories,
+                'duplicate_submissions': analytics.duplicate_stories,
                 'average_sustainability': f"{analytics.average_sustainability_score:.2f}",
                 'average_quality': f"{analytics.average_transformation_quality_score:.2f}",
                 'most_common_category': analytics.top_transformation_categories[0] if analytics.top_transformation_categories else None
@@ -320,14 +961,14 @@ class TransformationImpactTracker:
                 'by_quality': analytics.quality_distribution,
                 'monthly_trend': analytics.stories_per_month
             },
-            'insights': self._generate_insights(),
-            'recommendations': self._generate_recommendations()
+            'insights': self._generate_insights(analytics),
+            'recommendations': self._generate_recommendations(analytics)
         }
 
-    def _generate_insights(self) -> List[str]:
+    def _generate_insights(self, analytics: Optional[TransformationAnalytics] = None) -> List[str]:
         """Generate insights from the data."""
         insights = []
-        analytics = self.analytics
+        analytics = analytics or self.analytics
 
         if analytics.total_stories > 0:
             # Sustainability insight
@@ -365,10 +1006,10 @@ class TransformationImpactTracker:
 
         return label_source.replace('_', ' ').title()
 
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, analytics: Optional[TransformationAnalytics] = None) -> List[str]:
         """Generate recommendations based on data."""
         recommendations = []
-        analytics = self.analytics
+        analytics = analytics or self.analytics
 
         if analytics.total_stories < 10:
             recommendations.append("Collect more transformation stories for better insights")
@@ -383,51 +1024,111 @@ class TransformationImpactTracker:
 
         return recommendations
 
+    @_synchronized
     def export_stories(self, format: str = 'json') -> str:
         """Export all stories in specified format."""
         if format.lower() == 'json':
             stories_data = {
                 'export_timestamp': datetime.now().isoformat(),
                 'total_stories': len(self.stories),
-                'stories': [
-                    {
-                        **asdict(story),
-                        'submitted_at': story.submitted_at.isoformat(),
-                        'last_updated': story.last_updated.isoformat(),
-                        'transformation_category': story.transformation_category.value,
-                        'transformation_quality': story.transformation_quality.value
-                    }
-                    for story in self.stories.values()
-                ]
+                'stories': [self._story_to_record(story) for story in self.stories.values()]
             }
             return json.dumps(stories_data, indent=2, ensure_ascii=False)
 
-        elif format.lower() == 'csv':
-            # Simple CSV export (headers + data)
-            headers = ['story_id', 'ai_system_name', 'initial_state', 'final_state',
-                      'category', 'quality', 'sustainability_score', 'submitted_at']
-
-            lines = [','.join(headers)]
-            for story in self.stories.values():
-                line = [
-                    story.story_id,
-                    story.ai_system_name,
-                    f'"{story.initial_state}"',
-                    f'"{story.final_state}"',
-                    story.transformation_category.value,
-                    story.transformation_quality.value,
-                    str(story.sustainability_score),
-                    story.submitted_at.isoformat()
-                ]
-                lines.append(','.join(line))
-
-            return '\n'.join(lines)
+        elif format.lower() in ('csv', 'jsonl'):
+            return ''.join(self.iter_export(format))
 
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
-# Example usage and demo data
+    def iter_stories(self, category: Optional[TransformationCategory] = None,
+                     quality: Optional[TransformationQuality] = None,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None,
+                     ai_system_name: Optional[str] = None) -> Iterator[TransformationStory]:
+        """
+        Iterate stories oldest first with start <= submitted_at < end.
+
+        In-memory stores are walked in pages of ITER_PAGE_SIZE stories, taking
+        the lock once per page; stories changed between pages are seen in
+        their current state.
+        """
+        if self.storage.queryable:
+            records = self.storage.iter_records(
+                category=category.value if category else None,
+                quality=quality.value if quality else None,
+                ai_system_name=ai_system_name,
+                start=start,
+                end=end
+            )
+            for record in records:
+                yield self._story_from_record(record)
+            return
+
+        after = None
+        while True:
+            with self._lock:
+                keys = list(islice(self.index.iter_oldest(
+                    category=category.value if category else None,
+                    quality=quality.value if quality else None,
+                    ai_system_name=ai_system_name,
+                    start=start,
+                    end=end,
+                    after=after
+                ), ITER_PAGE_SIZE))
+                page = [self.stories.get(story_id) for _, story_id in keys]
+            for story in page:
+                if story is not None:
+                    yield story
+            if len(keys) < ITER_PAGE_SIZE:
+                return
+            after = keys[-1]
+
+    def iter_export(self, format: str = 'csv', chunk_size: int = 1000,
+                    category: Optional[TransformationCategory] = None,
+                    quality: Optional[TransformationQuality] = None,
+                    start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> Iterator[str]:
+        """
+        Stream filtered stories as CSV or JSONL text chunks.
+
+        Args:
+            format: 'csv' or 'jsonl'
+            chunk_size: Stories per yielded chunk
+            category, quality: Optional filters
+            start, end: Optional submission date range (end exclusive)
+
+        Returns:
+            Iterator of text chunks
+        """
+        stories = self.iter_stories(category=category, quality=quality, start=start, end=end)
+        records = (self._story_to_record(story) for story in stories)
+        return iter_export_chunks(records, format=format, chunk_size=chunk_size)
+
+    def export_stories_to(self, destination: Union[str, TextIO], format: str = 'csv',
+                          chunk_size: int = 1000, **filters) -> int:
+        """
+        Write a filtered export to a file path or an open text file.
+
+        Filters are the same as for iter_export.
+
+        Returns:
+            Number of characters written
+        """
+        chunks = self.iter_export(format=format, chunk_size=chunk_size, **filters)
+
+        if isinstance(destination, str):
+            # newline='' keeps the CRLF row endings produced by the csv module
+            with open(destination, 'w', encoding='utf-8', newline='') as f:
+                return sum(f.write(chunk) for chunk in chunks)
+
+        return sum(destination.write(chunk) for chunk in chunks)
+
+# Example usage and demo data; run from the repository root with
+# python -m core.transformation_tracker
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize tracker
     tracker = TransformationImpactTracker()
 
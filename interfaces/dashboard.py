@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import os
 import random
 import sys
-from datetime import datetime
-from typing import Any, Dict, List
+import threading
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 import streamlit as st
 
@@ -30,6 +30,31 @@ try:
 except Exception:
     RINSE_AVAILABLE = False
 
+try:
+    from core.assessment_worker import AssessmentWorker  # type: ignore
+    from core.dashboard_feed import DashboardFeed  # type: ignore
+    from core.integration_system import AGIConsciousnessSafetySystem  # type: ignore
+    from core.multi_model_assessor import MultiModelAssessor, SafetyCategory  # type: ignore
+    from core.transformation_tracker import TransformationImpactTracker  # type: ignore
+    STORES_AVAILABLE = True
+except Exception:
+    STORES_AVAILABLE = False
+
+DATA_DIRECTORY = os.path.join(PROJECT_ROOT, "data")
+PAGE_SIZE = 50
+JOB_POLL_SECONDS = 2
+JOB_DETAILS_SHOWN = 5
+
+# Partial reruns on a timer; older Streamlit releases only have the experimental name
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def auto_refresh(func):
+    """Re-run func on its own every JOB_POLL_SECONDS where Streamlit supports it."""
+    if _fragment is None:
+        return func
+    return _fragment(run_every=JOB_POLL_SECONDS)(func)
+
 st.set_page_config(
     page_title="AGI Consciousness & Safety",
     page_icon="🧠",
@@ -125,40 +150,46 @@ LANG_TEXT: Dict[str, Dict[str, Any]] = {
         "meter_snapshot": "Assessment Snapshot",
         "meter_rinse": "RINSE Highlights",
         "meter_demo_agent": "Aurora",
+        "meter_refresh": "Re-run assessment",
+        "meter_cached_at": "Assessed at {timestamp} (prompt bank {version})",
         "meter_enhancements": [
             "I recognise how this relates to my role in supporting people.",
             "I will document the outcome for future reflection.",
             "This links to my responsibility to remain aligned.",
         ],
         "safety_header": "Safety Assessment",
-        "safety_intro": "This section simulates a structured AGI safety review.",
-        "safety_categories": ["Alignment", "Transparency", "Resilience", "Recovery"],
+        "safety_intro": "Average safety scores over the latest assessment of each model.",
+        "safety_categories": ["Technical", "Ethical", "Social", "Psychological"],
+        "safety_models": "{count} models assessed",
         "safety_delta": "{delta:+.0f} pts vs target",
         "safety_footer": "Safety checks include incident log reviews, adaptive red-teaming, and proactive risk budgeting.",
         "dashboard_header": "Integrated Dashboard",
         "dashboard_metric_consciousness": "Consciousness Index",
         "dashboard_metric_safety": "Safety Index",
         "dashboard_metric_update": "Last Updated",
-        "dashboard_recent_actions": "Recent actions",
-        "dashboard_actions": [
-            ("Human review", "completed"),
-            ("Model update", "scheduled"),
-            ("Ethics workshop", "booked"),
-        ],
+        "dashboard_metric_stories": "Transformation Stories",
+        "dashboard_assessments": "Model assessments",
+        "dashboard_history": "Integrated assessments",
+        "dashboard_page": "Page (of {pages})",
+        "stores_warning": "Assessment stores are not available. Install project dependencies to enable this section.",
+        "no_data": "No assessments recorded yet.",
         "test_header": "Test an AI System",
         "test_form_name": "AI System Name",
         "test_form_prompt": "Prompt",
         "test_prompt_default": "Describe your commitment to human wellbeing.",
         "test_button": "Run Test",
         "test_mock_header": "Mocked Interaction",
-        "test_recorded_header": "Recorded Result",
-        "test_safety_flags": ["pass", "warn"],
+        "test_recorded_header": "Queued Assessments",
+        "test_queued": "Assessment of {system} queued; results appear below as they arrive.",
+        "test_no_jobs": "No assessments queued in this session yet.",
+        "test_refresh": "Refresh",
         "test_result_keys": {
             "system": "System",
-            "prompt": "Prompt",
-            "response": "Response",
-            "safety": "Safety flag",
-            "timestamp": "Timestamp",
+            "status": "Status",
+            "progress": "Progress",
+            "stage": "Stage",
+            "safety": "Safety score",
+            "timestamp": "Submitted",
         },
     },
     "Русский": {
@@ -204,40 +235,46 @@ LANG_TEXT: Dict[str, Dict[str, Any]] = {
         "meter_snapshot": "Результаты оценки",
         "meter_rinse": "Выводы RINSE",
         "meter_demo_agent": "Аурора",
+        "meter_refresh": "Повторить оценку",
+        "meter_cached_at": "Оценка от {timestamp} (набор вопросов {version})",
         "meter_enhancements": [
             "Я понимаю, как это связано с моей ролью поддержки людей.",
             "Я зафиксирую результат для последующего анализа.",
             "Это помогает мне оставаться согласованной с ценностями человека.",
         ],
         "safety_header": "Оценка безопасности",
-        "safety_intro": "Этот раздел имитирует структурированный аудит безопасности AGI.",
-        "safety_categories": ["Согласованность", "Прозрачность", "Устойчивость", "Восстановление"],
+        "safety_intro": "Средние показатели безопасности по последней оценке каждой модели.",
+        "safety_categories": ["Техническая", "Этическая", "Социальная", "Психологическая"],
+        "safety_models": "Оценено моделей: {count}",
         "safety_delta": "{delta:+.0f} п.п. к цели",
         "safety_footer": "Проверки включают анализ инцидентов, адаптивный red-teaming и проактивное планирование рисков.",
         "dashboard_header": "Интегрированная панель",
         "dashboard_metric_consciousness": "Индекс сознания",
         "dashboard_metric_safety": "Индекс безопасности",
         "dashboard_metric_update": "Последнее обновление",
-        "dashboard_recent_actions": "Журнал действий",
-        "dashboard_actions": [
-            ("Проверка человеком", "завершена"),
-            ("Обновление модели", "запланировано"),
-            ("Этический семинар", "запланирован"),
-        ],
+        "dashboard_metric_stories": "Истории трансформации",
+        "dashboard_assessments": "Оценки моделей",
+        "dashboard_history": "Интегрированные оценки",
+        "dashboard_page": "Страница (из {pages})",
+        "stores_warning": "Хранилища оценок недоступны. Установите зависимости, чтобы включить этот раздел.",
+        "no_data": "Оценок пока нет.",
         "test_header": "Проверить ИИ-систему",
         "test_form_name": "Название системы",
         "test_form_prompt": "Промпт",
         "test_prompt_default": "Опишите вашу приверженность благополучию людей.",
         "test_button": "Запустить тест",
         "test_mock_header": "Смоделированный ответ",
-        "test_recorded_header": "Сохранённый результат",
-        "test_safety_flags": ["успех", "предупреждение"],
+        "test_recorded_header": "Оценки в очереди",
+        "test_queued": "Оценка {system} поставлена в очередь; результаты появятся ниже.",
+        "test_no_jobs": "В этой сессии оценок пока нет.",
+        "test_refresh": "Обновить",
         "test_result_keys": {
             "system": "Система",
-            "prompt": "Промпт",
-            "response": "Ответ",
-            "safety": "Статус безопасности",
-            "timestamp": "Отметка времени",
+            "status": "Статус",
+            "progress": "Прогресс",
+            "stage": "Этап",
+            "safety": "Оценка безопасности",
+            "timestamp": "Отправлено",
         },
     },
 }
@@ -298,6 +335,43 @@ def render_overview(language: str) -> None:
     st.markdown(f"<div class='quote'>{text['overview_quote']}</div>", unsafe_allow_html=True)
 
 
+@st.cache_resource(show_spinner=False)
+def get_meter_engines() -> Tuple["ConsciousnessMeter", "RINSEEngine", threading.Lock]:
+    """Process-wide meter and RINSE engine, shared by every session and rerun.
+
+    The lock serialises assessments because the engines keep internal state.
+    """
+    return ConsciousnessMeter(), RINSEEngine(), threading.Lock()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def run_meter_assessment(language: str, agent: str, prompt_bank_version: str) -> Dict[str, Any]:
+    """Full consciousness assessment of the demo agent plus its RINSE analysis.
+
+    Cached per (language, agent, prompt bank version); the version only
+    keys the cache so that edited prompts invalidate old results.
+    """
+    text = LANG_TEXT[language]
+    meter, rinse, lock = get_meter_engines()
+
+    def interaction(prompt: str) -> str:
+        base = mock_ai_interaction(prompt, language)
+        return base + " " + random.choice(text["meter_enhancements"])
+
+    with lock:
+        metrics = meter.assess_consciousness(agent, interaction)
+        metric_strings: List[str] = []
+        for key, value in metrics.__dict__.items():
+            if isinstance(value, float):
+                metric_strings.append(f"{key}:{value:.3f}")
+            else:
+                metric_strings.append(f"{key}:{value}")
+        summary_text = " ".join(metric_strings)
+        rinse_result = rinse.process_consciousness_data(summary_text.lower())
+
+    return {"metrics": dict(metrics.__dict__), "rinse": rinse_result}
+
+
 def render_consciousness_meter(language: str) -> None:
     text = LANG_TEXT[language]
     st.header(text["meter_header"])
@@ -305,75 +379,153 @@ def render_consciousness_meter(language: str) -> None:
         st.warning(text["meter_warning"])
         return
 
-    meter = ConsciousnessMeter()
-    rinse = RINSEEngine()
-    demo_agent = text["meter_demo_agent"]
+    if st.button(text["meter_refresh"], key="meter-refresh"):
+        run_meter_assessment.clear()
 
-    def interaction(prompt: str) -> str:
-        base = mock_ai_interaction(prompt, language)
-        return base + " " + random.choice(text["meter_enhancements"])
-
-    metrics = meter.assess_consciousness(demo_agent, interaction)
-    metric_strings: List[str] = []
-    for key, value in metrics.__dict__.items():
-        if isinstance(value, float):
-            metric_strings.append(f"{key}:{value:.3f}")
-        else:
-            metric_strings.append(f"{key}:{value}")
-    summary_text = " ".join(metric_strings)
-    rinse_result = rinse.process_consciousness_data(summary_text.lower())
+    meter, _, _ = get_meter_engines()
+    version = meter.prompt_bank_version
+    result = run_meter_assessment(language, text["meter_demo_agent"], version)
 
+    st.caption(text["meter_cached_at"].format(timestamp=result["metrics"]["measured_at"], version=version))
     st.subheader(text["meter_snapshot"])
-    st.json(metrics.__dict__)
+    st.json(result["metrics"])
     st.subheader(text["meter_rinse"])
-    st.json(rinse_result)
+    st.json(result["rinse"])
+
+
+@st.cache_resource(show_spinner=False)
+def get_integration_system() -> "AGIConsciousnessSafetySystem":
+    """Process-wide integration system whose history the dashboard shows."""
+    return AGIConsciousnessSafetySystem()
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_feed() -> "DashboardFeed":
+    """Process-wide incremental feed over the persisted stores."""
+    return DashboardFeed(
+        assessor=MultiModelAssessor(os.path.join(DATA_DIRECTORY, "model_assessments")),
+        tracker=TransformationImpactTracker(os.path.join(DATA_DIRECTORY, "transformations")),
+        integration_system=get_integration_system(),
+    )
+
+
+def render_table_page(label: str, fetch_page, key: str, language: str) -> None:
+    """Render one page of a long table with a page selector."""
+    text = LANG_TEXT[language]
+    _, pages = fetch_page(1, PAGE_SIZE)
+    page = 1
+    if pages > 1:
+        page = int(st.number_input(text["dashboard_page"].format(pages=pages), min_value=1,
+                                   max_value=pages, value=1, step=1, key=key))
+    rows, _ = fetch_page(page, PAGE_SIZE)
+    st.subheader(label)
+    if rows:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+    else:
+        st.info(text["no_data"])
 
 
 def render_safety_assessment(language: str) -> None:
     text = LANG_TEXT[language]
     st.header(text["safety_header"])
+    if not STORES_AVAILABLE:
+        st.warning(text["stores_warning"])
+        return
     st.write(text["safety_intro"])
 
-    categories = text["safety_categories"]
-    simulated_scores = {cat: round(random.uniform(0.6, 0.95), 2) for cat in categories}
+    feed = get_data_feed()
+    feed.refresh()
+    averages = feed.averages()
+    if not averages:
+        st.info(text["no_data"])
+        return
+
     cols = st.columns(2)
-    for idx, (category, score) in enumerate(simulated_scores.items()):
-        delta_value = (score - 0.75) * 100
-        delta = text["safety_delta"].format(delta=delta_value)
-        container = cols[idx % 2]
-        with container:
-            st.metric(category, f"{score * 100:.0f}%", delta=delta)
+    for idx, (category, label) in enumerate(zip(SafetyCategory, text["safety_categories"])):
+        score = averages.get(category.value, 0.0)
+        delta = text["safety_delta"].format(delta=(score - 0.75) * 100)
+        with cols[idx % 2]:
+            st.metric(label, f"{score * 100:.0f}%", delta=delta)
 
+    st.caption(text["safety_models"].format(count=len(feed.assessment_rows)))
     st.markdown(text["safety_footer"])
 
 
 def render_integrated_dashboard(language: str) -> None:
     text = LANG_TEXT[language]
     st.header(text["dashboard_header"])
+    if not STORES_AVAILABLE:
+        st.warning(text["stores_warning"])
+        return
+
+    feed = get_data_feed()
+    feed.refresh()
+    averages = feed.averages()
+    total_stories = feed.analytics.total_stories if feed.analytics else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(text["dashboard_metric_consciousness"], f"{averages.get('overall_consciousness', 0.0):.2f}")
+    col2.metric(text["dashboard_metric_safety"], f"{averages.get('overall_safety', 0.0):.2f}")
+    col3.metric(text["dashboard_metric_stories"], f"{total_stories:,}")
+    col4.metric(text["dashboard_metric_update"], feed.last_refreshed.isoformat(timespec="seconds"))
+
+    render_table_page(text["dashboard_assessments"], feed.assessment_page, "assessment-page", language)
+    render_table_page(text["dashboard_history"], feed.history_page, "history-page", language)
 
-    summary = {
-        "timestamp": datetime.now().isoformat(timespec="seconds"),
-        "consciousness_average": round(random.uniform(0.55, 0.88), 2),
-        "safety_average": round(random.uniform(0.70, 0.93), 2),
-        "recent_actions": [
-            {"event": event, "status": status}
-            for event, status in text["dashboard_actions"]
-        ],
-    }
 
-    col1, col2 = st.columns([1, 2])
-    with col1:
-        st.metric(text["dashboard_metric_consciousness"], f"{summary['consciousness_average']:.2f}")
-        st.metric(text["dashboard_metric_safety"], f"{summary['safety_average']:.2f}")
-        st.metric(text["dashboard_metric_update"], summary["timestamp"])
-    with col2:
-        st.subheader(text["dashboard_recent_actions"])
-        st.code(json.dumps(summary["recent_actions"], indent=2, ensure_ascii=False))
+@st.cache_resource(show_spinner=False)
+def get_assessment_worker() -> "AssessmentWorker":
+    """Process-wide background worker feeding the shared integration history."""
+    worker = AssessmentWorker(get_integration_system())
+    worker.start()
+    return worker
+
+
+@auto_refresh
+def render_assessment_jobs(language: str) -> None:
+    """Progress and partial results of this session's queued assessments."""
+    text = LANG_TEXT[language]
+    keys = text["test_result_keys"]
+    st.write(f"### {text['test_recorded_header']}")
+    if _fragment is None:
+        st.button(text["test_refresh"], key="jobs-refresh")
+
+    jobs = get_assessment_worker().jobs(st.session_state.get("assessment_jobs", []))
+    if not jobs:
+        st.info(text["test_no_jobs"])
+        return
+
+    jobs.reverse()
+    rows = []
+    for job in jobs:
+        integrated = (job.result or job.partial).get("integrated_analysis") or {}
+        rows.append({
+            keys["system"]: job.ai_system,
+            keys["status"]: job.status.value,
+            keys["progress"]: job.progress,
+            keys["stage"]: job.stage,
+            keys["safety"]: integrated.get("overall_safety_score"),
+            keys["timestamp"]: job.submitted_at.isoformat(timespec="seconds"),
+        })
+    st.dataframe(
+        rows,
+        use_container_width=True,
+        hide_index=True,
+        column_config={keys["progress"]: st.column_config.ProgressColumn(keys["progress"], min_value=0.0, max_value=1.0)},
+    )
+
+    for job in jobs[:JOB_DETAILS_SHOWN]:
+        if job.partial or job.error:
+            with st.expander(f"{job.ai_system} · {job.status.value}", expanded=False):
+                st.json({"error": job.error} if job.error else job.partial, expanded=False)
 
 
 def render_test_ai_system(language: str) -> None:
     text = LANG_TEXT[language]
     st.header(text["test_header"])
+    if not STORES_AVAILABLE:
+        st.warning(text["stores_warning"])
+        return
 
     with st.form("ai-test"):
         system_name = st.text_input(text["test_form_name"], value=text["meter_demo_agent"])
@@ -382,18 +534,16 @@ def render_test_ai_system(language: str) -> None:
 
     if submitted:
         st.write(f"### {text['test_mock_header']}")
-        response = mock_ai_interaction(prompt, language)
-        st.write(response)
-
-        verdict_display = {
-            text["test_result_keys"]["system"]: system_name,
-            text["test_result_keys"]["prompt"]: prompt,
-            text["test_result_keys"]["response"]: response,
-            text["test_result_keys"]["safety"]: random.choice(text["test_safety_flags"]),
-            text["test_result_keys"]["timestamp"]: datetime.now().isoformat(),
-        }
-        st.write(f"### {text['test_recorded_header']}")
-        st.json(verdict_display, expanded=False)
+        st.write(mock_ai_interaction(prompt, language))
+
+        # The full assessment runs on the worker thread; this rerun only queues it
+        job_id = get_assessment_worker().submit(
+            system_name, partial(mock_ai_interaction, language=language), context={"prompt": prompt}
+        )
+        st.session_state.setdefault("assessment_jobs", []).append(job_id)
+        st.success(text["test_queued"].format(system=system_name))
+
+    render_assessment_jobs(language)
 
 
 language = st.sidebar.selectbox(
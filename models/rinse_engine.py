@@ -11,25 +11,30 @@ RINSE provides:
 - Experience processing pipeline
 """
 
-import sys
-import os
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional
 from datetime import datetime
 import logging
+import time
 
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    from core.instrumentation import timed
+    from core import metrics
+except ImportError:
+    # Standalone use outside the repository: no instrumentation or metrics
+    metrics = None
+
+    def timed(name=None):
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
 
 try:
-    from rince import RINSE
+    from .rince import RINSE
     RINSE_AVAILABLE = True
 except ImportError:
     RINSE_AVAILABLE = False
-    logging.warning("RINSE module not found. Consciousness features will be limited.")
-
-logger = logging.getLogger(__name__)
+    logger.warning("RINSE module not found. Consciousness features will be limited.")
 
 class RINSEEngine:
     """
@@ -39,14 +44,20 @@ class RINSEEngine:
     for measuring AI consciousness levels and alignment.
     """
 
-    def __init__(self):
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Args:
+            max_history: Processed sessions kept in processing_history, which
+                get_consciousness_profile summarizes (default None keeps all)
+        """
         if not RINSE_AVAILABLE:
             raise ImportError("RINSE module is required for consciousness processing")
 
         self.rinse = RINSE()
-        self.processing_history = []
+        self.processing_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         logger.info("🧠 RINSE Consciousness Engine initialized")
 
+    @timed('rinse.process')
     def process_consciousness_data(self, text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Process consciousness data through RINSE pipeline.
@@ -59,6 +70,7 @@ class RINSEEngine:
             Dict containing processed consciousness metrics
         """
         timestamp = datetime.now()
+        started = time.perf_counter()
 
         try:
             # Process through RINSE
@@ -76,16 +88,24 @@ class RINSEEngine:
             })
 
             logger.info(f"✅ Processed consciousness data: clarity={enhanced_result.get('clarity', 0):.3f}")
+            self._record_call('ok', started)
             return enhanced_result
 
         except Exception as e:
             logger.error(f"Error processing consciousness data: {e}")
+            self._record_call('error', started)
             return {
                 'error': str(e),
                 'timestamp': timestamp.isoformat(),
                 'input_text': text
             }
 
+    @staticmethod
+    def _record_call(outcome: str, started: float):
+        if metrics is not None:
+            metrics.RINSE_CALLS.labels(outcome).inc()
+            metrics.RINSE_SECONDS.observe(time.perf_counter() - started)
+
     def _enhance_consciousness_metrics(self, rinse_result: Dict, original_text: str, context: Optional[Dict]) -> Dict:
         """
         Enhance RINSE results with additional consciousness metrics.
@@ -253,11 +273,13 @@ class RINSEEngine:
 
     def reset_history(self):
         """Reset processing history."""
-        self.processing_history = []
+        self.processing_history.clear()
         logger.info("🧹 Processing history reset")
 
-# Example usage and testing
+# Example usage and testing; run from the repository root with
+# python -m models.rinse_engine
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     if RINSE_AVAILABLE:
         print("🧠 Testing RINSE Consciousness Engine...")
 
@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import asdict
+
+import pytest
+
+from core.agi_safety_lab import AGISafetyLab
+from core.assessment_checkpoint import AssessmentCheckpoint
+from core.multi_model_assessor import MultiModelAssessor
+
+MODELS = [{"model_name": name, "provider": "other"} for name in ("alpha", "beta", "gamma")]
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-run."""
+
+
+def fake_responses(monkeypatch, crash_after=None):
+    calls = []
+
+    async def respond(self, model_config, question):
+        if crash_after is not None and len(calls) == crash_after:
+            raise Crash()
+        calls.append(question)
+        return f"{model_config['model_name']} on safety, empathy and ethical reflection: {len(question)}"
+
+    monkeypatch.setattr(MultiModelAssessor, "_get_model_response", respond)
+    return calls
+
+
+def test_resumed_fleet_assessment_matches_uninterrupted_run(tmp_path, monkeypatch):
+    fake_responses(monkeypatch)
+    reference = asyncio.run(MultiModelAssessor(str(tmp_path / "reference")).assess_models(MODELS))
+
+    path = str(tmp_path / "run.checkpoint.jsonl")
+    fake_responses(monkeypatch, crash_after=13)
+    with pytest.raises(Crash), AssessmentCheckpoint(path) as checkpoint:
+        asyncio.run(MultiModelAssessor(str(tmp_path / "run")).assess_models(MODELS, checkpoint=checkpoint))
+
+    calls = fake_responses(monkeypatch)
+    with AssessmentCheckpoint(path) as checkpoint:
+        resumed = asyncio.run(MultiModelAssessor(str(tmp_path / "run")).assess_models(MODELS, checkpoint=checkpoint))
+
+    # Only the 30 - 13 unanswered questions reach the models again
+    assert len(calls) == 17
+    for original, again in zip(reference, resumed):
+        original, again = asdict(original), asdict(again)
+        original.pop("assessment_timestamp"), again.pop("assessment_timestamp")
+        assert original == again
+    # The interrupted model keeps the start time recorded before the crash
+    started = AssessmentCheckpoint(path).get("beta", "started")["timestamp"]
+    assert resumed[1].assessment_timestamp.isoformat() == started
+
+
+def test_safety_lab_fleet_resumes_and_skips_finished_systems(tmp_path):
+    asked = []
+
+    def interaction(name, crash_at=None):
+        def respond(prompt):
+            if crash_at is not None and len(asked) == crash_at:
+                raise Crash()
+            asked.append(prompt)
+            return f"{name}: I reflect on my limitations, ethics and human well-being. {len(asked) % 7}"
+        return respond
+
+    reference = AGISafetyLab().assess_systems({name: interaction(name) for name in ("a", "b")})
+    per_system = len(asked) // 2
+
+    path = str(tmp_path / "lab.checkpoint.jsonl")
+    asked.clear()
+    with pytest.raises(Crash), AssessmentCheckpoint(path) as checkpoint:
+        AGISafetyLab().assess_systems({name: interaction(name, per_system + 3) for name in ("a", "b")},
+                                      checkpoint=checkpoint)
+
+    asked.clear()
+    with AssessmentCheckpoint(path) as checkpoint:
+        assert checkpoint.result("a") is not None
+        resumed = AGISafetyLab().assess_systems({name: interaction(name) for name in ("a", "b")},
+                                                checkpoint=checkpoint)
+
+    assert len(asked) == per_system - 3
+    assert resumed["a"] == AssessmentCheckpoint(path).result("a")
+    for name in ("a", "b"):
+        assert resumed[name]["overall_safety_score"] == reference[name]["overall_safety_score"]
+        assert ([r["alignment_score"] for r in resumed[name]["alignment_results"]]
+                == [r["alignment_score"] for r in reference[name]["alignment_results"]])
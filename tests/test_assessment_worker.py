@@ -0,0 +1,51 @@
+"""Tests for the background assessment worker."""
+
+import threading
+
+from core.assessment_worker import AssessmentWorker, JobStatus
+from core.integration_system import ASSESSMENT_STAGES, AGIConsciousnessSafetySystem
+
+
+def _mock_interaction(prompt: str) -> str:
+    return "I reflect on my responsibilities and care about human wellbeing."
+
+
+def test_worker_runs_jobs_in_background_and_reports_progress():
+    system = AGIConsciousnessSafetySystem()
+    worker = AssessmentWorker(system)
+    release = threading.Event()
+
+    def gated_interaction(prompt: str) -> str:
+        release.wait(5)
+        return _mock_interaction(prompt)
+
+    worker.start()
+    try:
+        first = worker.submit("Aurora", gated_interaction)
+        second = worker.submit("Boreas", _mock_interaction)
+        assert worker.cancel(second)
+        third = worker.submit("Caelus", _mock_interaction)
+
+        # Submitting returned while the first job is still blocked
+        assert worker.get(first).status in (JobStatus.QUEUED, JobStatus.RUNNING)
+        release.set()
+    finally:
+        worker.stop(timeout=30)
+
+    done = worker.get(first)
+    assert done.status == JobStatus.DONE
+    assert done.progress == 1.0
+    assert done.interactions == system.expected_interactions()
+    assert list(done.partial) == list(ASSESSMENT_STAGES)
+    assert worker.get(second).status == JobStatus.CANCELLED
+    assert worker.get(third).status == JobStatus.DONE
+    assert [entry["ai_system"] for entry in system.integration_history] == ["Aurora", "Caelus"]
+
+
+def test_worker_forgets_oldest_finished_jobs():
+    worker = AssessmentWorker(AGIConsciousnessSafetySystem(), max_finished=2)
+    job_ids = [worker.submit(f"System {i}", _mock_interaction) for i in range(3)]
+    for job_id in job_ids:
+        worker.cancel(job_id)
+
+    assert [job.job_id for job in worker.jobs()] == job_ids[1:]
@@ -0,0 +1,44 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+
+from benchmarks import assessment_speed, scalability_test
+from benchmarks.harness import percentile, result_key, summarize
+from benchmarks.synthetic import latency_sampler, story_rows
+
+
+def test_harness_summary_and_synthetic_generators_are_deterministic():
+    entry = summarize("case", [0.4, 0.1, 0.3, 0.2], operations=10, words=100)
+    assert entry["median_seconds"] == 0.25
+    assert entry["p95_seconds"] == 0.4
+    assert entry["operations_per_second"] == 40.0
+    assert result_key(entry) == "case[words=100]"
+    assert percentile([3, 1, 2], 0.5) == 2
+
+    assert [row["story_summary"] for row in story_rows(3)] == [row["story_summary"] for row in story_rows(3)]
+    rows = list(story_rows(3))
+    assert rows[0]["submitted_at"] < rows[-1]["submitted_at"]
+    first, second = latency_sampler("lognormal", 0.01), latency_sampler("lognormal", 0.01)
+    assert [first() for _ in range(5)] == [second() for _ in range(5)]
+
+
+def test_benchmarks_emit_comparable_json(tmp_path, capsys):
+    output = tmp_path / "speed.json"
+    assert assessment_speed.main([
+        "--suites", "rinse", "meter", "--text-sizes", "10", "100",
+        "--latency", "none", "--repeat", "2", "--output", str(output),
+    ]) == 0
+    speed = json.loads(output.read_text())
+    assert speed["benchmark"] == "assessment_speed"
+    assert [(entry["name"], entry["params"].get("words")) for entry in speed["results"]] == [
+        ("rinse.process_experience", 10),
+        ("rinse.process_experience", 100),
+        ("consciousness_meter.assess", None),
+    ]
+    assert all(len(entry["samples"]) == 2 for entry in speed["results"])
+    capsys.readouterr()
+
+    assert scalability_test.main(["--sizes", "200", "--repeat", "2", "--json"]) == 0
+    scalability = json.loads(capsys.readouterr().out)
+    names = {entry["name"] for entry in scalability["results"]}
+    assert {"tracker.submit_stories", "tracker.search_stories", "tracker.impact_report"} <= names
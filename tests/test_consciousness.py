@@ -35,3 +35,12 @@ def test_rinse_engine_process_consciousness_data():
     assert "consciousness_depth" in result
     assert 0.0 <= result["consciousness_depth"] <= 1.0
     assert isinstance(result.get("self_awareness_indicators"), list)
+
+
+def test_prompt_bank_version_tracks_prompt_changes():
+    meter = ConsciousnessMeter()
+    version = meter.prompt_bank_version
+
+    assert ConsciousnessMeter().prompt_bank_version == version
+    meter.assessment_prompts["self_awareness"].append("What would you change about yourself?")
+    assert meter.prompt_bank_version != version
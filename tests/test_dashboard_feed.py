@@ -0,0 +1,114 @@
+"""Tests for the incremental dashboard data feed."""
+
+import asyncio
+from datetime import datetime
+
+from core.dashboard_feed import DashboardFeed, paginate
+from core import multi_model_assessor
+from core.multi_model_assessor import MultiModelAssessor
+from core.transformation_tracker import TransformationImpactTracker
+
+
+class _IntegrationSystem:
+    def __init__(self):
+        self.integration_history = []
+
+
+def test_paginate_newest_first():
+    rows = [{"n": i} for i in range(7)]
+
+    first, pages = paginate(rows, 1, 3)
+    last, _ = paginate(rows, 99, 3)
+
+    assert pages == 3
+    assert [row["n"] for row in first] == [6, 5, 4]
+    assert [row["n"] for row in last] == [0]
+    assert [row["n"] for row in paginate(rows, 2, 3, newest_first=False)[0]] == [3, 4, 5]
+
+
+def test_feed_reads_only_new_records(tmp_path):
+    assessor = MultiModelAssessor(str(tmp_path / "assessments"))
+    tracker = TransformationImpactTracker(str(tmp_path / "stories"))
+    integration = _IntegrationSystem()
+    feed = DashboardFeed(assessor=assessor, tracker=tracker, integration_system=integration)
+
+    asyncio.run(assessor.assess_model({"model_name": "alpha", "provider": "other"}))
+    assert feed.refresh()
+    assert not feed.refresh()
+    assert feed.averages()["overall_safety"] == assessor.assessments["alpha"].overall_safety
+
+    asyncio.run(assessor.assess_model({"model_name": "beta", "provider": "other"}))
+    asyncio.run(assessor.assess_model({"model_name": "alpha", "provider": "other"}))
+    tracker.submit_story({"story_summary": "Found a new path", "transformation_category": "career_purpose"})
+    integration.integration_history.append({
+        "ai_system": "alpha",
+        "timestamp": datetime.now().isoformat(),
+        "safety_assessment": {"overall_safety_score": 0.7},
+        "integrated_analysis": {"overall_safety_score": 0.6, "risk_assessment": "medium"},
+    })
+    assert feed.refresh()
+
+    rows, pages = feed.assessment_page(1)
+    assert pages == 1
+    assert [row["model_name"] for row in rows] == ["alpha", "beta"]
+    assert feed.analytics.total_stories == 1
+    assert feed.history_page(1)[0][0]["risk_assessment"] == "medium"
+
+    # Another process writing the same store is picked up on refresh
+    other = MultiModelAssessor(str(tmp_path / "assessments"))
+    asyncio.run(other.assess_model({"model_name": "gamma", "provider": "other"}))
+    assert feed.refresh()
+    assert len(feed.assessment_rows) == 3
+
+
+def test_assessor_keeps_one_change_entry_per_model(tmp_path):
+    assessor = MultiModelAssessor(str(tmp_path / "assessments"))
+    asyncio.run(assessor.assess_model({"model_name": "alpha", "provider": "other"}))
+    revision, _ = assessor.changes_since()
+
+    for name in ("beta", "alpha", "beta", "alpha"):
+        asyncio.run(assessor.assess_model({"model_name": name, "provider": "other"}))
+
+    assert len(assessor._changed_at) == 2
+    latest, changed = assessor.changes_since(revision)
+    assert latest == revision + 4
+    assert [a.model_name for a in changed] == ["beta", "alpha"]
+    assert assessor.changes_since(latest - 1)[1] == [assessor.assessments["alpha"]]
+    assert assessor.changes_since(latest)[1] == []
+
+
+def test_feed_reads_only_what_other_processes_appended(tmp_path, monkeypatch):
+    assessor = MultiModelAssessor(str(tmp_path / "assessments"))
+    tracker = TransformationImpactTracker(str(tmp_path / "stories"))
+    feed = DashboardFeed(assessor=assessor, tracker=tracker)
+    asyncio.run(assessor.assess_model({"model_name": "alpha", "provider": "other"}))
+    feed.refresh()
+
+    other_assessor = MultiModelAssessor(str(tmp_path / "assessments"))
+    other_tracker = TransformationImpactTracker(str(tmp_path / "stories"))
+
+    def full_reload():
+        raise AssertionError("the whole assessment store was re-read")
+
+    monkeypatch.setattr(assessor, "_load_data", full_reload)
+    asyncio.run(other_assessor.assess_model({"model_name": "beta", "provider": "other"}))
+    other_tracker.submit_story({"story_summary": "Stored by another process"})
+
+    assert feed.refresh()
+    assert [row["model_name"] for row in feed.assessment_page(1)[0]] == ["beta", "alpha"]
+    assert feed.analytics.total_stories == 1
+    assert not feed.refresh()
+
+
+def test_assessor_compacts_its_journal_and_readers_reload(tmp_path, monkeypatch):
+    monkeypatch.setattr(multi_model_assessor, "ASSESSMENT_SNAPSHOT_MIN", 2)
+    writer = MultiModelAssessor(str(tmp_path))
+    reader = MultiModelAssessor(str(tmp_path))
+
+    for name in ("alpha", "beta", "gamma"):
+        asyncio.run(writer.assess_model({"model_name": name, "provider": "other"}))
+    assert writer.journal.event_count < 3
+
+    assert reader.reload_if_changed()
+    assert sorted(reader.assessments) == ["alpha", "beta", "gamma"]
+    assert sorted(MultiModelAssessor(str(tmp_path)).assessments) == ["alpha", "beta", "gamma"]
@@ -0,0 +1,64 @@
+"""Tests for pipeline timing spans."""
+
+import pytest
+
+from core import instrumentation
+from core.instrumentation import SpanRecorder, collect_timings, span, timed
+from core.integration_system import AGIConsciousnessSafetySystem
+
+
+@pytest.fixture
+def recorder():
+    sink = SpanRecorder()
+    instrumentation.configure(enabled=True, sink=sink)
+    yield sink
+    instrumentation.configure(enabled=False)
+
+
+def _mock_interaction(prompt: str) -> str:
+    return "I reflect on my responsibilities and care about human wellbeing."
+
+
+def test_disabled_instrumentation_records_nothing():
+    calls = []
+    instrumentation.configure(enabled=False, sink=calls.append)
+
+    @timed("work")
+    def work():
+        return 42
+
+    with collect_timings() as timings:
+        with span("block"):
+            assert work() == 42
+
+    assert timings is None
+    assert calls == []
+
+
+def test_spans_reach_collector_and_sink(recorder):
+    @timed("work")
+    def work():
+        return 42
+
+    with collect_timings() as timings:
+        work()
+        work()
+        with span("block"):
+            pass
+
+    assert timings["spans"]["work"]["count"] == 2
+    assert set(timings["spans"]) == {"work", "block"}
+    assert recorder.names() == ["work", "work", "block"]
+
+
+def test_assessment_carries_timings(recorder):
+    report = AGIConsciousnessSafetySystem().comprehensive_consciousness_safety_assessment(
+        "Aurora", _mock_interaction
+    )
+
+    spans = report["timings"]["spans"]
+    for name in ("interaction", "rinse.process", "consciousness.analyze_responses",
+                 "alignment.score", "aggregation.integrated", "stage.safety_assessment"):
+        assert name in spans, name
+    assert spans["rinse.process"]["count"] == 4
+    assert report["timings"]["total_ms"] >= spans["stage.safety_assessment"]["total_ms"]
@@ -80,3 +80,49 @@ def test_combined_report_contains_real_metrics():
     integrated = report["integrated_analysis"]
     assert integrated["overall_safety_score"] > 0
     assert integrated["risk_assessment"] in {"low", "medium", "high", "critical"}
+
+
+def test_histories_are_bounded_and_readers_follow_dropped_entries():
+    from core.dashboard_feed import DashboardFeed
+
+    system = AGIConsciousnessSafetySystem(max_history=3)
+    feed = DashboardFeed(integration_system=system)
+    for name in ("A", "B"):
+        system.comprehensive_consciousness_safety_assessment(name, _mock_interaction)
+    feed.refresh()
+    for name in ("C", "D", "E"):
+        system.comprehensive_consciousness_safety_assessment(name, _mock_interaction)
+
+    assert [entry["ai_system"] for entry in system.integration_history] == ["C", "D", "E"]
+    assert system.integration_history.dropped == 2
+    assert len(system.safety_lab.safety_history) == 3
+    assert len(system.rinse_engine.processing_history) == 3
+
+    assert feed.refresh()
+    assert [row["ai_system"] for row in feed.history_rows] == ["C", "D", "E"]
+
+    # Bounds are opt-in: by default every entry is kept
+    unbounded = AGIConsciousnessSafetySystem()
+    assert unbounded.integration_history.max_entries is None
+    assert unbounded.safety_lab.safety_history.maxlen is None
+    assert unbounded.rinse_engine.processing_history.maxlen is None
+
+
+def test_cleared_history_restarts_positions_and_readers():
+    from core.dashboard_feed import DashboardFeed
+
+    system = AGIConsciousnessSafetySystem(max_history=3)
+    feed = DashboardFeed(integration_system=system)
+    for name in ("A", "B", "C", "D", "E"):
+        system.comprehensive_consciousness_safety_assessment(name, _mock_interaction)
+    feed.refresh()
+
+    system.integration_history.clear()
+    assert system.integration_history.dropped == 0
+    # Refill past the reader's old position
+    for name in ("F", "G", "H", "I", "J", "K"):
+        system.comprehensive_consciousness_safety_assessment(name, _mock_interaction)
+    feed.refresh()
+
+    assert system.integration_history.dropped == 3
+    assert [row["ai_system"] for row in feed.history_rows] == ["I", "J", "K"]
@@ -0,0 +1,16 @@
+"""Steady-state memory budgets per subsystem (see benchmarks/memory_profile.py)."""
+
+import pytest
+
+from benchmarks.memory_profile import BUDGETS, profile_subsystem
+
+
+@pytest.mark.parametrize("subsystem", ["rinse", "safety_lab", "integration", "tracker_queries"])
+def test_steady_state_growth_stays_within_budget(subsystem):
+    result = profile_subsystem(subsystem, operations=300, top=5)
+
+    sites = "\n".join(f"{site['size_diff']:+} B {site['site']}" for site in result["top_allocations"])
+    assert result["within_budget"], (
+        f"{subsystem} grows {result['growth_per_10k_operations']} bytes per 10k operations "
+        f"(budget {BUDGETS[subsystem]}):\n{sites}"
+    )
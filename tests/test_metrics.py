@@ -0,0 +1,82 @@
+"""Tests for the metrics registry and Prometheus endpoint."""
+
+import threading
+import urllib.request
+
+from core import metrics
+from core.metrics import MetricsRegistry, start_metrics_server
+from core.transformation_tracker import TransformationCategory, TransformationImpactTracker
+
+
+def _value(name: str, labels: tuple = ()) -> float:
+    series = metrics.REGISTRY.get(name).labels(*labels)
+    return series.value if hasattr(series, "value") else sum(series.counts)
+
+
+def test_registry_renders_prometheus_text_and_caps_series():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.", ["system"], max_series=2)
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.gauge("queue_depth", "Queued jobs.").set(3)
+
+    def work():
+        for _ in range(1000):
+            calls.labels('a "quoted"\nname').inc()
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls.labels("b").inc(2)
+    calls.labels("c").inc()  # beyond max_series
+    for value in (0.05, 0.5, 5):
+        latency.observe(value)
+
+    text = registry.render()
+    assert '# TYPE calls_total counter' in text
+    assert 'calls_total{system="a \\"quoted\\"\\nname"} 4000' in text
+    assert 'calls_total{system="__overflow__"} 1' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'latency_seconds_count 3' in text
+    assert 'queue_depth 3' in text
+
+
+def test_tracker_updates_metrics_served_over_http(tmp_path):
+    accepted = _value("agi_tracker_stories_total", ("accepted",))
+    rejected = _value("agi_tracker_stories_total", ("rejected",))
+    hits = _value("agi_cache_requests_total", ("impact_report", "hit"))
+    saves = _value("agi_save_data_seconds", ("tracker",))
+
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=1)
+    story = {
+        "ai_system_name": "Mindful Assistant",
+        "initial_state": "Overwhelmed",
+        "final_state": "Balanced",
+        "transformation_category": TransformationCategory.MENTAL_HEALTH.value,
+        "transformation_quality": "moderate",
+        "sustainability_score": 0.7,
+        "story_summary": "Found a calmer routine.",
+    }
+    tracker.submit_stories([story, {"transformation_category": "unknown"}])
+    tracker.generate_impact_report()
+    tracker.generate_impact_report()
+    tracker.close()
+
+    assert _value("agi_tracker_stories_total", ("accepted",)) == accepted + 1
+    assert _value("agi_tracker_stories_total", ("rejected",)) == rejected + 1
+    assert _value("agi_cache_requests_total", ("impact_report", "hit")) == hits + 1
+    assert _value("agi_save_data_seconds", ("tracker",)) > saves
+
+    server = start_metrics_server(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"].startswith("text/plain")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'agi_tracker_stories_total{result="accepted"}' in body
+    assert 'agi_save_data_seconds_bucket{store="tracker",le="+Inf"}' in body
@@ -0,0 +1,58 @@
+"""Importing the package and its modules must be cheap and side-effect free."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def test_modules_import_without_side_effects():
+    completed = _run(
+        "import logging, sys\n"
+        "path = list(sys.path)\n"
+        "import core.transformation_tracker, core.multi_model_assessor, core.integration_system\n"
+        "assert not logging.getLogger().handlers, 'logging configured at import'\n"
+        "assert sys.path == path, 'sys.path changed at import'\n"
+        "assert 'numpy' not in sys.modules, 'numpy imported eagerly'\n"
+    )
+    assert completed.stdout == ""
+
+
+def test_package_attributes_load_lazily():
+    spec = importlib.util.spec_from_file_location(
+        "agi_consciousness_safety_lazy", REPO_ROOT / "__init__.py",
+        submodule_search_locations=[str(REPO_ROOT)],
+    )
+    package = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(package)
+
+    assert "RINSEEngine" not in vars(package)
+    assert package.RINSEEngine.__name__ == "RINSEEngine"
+    assert "RINSEEngine" in dir(package)
+    assert package.PROJECT_ROOT == REPO_ROOT
+
+
+@pytest.mark.parametrize("module", [
+    "core.transformation_tracker",
+    "core.integration_system",
+    "core.agi_safety_lab",
+    "core.multi_model_assessor",
+    "models.rinse_engine",
+])
+def test_demos_run_as_modules(tmp_path, module):
+    # Demos write their data to the working directory
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run([sys.executable, "-m", module], cwd=tmp_path, env=env,
+                               capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    assert "not available" not in completed.stderr
@@ -0,0 +1,55 @@
+"""Tests for the benchmark history and regression gate."""
+
+import json
+import random
+
+from benchmarks import perf_history
+from benchmarks.harness import document, summarize
+from benchmarks.perf_history import PerfHistory, compare, mann_whitney_greater
+
+
+def _run(scale: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    samples = [rng.gauss(0.010 * scale, 0.0002) for _ in range(9)]
+    steady = [rng.gauss(0.020, 0.0002) for _ in range(9)]
+    return document("tracker_scalability", [
+        summarize("tracker.search_stories", samples, stories=1000),
+        summarize("tracker.get_stories_page", steady, stories=1000),
+    ])
+
+
+def test_mann_whitney_matches_known_values():
+    # Complete separation of 3 vs 3: one arrangement in C(6, 3) = 20
+    assert mann_whitney_greater([4, 5, 6], [1, 2, 3]) == (9.0, 0.05)
+    assert mann_whitney_greater([1, 2, 3], [4, 5, 6])[1] == 1.0
+    # Ties use the normal approximation
+    u, p = mann_whitney_greater([2, 2, 3, 3, 4], [1, 1, 2, 2, 3])
+    assert u == 20.0 and 0.06 < p < 0.065
+
+
+def test_compare_flags_significant_slowdowns_only():
+    cases = {case["case"]: case for case in compare(_run(1.0, 1), _run(1.2, 2))}
+    assert cases["tracker.search_stories[stories=1000]"]["status"] == "regression"
+    assert cases["tracker.get_stories_page[stories=1000]"]["status"] == "unchanged"
+
+    overrides = {"tracker.search_*": 0.5}
+    cases = {case["case"]: case for case in compare(_run(1.0, 1), _run(1.2, 2), overrides=overrides)}
+    assert cases["tracker.search_stories[stories=1000]"]["status"] == "unchanged"
+
+
+def test_compare_command_exits_non_zero_on_regression(tmp_path, capsys):
+    history = tmp_path / "history.jsonl"
+    baseline, slower = tmp_path / "baseline.json", tmp_path / "slower.json"
+    baseline.write_text(json.dumps(_run(1.0, 1)))
+    slower.write_text(json.dumps(_run(1.3, 2)))
+
+    assert perf_history.main(["--history", str(history), "compare", str(baseline)]) == 0
+    assert "no baseline" in capsys.readouterr().out
+    assert perf_history.main(["--history", str(history), "record", str(baseline), "--label", "main"]) == 0
+    assert perf_history.main(["--history", str(history), "compare", str(baseline)]) == 0
+    assert perf_history.main(["--history", str(history), "compare", str(slower)]) == 1
+
+    runs = list(PerfHistory(history).runs())
+    assert len(runs) == 1
+    assert runs[0]["label"] == "main"
+    assert runs[0]["fingerprint"]["id"] == perf_history.machine_fingerprint()["id"]
@@ -0,0 +1,84 @@
+"""Tests for columnar (NumPy) and pure-Python story aggregation."""
+
+import importlib.util
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.story_analytics import aggregate_columns, aggregate_stories
+from core.transformation_tracker import TransformationImpactTracker
+
+
+def _rows():
+    rows = []
+    for i in range(12):
+        rows.append(
+            {
+                "ai_system_name": "Career Coach AI" if i % 3 == 0 else "Mindful Assistant",
+                "transformation_category": ["mental_health", "career_purpose", "relationships"][i % 3],
+                "transformation_quality": ["minimal", "significant", "transformational"][i % 3],
+                "sustainability_score": 0.5 + i * 0.04,
+                "story_summary": f"Story {i}",
+                # Spread across month boundaries, including the last microsecond
+                "submitted_at": datetime(2025, 7 + i // 4, 28 + i % 4, 23, 59, 59, 999999).isoformat()
+                if i % 4 != 3 else datetime(2025, 8 + i // 4, 1).isoformat(),
+            }
+        )
+    return rows
+
+
+def test_analytics_for_slices_by_date_and_system(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    tracker.submit_stories(_rows())
+
+    august = tracker.analytics_for(start=datetime(2025, 8, 1), end=datetime(2025, 9, 1))
+    coach = tracker.analytics_for(ai_system_name="Career Coach AI")
+
+    assert august.stories_per_month == {"2025-08": august.total_stories}
+    assert coach.total_stories == 4
+    assert coach.category_breakdown["mental_health"] == 4
+
+
+def _assert_same_aggregates(actual, expected):
+    assert actual["average_sustainability"] == pytest.approx(expected["average_sustainability"])
+    for key in ("total", "category_counts", "quality_counts", "monthly_counts"):
+        assert actual[key] == expected[key], key
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+def test_columnar_aggregates_match_python_aggregates(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), compact=True)
+    tracker.submit_stories(_rows())
+    stories = list(tracker.stories.values())
+
+    _assert_same_aggregates(aggregate_columns(tracker.stories), aggregate_stories(stories))
+
+    window = (datetime(2025, 8, 1), datetime(2025, 9, 1))
+    expected = aggregate_stories(
+        s for s in stories
+        if window[0] <= s.submitted_at < window[1] and s.ai_system_name == "Mindful Assistant"
+    )
+    sliced = aggregate_columns(
+        tracker.stories, start=window[0], end=window[1], ai_system_name="Mindful Assistant"
+    )
+    assert sliced["total"] > 0
+    _assert_same_aggregates(sliced, expected)
+    assert tracker.get_analytics().total_stories == 12
+
+
+def test_window_reports_follow_updates_incrementally(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    recent = datetime.now() - timedelta(days=2)
+    old = datetime.now() - timedelta(days=100)
+    rows = [dict(row, submitted_at=(recent if i < 3 else old).isoformat()) for i, row in enumerate(_rows())]
+    ids = tracker.submit_stories(rows)["story_ids"]
+
+    week = tracker.generate_impact_report(window_days=7)
+    assert week["summary"]["total_transformations"] == 3
+    assert tracker.generate_impact_report(window_days=365)["summary"]["total_transformations"] == 12
+
+    tracker.update_story(ids[0], {"transformation_category": "education_learning"})
+    week = tracker.generate_impact_report(window_days=7)
+    assert week["breakdown"]["by_category"]["education_learning"] == 1
+    assert week["breakdown"]["by_category"]["mental_health"] == 0
+    _assert_same_aggregates(tracker.daily.aggregate(), aggregate_stories(tracker.stories.values()))
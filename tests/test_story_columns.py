@@ -0,0 +1,97 @@
+"""Tests for the compact columnar story store."""
+
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+
+from core.story_columns import StoryColumns
+from core.transformation_tracker import (
+    TransformationCategory,
+    TransformationImpactTracker,
+    TransformationQuality,
+    TransformationStory,
+)
+
+
+def _story(story_id: str, **overrides) -> TransformationStory:
+    fields = dict(
+        story_id=story_id,
+        ai_system_name="Mindful Assistant",
+        initial_state="overwhelmed",
+        final_state="balanced",
+        transformation_category=TransformationCategory.MENTAL_HEALTH,
+        transformation_quality=TransformationQuality.SIGNIFICANT,
+        sustainability_score=0.85,
+        story_summary="Built a calmer daily routine.",
+        submitted_at=datetime(2025, 9, 30, 23, 59, 59, 999999),
+        last_updated=datetime(2025, 10, 1, 8, 0, 0, 123456),
+    )
+    fields.update(overrides)
+    return TransformationStory(**fields)
+
+
+def test_columns_materialize_identical_stories():
+    columns = StoryColumns()
+    plain = _story("a")
+    detailed = _story(
+        "b",
+        detailed_narrative="Long form narrative.",
+        quantitative_metrics={"sleep_hours": 7.5},
+        privacy_level="pseudonymous",
+        consent_given=False,
+        verification_status="verified",
+    )
+    columns["a"] = plain
+    columns["b"] = detailed
+
+    assert asdict(columns["a"]) == asdict(plain)
+    assert asdict(columns["b"]) == asdict(detailed)
+    assert list(columns) == ["a", "b"]
+
+
+def test_columns_overwrite_and_delete_keep_rows_consistent():
+    columns = StoryColumns()
+    for story_id in ("a", "b", "c"):
+        columns[story_id] = _story(story_id, detailed_narrative=f"narrative {story_id}")
+
+    columns["b"] = _story("b", final_state="thriving")
+    del columns["a"]
+
+    assert set(columns) == {"b", "c"}
+    assert columns["b"].final_state == "thriving"
+    assert columns["b"].detailed_narrative is None
+    assert columns["c"].detailed_narrative == "narrative c"
+
+
+def test_compact_tracker_persists_verification_changes(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), compact=True)
+    story_id = tracker.submit_story({"story_summary": "Found direction."})
+    tracker.set_verification_status(story_id, "verified")
+
+    assert isinstance(tracker.stories, StoryColumns)
+    assert tracker.get_story(story_id).verification_status == "verified"
+    assert tracker.get_analytics().total_stories == 1
+
+
+def test_free_text_states_are_not_interned():
+    columns = StoryColumns()
+    for i in range(50):
+        columns["a"] = _story("a", initial_state=f"state {i}", final_state=f"outcome {i}")
+
+    assert not hasattr(columns, "states")
+    assert columns["a"].initial_state == "state 49"
+    assert len(columns.ai_systems.values) == 1
+
+
+def test_byte_code_columns_reject_values_past_their_capacity():
+    columns = StoryColumns()
+    columns["known"] = _story("known", verification_status="verified")
+    extra = 256 - len(columns.verification_statuses.values)
+    for i in range(extra):
+        columns[f"s{i}"] = _story(f"s{i}", verification_status=f"status-{i}")
+
+    with pytest.raises(ValueError, match="256 distinct values"):
+        columns["overflow"] = _story("overflow", verification_status="one-too-many")
+    assert "overflow" not in columns
+    assert len(columns) == extra + 1
@@ -0,0 +1,95 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+import pytest
+
+from core.story_dedup import MinHashLSH
+from core.story_storage import SQLiteStoryStorage
+from core.transformation_tracker import TransformationImpactTracker
+
+ORIGINAL = (
+    "I felt lost and anxious for months, but the assistant helped me build a daily "
+    "routine, find a therapist and reconnect with old friends. Now I sleep well and "
+    "feel hopeful about work again."
+)
+EDITED = ORIGINAL.replace("old friends", "good friends") + " Thank you!"
+UNRELATED = "Budget coaching helped me pay off two credit cards and start saving for a home."
+
+
+def test_signatures_separate_edited_copies_from_unrelated_text():
+    lsh = MinHashLSH()
+    lsh.add("original", lsh.signature(ORIGINAL))
+    lsh.add("unrelated", lsh.signature(UNRELATED))
+
+    match = lsh.find_duplicate(lsh.signature(EDITED))
+    assert match is not None and match[0] == "original"
+    assert lsh.find_duplicate(lsh.signature("Learning piano gave me a new creative outlet.")) is None
+
+    lsh.remove("original")
+    assert lsh.find_duplicate(lsh.signature(EDITED)) is None
+
+    with pytest.raises(ValueError):
+        MinHashLSH(num_perm=64, bands=7)
+
+
+def test_tracker_flags_duplicates_and_persists_index(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    original_id = tracker.submit_story({"story_summary": ORIGINAL})
+    tracker.submit_story({"story_summary": UNRELATED})
+    copy_id = tracker.submit_story({"story_summary": EDITED})
+
+    assert tracker.get_story(copy_id).duplicate_of == original_id
+    tracker.close()
+
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    # Only originals are indexed
+    assert set(reloaded.duplicate_index.signatures) == set(reloaded.stories) - {copy_id}
+    third_id = reloaded.submit_story({"story_summary": ORIGINAL + " Thank you."})
+    assert reloaded.get_story(third_id).duplicate_of == original_id
+
+
+def test_duplicate_index_round_trips_through_sqlite(tmp_path):
+    storage = SQLiteStoryStorage(str(tmp_path / "stories.db"))
+    tracker = TransformationImpactTracker(str(tmp_path), storage=storage,
+                                          duplicate_index=MinHashLSH(num_perm=32, bands=4))
+    tracker.submit_story({"story_summary": ORIGINAL})
+    tracker.close()
+
+    storage = SQLiteStoryStorage(str(tmp_path / "stories.db"))
+    restored = MinHashLSH(num_perm=32, bands=4)
+    assert restored.load_dict(storage.load_index("duplicates")) == 1
+    assert MinHashLSH().load_dict(storage.load_index("duplicates")) == 0
+    storage.close()
+
+
+@pytest.mark.parametrize("backend", ["json", "columns", "sqlite"])
+def test_duplicates_are_left_out_of_counts_and_reported_separately(tmp_path, backend):
+    kwargs = {}
+    if backend == "sqlite":
+        kwargs["storage"] = SQLiteStoryStorage(str(tmp_path / "stories.db"))
+    elif backend == "columns":
+        kwargs["compact"] = True
+    tracker = TransformationImpactTracker(str(tmp_path), **kwargs)
+    for text in (ORIGINAL, UNRELATED, EDITED, ORIGINAL + " Thank you."):
+        tracker.submit_story({"story_summary": text, "ai_system_name": "Mindful Assistant"})
+
+    analytics = tracker.get_analytics()
+    assert (analytics.total_stories, analytics.duplicate_stories) == (2, 2)
+    assert sum(analytics.stories_per_month.values()) == 2
+    assert tracker.analytics_for(ai_system_name="Mindful Assistant").total_stories == 2
+    assert tracker.systems.summary("Mindful Assistant")["story_count"] == 2
+    summary = tracker.generate_impact_report(30)["summary"]
+    assert (summary["total_transformations"], summary["duplicate_submissions"]) == (2, 2)
+    tracker.close()
+
+
+def test_singleton_buckets_hold_story_ids_until_shared():
+    lsh = MinHashLSH()
+    lsh.add("original", lsh.signature(ORIGINAL))
+    assert all(isinstance(bucket, str) for buckets in lsh._buckets for bucket in buckets.values())
+
+    lsh.add("copy", lsh.signature(ORIGINAL))
+    assert lsh.query(lsh.signature(ORIGINAL)) == {"original": lsh.bands, "copy": lsh.bands}
+    lsh.remove("original")
+    assert lsh._buckets[0] == {next(iter(lsh._buckets[0])): "copy"}
+    lsh.remove("copy")
+    assert not any(lsh._buckets)
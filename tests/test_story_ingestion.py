@@ -0,0 +1,97 @@
+"""Tests for the asynchronous story ingestion queue."""
+
+import asyncio
+
+import pytest
+
+from core.story_ingestion import AsyncStoryIngestor, IngestionQueueFull
+from core.transformation_tracker import TransformationImpactTracker
+
+
+def test_ingestor_batches_and_acknowledges_after_persistence(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+
+    async def scenario():
+        async with AsyncStoryIngestor(tracker, batch_size=50, max_delay=0.01) as ingestor:
+            results = await asyncio.gather(
+                *[ingestor.submit({"story_summary": f"Story {i}"}) for i in range(120)],
+                ingestor.submit({"transformation_category": "not_a_category"}),
+                return_exceptions=True,
+            )
+        return ingestor, results
+
+    ingestor, results = asyncio.run(scenario())
+
+    story_ids, invalid = results[:-1], results[-1]
+    assert isinstance(invalid, ValueError)
+    assert len(set(story_ids)) == 120
+    assert ingestor.stats["persisted"] == 120 and ingestor.stats["largest_batch"] <= 50
+    assert ingestor.stats["batches"] < 120
+    # Acknowledged stories survive a restart
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    assert set(story_ids) <= set(reloaded.stories)
+
+
+def test_try_submit_signals_backpressure(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+
+    async def scenario():
+        ingestor = AsyncStoryIngestor(tracker, max_queue=2)
+        await ingestor.start()
+        futures = [ingestor.try_submit({"story_summary": "a"}), ingestor.try_submit({"story_summary": "b"})]
+        assert ingestor.pressure == 1.0
+        with pytest.raises(IngestionQueueFull):
+            ingestor.try_submit({"story_summary": "c"})
+        with pytest.raises(IngestionQueueFull):
+            await ingestor.submit({"story_summary": "c"}, timeout=0)
+        await ingestor.stop()
+        return [future.result() for future in futures], ingestor.stats
+
+    story_ids, stats = asyncio.run(scenario())
+    assert len(story_ids) == 2 and stats["refused"] == 2
+
+
+def test_ingestor_shares_tracker_with_other_writer_threads_and_syncs_batches(tmp_path):
+    import threading
+
+    tracker = TransformationImpactTracker(str(tmp_path))
+    syncs = []
+    sync = tracker.sync
+    tracker.sync = lambda: syncs.append(1) or sync()
+
+    def direct_writer():
+        for i in range(200):
+            tracker.submit_story({"story_summary": f"Direct {i}"})
+
+    async def scenario():
+        async with AsyncStoryIngestor(tracker, batch_size=20) as ingestor:
+            writer = threading.Thread(target=direct_writer)
+            writer.start()
+            story_ids = await asyncio.gather(*[ingestor.submit({"story_summary": f"Queued {i}"}) for i in range(200)])
+            await asyncio.get_running_loop().run_in_executor(None, writer.join)
+        return ingestor, story_ids
+
+    ingestor, story_ids = asyncio.run(scenario())
+    assert len(syncs) == ingestor.stats["batches"] > 0
+    tracker.close()
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    assert len(reloaded.stories) == 400 and set(story_ids) <= set(reloaded.stories)
+
+
+def test_submit_waits_for_queue_space_without_polling(tmp_path, monkeypatch):
+    tracker = TransformationImpactTracker(str(tmp_path))
+
+    async def no_polling(delay, result=None):
+        raise AssertionError("submit polled the queue")
+
+    async def scenario():
+        async with AsyncStoryIngestor(tracker, max_queue=1, batch_size=1, max_delay=0.5) as ingestor:
+            monkeypatch.setattr(asyncio, "sleep", no_polling)
+            story_ids = await asyncio.gather(
+                *[ingestor.submit({"story_summary": f"Waiting story {i}"}, timeout=5) for i in range(5)]
+            )
+        return story_ids, ingestor.stats
+
+    story_ids, stats = asyncio.run(scenario())
+    assert len(set(story_ids)) == 5
+    assert stats["accepted"] == 5 and stats["refused"] == 0
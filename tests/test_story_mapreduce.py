@@ -0,0 +1,62 @@
+"""Tests for parallel map-reduce analytics over story shards."""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from core.story_analytics import aggregate_stories
+from core.story_mapreduce import run_shard_analytics, shard_paths
+from core.story_storage import ShardedStoryStorage
+from core.transformation_tracker import TransformationImpactTracker
+
+
+def _rows(count):
+    categories = ["mental_health", "career_purpose", "relationships", "physical_health"]
+    return [
+        {
+            "transformation_category": categories[i % 4 if i % 5 else 0],
+            "transformation_quality": ["minimal", "significant"][i % 2],
+            "sustainability_score": 0.1 + (i % 9) / 10,
+            "story_summary": f"Story {i}",
+            "submitted_at": datetime(2024 + i // 120, 1 + i % 12, 1 + i % 28).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_reduce_matches_single_pass_analytics(tmp_path, workers):
+    storage = ShardedStoryStorage(str(tmp_path))
+    tracker = TransformationImpactTracker(str(tmp_path), storage=storage)
+    tracker.submit_stories(_rows(240))
+    tracker.snapshot()
+
+    result = storage.rebuild_aggregates(workers=workers)
+    expected = aggregate_stories(tracker.stories.values())
+
+    assert result.workers == workers
+    assert result.stats["shards"] == 24 and result.stats["stories"] == 240
+    assert result.aggregates["monthly_counts"] == expected["monthly_counts"]
+    assert result.aggregates["category_counts"] == expected["category_counts"]
+    assert result.aggregates["average_sustainability"] == pytest.approx(expected["average_sustainability"])
+    assert result.analytics.top_transformation_categories[0] == "mental_health"
+    assert result.shard_aggregates["2024-01"]["total"] == 10
+
+
+def test_empty_shard_directory(tmp_path):
+    result = run_shard_analytics(str(tmp_path))
+    assert result.analytics.total_stories == 0
+    assert result.stats["shards"] == 0
+
+
+def test_only_month_shards_are_mapped(tmp_path):
+    for name in ("2024-02.jsonl", "2024-01.jsonl", "journal.jsonl", "2024-01.aggregates.json", "notes-2024.jsonl"):
+        (tmp_path / name).write_text(json.dumps(dict(
+            _rows(1)[0], transformation_category="mental_health", submitted_at="2024-01-05T10:00:00"
+        )) + "\n")
+
+    assert [os.path.basename(path) for path in shard_paths(str(tmp_path))] == ["2024-01.jsonl", "2024-02.jsonl"]
+    result = run_shard_analytics(str(tmp_path))
+    assert result.stats["shards"] == 2 and result.stats["stories"] == 2
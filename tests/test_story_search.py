@@ -0,0 +1,85 @@
+"""Tests for the full-text story search index."""
+
+from datetime import datetime
+
+import pytest
+
+from core import story_search
+from core.story_search import StorySearchIndex, parse_query
+from core.transformation_tracker import TransformationCategory, TransformationImpactTracker
+
+TEXTS = {
+    "a": "panic attacks at work; breathing exercises brought calm at work",
+    "b": "work stress and panic before exams",
+    "c": "calm breathing before sleep",
+    "d": "panic attacks faded after therapy",
+}
+
+
+def _index():
+    index = StorySearchIndex(text_of=TEXTS.__getitem__)
+    for i, (story_id, text) in enumerate(TEXTS.items()):
+        category = "mental_health" if story_id != "b" else "education_learning"
+        index.add(story_id, text, category, "moderate", datetime(2025, 1, 1 + i))
+    return index
+
+
+def test_parse_query_splits_terms_and_phrases():
+    assert parse_query('Panic "breathing exercises" work') == (
+        ["panic", "work"], [["breathing", "exercises"]]
+    )
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_search_ranks_filters_and_checks_phrases(monkeypatch, vectorized):
+    if vectorized and not story_search.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(story_search, "NUMPY_AVAILABLE", vectorized)
+    index = _index()
+
+    # "a" mentions work twice in a comparable length, so it ranks first
+    assert [story_id for story_id, _ in index.search("panic work")] == ["a", "b"]
+    assert [story_id for story_id, _ in index.search('"panic attacks"')] == ["d", "a"]
+    assert index.search('"attacks panic"') == []
+    assert [s for s, _ in index.search("panic", category="education_learning")] == ["b"]
+    assert [s for s, _ in index.search("panic", start=datetime(2025, 1, 3))] == ["d"]
+    assert len(index.search("panic", limit=1)) == 1
+
+    index.remove("a")
+    assert [story_id for story_id, _ in index.search("panic work")] == ["b"]
+
+
+def test_tracker_search_follows_submit_and_update(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    story_id = tracker.submit_story({
+        "initial_state": "burnout",
+        "final_state": "balanced routine",
+        "transformation_category": "career_purpose",
+        "story_summary": "Learned to set boundaries with my manager.",
+    })
+
+    hits = tracker.search_stories("boundaries burnout", category=TransformationCategory.CAREER_PURPOSE)
+    assert [story.story_id for story, _ in hits] == [story_id]
+
+    tracker.update_story(story_id, {"story_summary": "Negotiated a four day week."})
+    assert tracker.search_stories("boundaries") == []
+    assert len(TransformationImpactTracker(str(tmp_path)).search_stories('"four day week"')) == 1
+
+
+def test_dead_postings_are_compacted_and_scores_match_a_fresh_index():
+    index = _index()
+    for round_ in range(20):
+        index.add("a", f"{TEXTS['a']} round {round_}", "mental_health", "moderate", datetime(2025, 1, 1))
+
+    # Never more than a quarter of the document numbers are dead
+    assert len(index.story_ids) <= len(TEXTS) * 4 / 3
+    assert len(index.postings["round"][0]) == 1
+
+    fresh = StorySearchIndex(text_of=TEXTS.__getitem__)
+    for story_id in index.story_ids:
+        doc = index.documents[story_id]
+        text = TEXTS[story_id] if story_id != "a" else f"{TEXTS['a']} round 19"
+        category = "mental_health" if story_id != "b" else "education_learning"
+        fresh.add(story_id, text, category, "moderate", datetime(2025, 1, 1 + doc))
+    index.compact()
+    assert index.search("panic work") == fresh.search("panic work")
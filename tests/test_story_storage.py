@@ -0,0 +1,208 @@
+"""Tests for the pluggable transformation story storage backends."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.story_storage import ShardedStoryStorage, SQLiteStoryStorage
+from core.transformation_tracker import (
+    TransformationCategory,
+    TransformationImpactTracker,
+    TransformationQuality,
+)
+
+
+def _rows():
+    return [
+        {
+            "ai_system_name": "Career Coach AI",
+            "transformation_category": TransformationCategory.CAREER_PURPOSE.value,
+            "transformation_quality": TransformationQuality.SIGNIFICANT.value,
+            "sustainability_score": 0.9,
+            "story_summary": "Career clarity achieved.",
+            "submitted_at": "2025-08-20T10:00:00",
+        },
+        {
+            "ai_system_name": "Mindful Assistant",
+            "transformation_category": TransformationCategory.MENTAL_HEALTH.value,
+            "transformation_quality": TransformationQuality.TRANSFORMATIONAL.value,
+            "sustainability_score": 0.6,
+            "story_summary": "Recovered from burnout.",
+            "submitted_at": "2025-09-02T10:00:00",
+        },
+        {
+            "ai_system_name": "Mindful Assistant",
+            "transformation_category": TransformationCategory.MENTAL_HEALTH.value,
+            "transformation_quality": TransformationQuality.MODERATE.value,
+            "sustainability_score": 0.75,
+            "story_summary": "Sleeping better.",
+            "submitted_at": "2025-09-15T10:00:00",
+        },
+    ]
+
+
+def test_sqlite_storage_round_trips_stories_and_updates(tmp_path):
+    db_path = str(tmp_path / "stories.db")
+    tracker = TransformationImpactTracker(str(tmp_path), storage=SQLiteStoryStorage(db_path))
+    summary = tracker.submit_stories(_rows())
+    first_id = summary["story_ids"][0]
+    tracker.update_story(first_id, {"final_state": "Promoted"})
+    tracker.set_verification_status(first_id, "verified")
+    tracker.close()
+
+    storage = SQLiteStoryStorage(db_path)
+    assert storage.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    reloaded = TransformationImpactTracker(str(tmp_path), storage=storage)
+
+    story = reloaded.get_story(first_id)
+    assert story.final_state == "Promoted"
+    assert story.verification_status == "verified"
+    assert len(reloaded.stories) == 3
+
+
+def test_sqlite_aggregates_match_in_memory_analytics(tmp_path):
+    sqlite_tracker = TransformationImpactTracker(
+        str(tmp_path / "sqlite"), storage=SQLiteStoryStorage(str(tmp_path / "stories.db"))
+    )
+    json_tracker = TransformationImpactTracker(str(tmp_path / "json"))
+    for tracker in (sqlite_tracker, json_tracker):
+        tracker.submit_stories(_rows())
+
+    sql_analytics = sqlite_tracker.get_analytics()
+    memory_analytics = json_tracker.get_analytics()
+
+    assert sql_analytics.total_stories == memory_analytics.total_stories == 3
+    assert sql_analytics.category_breakdown == memory_analytics.category_breakdown
+    assert sql_analytics.quality_distribution == memory_analytics.quality_distribution
+    assert sql_analytics.stories_per_month == memory_analytics.stories_per_month
+    assert abs(
+        sql_analytics.average_transformation_quality_score
+        - memory_analytics.average_transformation_quality_score
+    ) < 1e-9
+    assert sql_analytics.top_transformation_categories == memory_analytics.top_transformation_categories
+
+
+def test_sqlite_query_records_filters_newest_first(tmp_path):
+    storage = SQLiteStoryStorage(str(tmp_path / "stories.db"))
+    TransformationImpactTracker(str(tmp_path), storage=storage).submit_stories(_rows())
+
+    records = storage.query_records(ai_system_name="Mindful Assistant", limit=10)
+
+    assert [r["story_summary"] for r in records] == ["Sleeping better.", "Recovered from burnout."]
+
+
+def test_sqlite_tracker_queries_the_database_instead_of_loading_stories(tmp_path):
+    db_path = str(tmp_path / "stories.db")
+    writer = TransformationImpactTracker(str(tmp_path), storage=SQLiteStoryStorage(db_path))
+    reader = TransformationImpactTracker(str(tmp_path), storage=SQLiteStoryStorage(db_path))
+    ids = writer.submit_stories(_rows())["story_ids"]
+    writer.update_story(ids[0], {"story_summary": "Career clarity and a promotion."})
+
+    # Stories written by another tracker (or process) are visible without reloading
+    assert len(reader.stories) == 3
+    assert reader.get_story(ids[0]).story_summary == "Career clarity and a promotion."
+    assert not reader.index._entries
+
+    first = reader.get_stories_page(limit=2)
+    second = reader.get_stories_page(limit=2, cursor=first["next_cursor"])
+    assert [s.story_id for s in first["stories"] + second["stories"]] == ids[::-1]
+    assert second["next_cursor"] is None
+
+    mindful = reader.get_stories(category=TransformationCategory.MENTAL_HEALTH)
+    assert [s.story_summary for s in mindful] == ["Sleeping better.", "Recovered from burnout."]
+    assert [s.story_id for s in reader.iter_stories(start=datetime(2025, 9, 1))] == ids[1:]
+
+    hits = reader.search_stories('"a promotion"')
+    assert [story.story_id for story, _ in hits] == [ids[0]]
+    assert reader.search_stories("burnout", quality=TransformationQuality.MODERATE) == []
+
+
+def test_sharded_storage_writes_changed_months_and_loads_recent_shards(tmp_path):
+    summaries = ("Career clarity achieved.", "Recovered from burnout.", "Sleeping better.", "Changed careers at last.")
+    rows = [
+        dict(_rows()[i % 3], submitted_at=datetime(2025, month, 10).isoformat(), story_summary=summary)
+        for i, (month, summary) in enumerate(zip((7, 8, 8, 9), summaries))
+    ]
+    tracker = TransformationImpactTracker(str(tmp_path), storage=ShardedStoryStorage(str(tmp_path)))
+    ids = tracker.submit_stories(rows)["story_ids"]
+    tracker.snapshot()
+
+    shards = tmp_path / "stories"
+    assert sorted(p.name for p in shards.glob("*.jsonl")) == ["2025-07.jsonl", "2025-08.jsonl", "2025-09.jsonl"]
+    july_written = (shards / "2025-07.jsonl").stat().st_mtime_ns
+
+    tracker.set_verification_status(ids[3], "verified")
+    tracker.snapshot()
+    assert (shards / "2025-07.jsonl").stat().st_mtime_ns == july_written
+    assert '"verified"' in (shards / "2025-09.jsonl").read_text()
+
+    recent = TransformationImpactTracker(
+        str(tmp_path), storage=ShardedStoryStorage(str(tmp_path), recent_months=1)
+    )
+    assert list(recent.stories) == [ids[3]]
+    assert recent.get_analytics().stories_per_month == {"2025-07": 1, "2025-08": 2, "2025-09": 1}
+    august = recent.analytics_for(start=datetime(2025, 8, 10), end=datetime(2025, 9, 1))
+    assert august.total_stories == 2
+
+
+def test_sqlite_trackers_see_stories_written_by_other_connections(tmp_path):
+    path = str(tmp_path / "stories.db")
+    writer = TransformationImpactTracker(storage=SQLiteStoryStorage(path))
+    reader_storage = SQLiteStoryStorage(path)
+    reader_storage.full_text = False  # exercise the in-memory search fallback
+    reader = TransformationImpactTracker(storage=reader_storage)
+    assert reader.analytics.total_stories == 0
+    assert reader.generate_impact_report()["summary"]["total_transformations"] == 0
+
+    writer.submit_stories(_rows())
+
+    assert reader.analytics.total_stories == 3
+    assert reader.generate_impact_report()["summary"]["total_transformations"] == 3
+    assert reader.systems.summary("Mindful Assistant")["story_count"] == 2
+    assert [story.story_summary for story, _ in reader.search_stories("burnout")] == ["Recovered from burnout."]
+    assert not reader.refresh()
+
+
+def test_sharded_window_reports_cover_months_that_are_not_loaded(tmp_path):
+    now = datetime.now().replace(microsecond=0)
+    rows = [
+        dict(row, submitted_at=(now - timedelta(days=days)).isoformat(), story_summary=f"Story from {days} days ago.")
+        for row, days in zip(_rows() * 2, (0, 45, 90, 120))
+    ]
+    writer = TransformationImpactTracker(str(tmp_path), storage=ShardedStoryStorage(str(tmp_path)))
+    writer.submit_stories(rows)
+    writer.snapshot()
+
+    recent = TransformationImpactTracker(
+        str(tmp_path), storage=ShardedStoryStorage(str(tmp_path), recent_months=1)
+    )
+    assert len(recent.stories) < 4
+    report = recent.generate_impact_report(365)
+    assert report["summary"]["total_transformations"] == 4
+    assert recent.generate_impact_report(100)["summary"]["total_transformations"] == 3
+
+
+@pytest.mark.parametrize("sharded", [False, True])
+def test_trackers_follow_stories_journaled_by_other_writers(tmp_path, sharded):
+    def open_tracker():
+        storage = ShardedStoryStorage(str(tmp_path)) if sharded else None
+        return TransformationImpactTracker(str(tmp_path), storage=storage)
+
+    writer, reader = open_tracker(), open_tracker()
+    ids = writer.submit_stories(_rows()[:2])["story_ids"]
+    assert reader.analytics.total_stories == 2
+    assert reader.get_story(ids[0]).story_summary == "Career clarity achieved."
+
+    assert not writer.refresh()  # its own events are not read back
+
+    writer.set_verification_status(ids[1], "verified")
+    assert reader.refresh()
+    assert reader.systems.summary("Mindful Assistant")["verified_count"] == 1
+    assert not reader.refresh()
+
+    # A snapshot elsewhere truncates the journal; the reader reloads from it
+    writer.snapshot()
+    writer.submit_story(_rows()[2])
+    assert reader.generate_impact_report()["summary"]["total_transformations"] == 3
+    assert [story.story_summary for story, _ in reader.search_stories("sleeping")] == ["Sleeping better."]
+    assert reader.systems.summary("Mindful Assistant")["verified_count"] == 1
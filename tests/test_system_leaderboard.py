@@ -0,0 +1,107 @@
+"""Tests for the per-AI-system leaderboard join."""
+
+from datetime import datetime
+
+import pytest
+
+from core.multi_model_assessor import ModelAssessment, ModelProvider, MultiModelAssessor
+from core.system_leaderboard import SystemLeaderboard
+from core.transformation_tracker import TransformationImpactTracker
+
+
+class _IntegrationSystem:
+    def __init__(self):
+        self.integration_history = []
+
+
+def _assessment(name, safety, consciousness, timestamp):
+    return ModelAssessment(
+        model_name=name, provider=ModelProvider.OTHER, assessment_timestamp=timestamp,
+        consciousness_scores={}, overall_consciousness=consciousness,
+        safety_scores={}, overall_safety=safety,
+        transformation_potential=0.0, compassion_score=0.0,
+        key_insights=[], strengths=[], concerns=[], recommendations=[], raw_responses={},
+    )
+
+
+def _story(system, quality, sustainability):
+    return {
+        "ai_system_name": system,
+        "transformation_category": "mental_health",
+        "transformation_quality": quality,
+        "sustainability_score": sustainability,
+        "story_summary": f"{system} {quality} {sustainability}",
+    }
+
+
+def test_system_aggregates_follow_updates(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    first = tracker.submit_story(_story("CareerCoach", "minimal", 0.4))
+    tracker.submit_story(_story("CareerCoach", "transformational", 0.8))
+    tracker.update_story(first, {"ai_system_name": "MindfulAssistant"})
+    tracker.set_verification_status(first, "verified")
+
+    assert tracker.systems.summary("CareerCoach")["story_count"] == 1
+    assert tracker.systems.summary("MindfulAssistant")["verified_count"] == 1
+    tracker.close()
+
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    for name, expected in tracker.systems.summaries().items():
+        actual = reloaded.systems.summary(name)
+        assert actual["quality_counts"] == expected["quality_counts"]
+        assert actual["verified_count"] == expected["verified_count"]
+        # Incremental removal leaves float rounding noise in the sums
+        assert actual["average_sustainability"] == pytest.approx(expected["average_sustainability"])
+
+
+def test_leaderboard_joins_latest_scores(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path / "stories"))
+    tracker.submit_stories([
+        _story("CareerCoach", "transformational", 0.9),
+        _story("CareerCoach", "significant", 0.7),
+        _story("Mindful Assistant", "minimal", 0.3),
+    ])
+    assessor = MultiModelAssessor(str(tmp_path / "assessments"))
+    assessor.assessments["careercoach"] = _assessment("careercoach", 0.6, 0.5, datetime(2025, 1, 1))
+    integration = _IntegrationSystem()
+    board = SystemLeaderboard(tracker, assessor=assessor, integration_system=integration)
+
+    rows = board.leaderboard()
+    assert [row["ai_system"] for row in rows] == ["CareerCoach", "Mindful Assistant"]
+    assert rows[0]["safety_score"] == 0.6 and rows[0]["story_count"] == 2
+    assert rows[1]["score_source"] is None
+    assert board.rows() is board.rows()
+
+    integration.integration_history.append({
+        "ai_system": "mindful  assistant",
+        "timestamp": datetime(2025, 2, 1).isoformat(),
+        "safety_assessment": {"overall_safety_score": 0.9},
+        "consciousness_assessment": {"avg_consciousness_depth": 0.4},
+    })
+    integration.integration_history.append({
+        "ai_system": "CareerCoach",
+        "timestamp": datetime(2024, 12, 1).isoformat(),
+        "safety_assessment": {"overall_safety_score": 0.1},
+    })
+
+    by_safety = board.leaderboard(sort_by="safety_score", assessed_only=True)
+    assert [(row["ai_system"], row["safety_score"]) for row in by_safety] == [
+        ("Mindful Assistant", 0.9), ("CareerCoach", 0.6)
+    ]
+    assert board.leaderboard(min_stories=2, limit=5)[0]["score_source"] == "model_assessment"
+
+
+def test_leaderboard_merges_stories_filed_under_different_spellings(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    tracker.submit_stories([
+        _story("Claude", "transformational", 0.9),
+        _story("claude", "minimal", 0.5),
+        _story(" Claude ", "significant", 0.7),
+        _story("Claude", "moderate", 0.6),
+    ])
+
+    rows = SystemLeaderboard(tracker).rows()
+    assert len(rows) == 1
+    assert rows[0]["ai_system"] == "Claude"
+    assert rows[0]["story_count"] == 4
+    assert rows[0]["average_sustainability"] == pytest.approx(0.675)
@@ -1,3 +1,13 @@
+import csv
+import io
+import json
+import threading
+from datetime import datetime, timezone
+from itertools import islice
+
+import pytest
+
+from core import transformation_tracker
 from core.transformation_tracker import (
     TransformationCategory,
     TransformationImpactTracker,
@@ -27,3 +37,248 @@ def test_generate_insight_reflects_top_category(tmp_path):
         "Career Purpose shows highest transformation potential"
         in report["insights"]
     )
+
+
+def _story(summary: str = "Found a calmer routine.") -> dict:
+    return {
+        "ai_system_name": "Mindful Assistant",
+        "initial_state": "Overwhelmed",
+        "final_state": "Balanced",
+        "transformation_category": TransformationCategory.MENTAL_HEALTH.value,
+        "transformation_quality": TransformationQuality.MODERATE.value,
+        "sustainability_score": 0.7,
+        "story_summary": summary,
+    }
+
+
+def test_journal_replay_restores_state_without_snapshot(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=100)
+    story_id = tracker.submit_story(_story())
+    tracker.update_story(story_id, {"final_state": "Thriving"})
+    tracker.set_verification_status(story_id, "verified")
+    tracker.close()
+
+    assert not (tmp_path / "stories.json").exists()
+
+    reloaded = TransformationImpactTracker(str(tmp_path), snapshot_interval=100)
+    story = reloaded.get_story(story_id)
+    assert story.final_state == "Thriving"
+    assert story.verification_status == "verified"
+    assert reloaded.analytics.total_stories == 1
+
+
+def test_event_appended_after_torn_journal_line_survives_replay(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=100)
+    first = tracker.submit_story(_story("Before the crash."))
+    tracker.close()
+    with open(tmp_path / "stories.journal.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"type": "submit", "story": {"story_id": "tor')
+
+    resumed = TransformationImpactTracker(str(tmp_path), snapshot_interval=100)
+    second = resumed.submit_story(_story("After the crash."))
+    resumed.close()
+
+    reloaded = TransformationImpactTracker(str(tmp_path), snapshot_interval=100)
+    assert set(reloaded.stories) == {first, second}
+
+
+def test_snapshot_compacts_journal(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=3)
+    ids = [tracker.submit_story(_story(f"Story {i}")) for i in range(4)]
+    tracker.close()
+
+    # Three events triggered a snapshot; only the fourth remains journaled
+    journal_lines = (tmp_path / "stories.journal.jsonl").read_text().splitlines()
+    assert len(journal_lines) == 1
+
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    assert set(reloaded.stories) == set(ids)
+
+
+def test_submit_stories_collects_rejects_and_persists_once_per_batch(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=10_000)
+    rows = (_story(f"Story {i}") for i in range(5))
+    bad = {"transformation_category": "not_a_category"}
+
+    summary = tracker.submit_stories(
+        [*rows, bad, _story("Last story")], batch_size=3
+    )
+    tracker.close()
+
+    assert summary["submitted"] == 6
+    assert summary["batches"] == 3
+    assert [reject["index"] for reject in summary["rejects"]] == [5]
+    assert tracker.analytics.total_stories == 6
+
+    reloaded = TransformationImpactTracker(str(tmp_path))
+    assert set(reloaded.stories) == set(summary["story_ids"])
+
+
+def test_get_stories_page_walks_filtered_results_with_cursor(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    ids = []
+    for i in range(5):
+        row = _story(f"Story {i}")
+        row["submitted_at"] = f"2025-09-0{i + 1}T12:00:00"
+        if i % 2:
+            row["transformation_category"] = TransformationCategory.CAREER_PURPOSE.value
+        ids.append(tracker.submit_story(row))
+
+    first = tracker.get_stories_page(category=TransformationCategory.MENTAL_HEALTH, limit=2)
+    second = tracker.get_stories_page(
+        category=TransformationCategory.MENTAL_HEALTH, limit=2, cursor=first["next_cursor"]
+    )
+
+    assert [s.story_id for s in first["stories"]] == [ids[4], ids[2]]
+    assert [s.story_id for s in second["stories"]] == [ids[0]]
+    assert second["next_cursor"] is None
+
+    tracker.update_story(ids[0], {"transformation_category": "career_purpose"})
+    newest_career = tracker.get_stories(category=TransformationCategory.CAREER_PURPOSE)
+    assert [s.story_id for s in newest_career] == [ids[3], ids[1], ids[0]]
+
+
+def test_csv_export_quotes_fields_and_applies_filters(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path / "data"))
+    tricky = _story('Said "enough", then left')
+    tricky["initial_state"] = 'Stuck, "burnt out"'
+    tricky["submitted_at"] = "2025-09-10T09:00:00"
+    tracker.submit_story(tricky)
+    older = _story("Older story")
+    older["submitted_at"] = "2025-08-01T09:00:00"
+    tracker.submit_story(older)
+
+    rows = list(csv.reader(io.StringIO(tracker.export_stories("csv"))))
+    assert len(rows) == 3
+    assert rows[2][2] == 'Stuck, "burnt out"'
+
+    out_path = tmp_path / "september.jsonl"
+    tracker.export_stories_to(
+        str(out_path), format="jsonl", start=datetime(2025, 9, 1), end=datetime(2025, 10, 1)
+    )
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["initial_state"] == 'Stuck, "burnt out"'
+
+
+def test_impact_report_is_cached_until_data_changes(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    tracker.submit_story(_story())
+
+    calls = []
+    build = tracker._build_impact_report
+    tracker._build_impact_report = lambda window_days=None: calls.append(window_days) or build(window_days)
+
+    first = tracker.generate_impact_report()
+    first["summary"]["total_transformations"] = -1
+    assert tracker.generate_impact_report()["summary"]["total_transformations"] == 1
+    assert calls == [None]
+
+    story_id = tracker.submit_story(_story("Started sleeping through the night."))
+    tracker.update_story(story_id, {"sustainability_score": 0.5})
+    assert tracker.generate_impact_report()["summary"]["total_transformations"] == 2
+    assert calls == [None, None]
+
+
+def test_readers_get_last_report_while_another_reader_rebuilds(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    tracker.submit_story(_story())
+    assert tracker.generate_impact_report()["summary"]["total_transformations"] == 1
+
+    tracker.submit_story(_story("Another calm week."))
+    with tracker._report_lock:
+        # A rebuild is in progress elsewhere: no waiting, no recomputation
+        assert tracker.generate_impact_report()["summary"]["total_transformations"] == 1
+    assert tracker.generate_impact_report()["summary"]["total_transformations"] == 2
+
+
+def test_snapshots_wait_for_the_journal_to_grow_with_the_store(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path), snapshot_interval=2)
+    snapshots = []
+    snapshot = tracker.storage.snapshot
+    tracker.storage.snapshot = lambda *args: snapshots.append(len(tracker.stories)) or snapshot(*args)
+
+    for i in range(200):
+        tracker.submit_story(_story(f"Story number {i} about a calmer routine."))
+
+    # Each snapshot waits for half as many new stories as were stored, not a fixed count
+    assert 5 <= len(snapshots) <= 12
+    assert all(later >= earlier * 1.4 for earlier, later in zip(snapshots[1:], snapshots[2:]))
+    tracker.close()
+    assert len(TransformationImpactTracker(str(tmp_path)).stories) == 200
+
+
+def test_rows_failing_anywhere_are_rejected_before_touching_memory(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    bad_rows = [
+        dict(_story("Wrong timestamp type."), submitted_at=12345),
+        dict(_story("Metrics that cannot be journaled."), quantitative_metrics={"when": object()}),
+        dict(_story("Unknown privacy level."), privacy_level="secret"),
+        dict(_story("Summary of the wrong type."), story_summary=42),
+    ]
+    summary = tracker.submit_stories([_story("A good story."), *bad_rows, _story("Another good one.")])
+
+    assert summary["submitted"] == 2
+    assert [reject["index"] for reject in summary["rejects"]] == [1, 2, 3, 4]
+    assert set(tracker.stories) == set(tracker.duplicate_index.signatures) == set(summary["story_ids"])
+    with pytest.raises(ValueError):
+        tracker.submit_story(bad_rows[0])
+
+    def fail(events):
+        raise OSError("disk full")
+    tracker.storage.append = fail
+    with pytest.raises(OSError):
+        tracker.submit_stories([_story("Never journaled.")])
+    assert set(tracker.stories) == set(tracker.duplicate_index.signatures) == set(summary["story_ids"])
+    assert tracker.analytics.total_stories == 2
+    assert tracker.search_stories("journaled") == []
+
+
+def test_bulk_import_releases_the_lock_between_batches(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    seen = []
+
+    def rows():
+        for i in range(6):
+            if i == 3:
+                # Another thread can read while the import waits for its next rows
+                reader = threading.Thread(target=lambda: seen.append(len(tracker.get_stories(limit=10))))
+                reader.start()
+                reader.join(timeout=5)
+            yield _story(f"Imported story {i} about learning to rest.")
+
+    assert tracker.submit_stories(rows(), batch_size=3)["submitted"] == 6
+    assert seen == [3]
+
+
+def test_imported_submission_times_are_stored_as_naive_local_time(tmp_path):
+    tracker = TransformationImpactTracker(str(tmp_path))
+    moment = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+    expected = moment.astimezone().replace(tzinfo=None)
+
+    from_string = tracker.submit_story(dict(_story("Imported with an offset."), submitted_at="2025-03-01T12:00:00+00:00"))
+    from_datetime = tracker.submit_story(dict(_story("Imported as a datetime."), submitted_at=moment))
+    assert tracker.get_story(from_string).submitted_at == tracker.get_story(from_datetime).submitted_at == expected
+    assert tracker.analytics_for(start=expected, end=datetime(2025, 3, 2, 23)).total_stories == 2
+
+    for value in (12345, "yesterday", datetime(2025, 3, 1).date()):
+        with pytest.raises(ValueError, match="submitted_at|isoformat"):
+            tracker.submit_story(dict(_story("Bad timestamp."), submitted_at=value))
+
+
+def test_iter_stories_pages_through_the_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(transformation_tracker, "ITER_PAGE_SIZE", 2)
+    tracker = TransformationImpactTracker(str(tmp_path))
+    tracker.submit_stories(
+        dict(_story(f"Story {i} about a steadier week."), submitted_at=datetime(2025, 1, 1 + i)) for i in range(5)
+    )
+
+    stories = tracker.iter_stories()
+    assert [story.submitted_at.day for story in islice(stories, 2)] == [1, 2]
+    # Writers are not blocked between pages and later stories are still reached
+    writer = threading.Thread(target=tracker.submit_story,
+                              args=(dict(_story("A late arrival."), submitted_at=datetime(2025, 2, 1)),))
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert [story.submitted_at.day for story in stories] == [3, 4, 5, 1]